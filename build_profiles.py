@@ -1,74 +1,64 @@
 import argparse
-import json
 import os
 import sqlite3
 from pathlib import Path
-from sentinel.models.record import MessageRecord, CallRecord, IntentResult
-from sentinel.aggregators.contact_aggregator import build_contact_profiles
+from sentinel import json_codec
+from sentinel.aggregators.sql_aggregator import build_contact_profiles_from_sql
+from sentinel.exporters.sqlite_exporter import UPSERT_CONTACT_PROFILE_SQL
 
-parser = argparse.ArgumentParser()
-parser.add_argument("--db", default=os.environ.get("SENTINEL_DB", r"G:\My Drive\mINd-SENTinel\test-output.db"))
-args = parser.parse_args()
-DB = Path(args.db)
 
-conn = sqlite3.connect(str(DB))
-conn.row_factory = sqlite3.Row
+def build(db_path: Path, batch_size: int = 10000, jobs: int = 1) -> int:
+    """
+    Rebuild contact_profiles in the sentinel DB at db_path.
+    Importable — run_sentinel.py --profiles calls this in-process.
+    Returns the number of profiles written.
+    """
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=-65536")
 
-msgs = [MessageRecord(
-    timestamp_ms=r["timestamp_ms"], date_str=r["date_str"],
-    direction=r["direction"], contact_name=r["contact_name"],
-    phone_number=r["phone_number"], msg_type=r["msg_type"],
-    body=r["body"], read=bool(r["read"]), source_file=r["source_file"]
-) for r in conn.execute("SELECT * FROM messages").fetchall()]
+    try:
+        profiles = build_contact_profiles_from_sql(
+            conn, batch_size=batch_size, jobs=jobs,
+        )
+        msg_count    = sum(p.total_messages for p in profiles)
+        call_count   = sum(p.total_calls for p in profiles)
+        intent_count = sum(p.total_flags for p in profiles)
 
-calls = [CallRecord(
-    timestamp_ms=r["timestamp_ms"], date_str=r["date_str"],
-    call_type=r["call_type"], contact_name=r["contact_name"],
-    phone_number=r["phone_number"], duration_sec=r["duration_sec"],
-    duration_fmt=r["duration_fmt"], source_file=r["source_file"]
-) for r in conn.execute("SELECT * FROM calls").fetchall()]
+        print(f"Loaded: {msg_count} msgs, {call_count} calls, {intent_count} intents")
+        print(f"Profiles built: {len(profiles)}")
+        for p in profiles:
+            print(p.risk_label, round(p.risk_score, 1), p.contact_name)
 
-intents = [IntentResult(
-    record_id=r["id"] if "id" in r.keys() else None,
-    timestamp_ms=r["message_ts_ms"], date_str=r["date_str"],
-    direction=r["direction"], contact_name=r["contact_name"],
-    phone_number=r["phone_number"], msg_type=r["msg_type"],
-    body=r["body"], source_file=r["source_file"],
-    kw_categories=json.loads(r["kw_categories"] or "[]"),
-    kw_severity=r["kw_severity"], confirmed=bool(r["confirmed"]),
-    ai_categories=json.loads(r["ai_categories"] or "[]"),
-    ai_severity=r["ai_severity"], flagged_quote=r["flagged_quote"],
-    context_summary=r["context_summary"],
-    context_before=json.loads(r["context_before"] or "[]"),
-    context_after=json.loads(r["context_after"] or "[]"),
-    llm_model=r["llm_model"], detection_mode=r["detection_mode"]
-) for r in conn.execute("SELECT * FROM intent_results").fetchall()]
+        # Write profiles directly — bypasses old exporter.
+        # Rows are generated lazily so executemany never holds a second copy.
+        rows = ((
+            p.phone_number, p.contact_name, p.total_messages, p.total_calls,
+            p.total_flags, p.flag_rate, p.high_count, p.medium_count, p.low_count,
+            p.risk_score, p.risk_label, json_codec.dumps(p.category_breakdown),
+            p.first_contact_ms, p.last_contact_ms, p.escalation_trend,
+            json_codec.dumps(p.relationship_tags), p.generated_at
+        ) for p in profiles)
 
-conn.row_factory = None
-print(f"Loaded: {len(msgs)} msgs, {len(calls)} calls, {len(intents)} intents")
+        with conn:
+            conn.executemany(UPSERT_CONTACT_PROFILE_SQL, rows)
+    finally:
+        conn.close()
+    print("Done — profiles written to DB")
+    return len(profiles)
 
-profiles = build_contact_profiles(msgs, calls, intents)
-print(f"Profiles built: {len(profiles)}")
-for p in profiles:
-    print(p.risk_label, round(p.risk_score, 1), p.contact_name)
 
-# Write profiles directly — bypasses old exporter
-rows = [(
-    p.phone_number, p.contact_name, p.total_messages, p.total_calls,
-    p.total_flags, p.flag_rate, p.high_count, p.medium_count, p.low_count,
-    p.risk_score, p.risk_label, json.dumps(p.category_breakdown),
-    p.first_contact_ms, p.last_contact_ms, p.escalation_trend,
-    json.dumps(p.relationship_tags), p.generated_at
-) for p in profiles]
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db", default=os.environ.get("SENTINEL_DB", r"G:\My Drive\mINd-SENTinel\test-output.db"))
+    parser.add_argument("--batch-size", type=int, default=10000,
+                        help="Intent rows pulled per fetchmany() while loading")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for the per-contact pass (used from 500 contacts)")
+    args = parser.parse_args()
+    build(Path(args.db), batch_size=args.batch_size, jobs=args.jobs)
 
-conn.executemany("""
-    INSERT OR REPLACE INTO contact_profiles
-    (phone_number, contact_name, total_messages, total_calls,
-     total_flags, flag_rate, high_count, medium_count, low_count,
-     risk_score, risk_label, category_breakdown, first_contact_ms,
-     last_contact_ms, escalation_trend, relationship_tags, generated_at)
-    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-""", rows)
-conn.commit()
-conn.close()
-print("Done — profiles written to DB")
+
+if __name__ == "__main__":
+    main()
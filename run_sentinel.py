@@ -61,10 +61,8 @@ def main():
         if not db_path.exists():
             print("No database. Run scan first.", file=sys.stderr)
             sys.exit(1)
-        import subprocess
-        r = subprocess.run([sys.executable, str(root / "build_profiles.py"), "--db", str(db_path)])
-        if r.returncode != 0:
-            sys.exit(r.returncode)
+        from build_profiles import build
+        build(db_path)   # in-process; build_profiles.py --jobs for a worker pool
 
 if __name__ == "__main__":
     main()
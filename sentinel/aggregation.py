@@ -6,7 +6,6 @@ Unified API for nous-hub, nous-vault, said-node integration.
 
 from __future__ import annotations
 
-import json
 import logging
 import sqlite3
 from dataclasses import dataclass, field
@@ -14,6 +13,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from sentinel import json_codec
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,20 +46,33 @@ class AggregatedSummary:
     generated_at: str
 
 
-def aggregate(db_path: Path) -> AggregatedSummary:
+def aggregate(
+    db_path: Path,
+    conn:    Optional[sqlite3.Connection] = None,
+) -> AggregatedSummary:
     """
     Aggregate all data from sentinel DB for nous-hub / nous-vault consumption.
     Single source of truth for the Nous architecture.
+    conn: an open connection to db_path to read through (left open).
     """
+    generated_at = datetime.now(timezone.utc).isoformat()
     if not db_path.exists():
         return AggregatedSummary(
             contacts=[], messages_count=0, calls_count=0,
             intent_flags_count=0, recordings_count=0, uplifts_count=0,
-            generated_at=datetime.now(timezone.utc).isoformat(),
+            generated_at=generated_at,
         )
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+    owns_conn = conn is None
+    if owns_conn:
+        conn = sqlite3.connect(str(db_path))
+    try:
+        return _aggregate(db_path, conn, generated_at)
+    finally:
+        if owns_conn:
+            conn.close()
+
 
+def _aggregate(db_path: Path, conn: sqlite3.Connection, generated_at: str) -> AggregatedSummary:
     # Counts
     msg_count = conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
     call_count = conn.execute("SELECT COUNT(*) FROM calls").fetchone()[0]
@@ -77,21 +91,21 @@ def aggregate(db_path: Path) -> AggregatedSummary:
             "total_flags, risk_score, risk_label, relationship_tags "
             "FROM contact_profiles ORDER BY risk_score DESC LIMIT 200"
         ).fetchall()
-        for r in rows:
-            rel = r["relationship_tags"]
+        for (phone, name, n_msgs, n_calls, n_flags,
+             risk_score, risk_label, rel) in rows:
             if isinstance(rel, str):
                 try:
-                    rel = json.loads(rel) if rel else []
-                except json.JSONDecodeError:
+                    rel = json_codec.loads(rel) if rel else []
+                except json_codec.JSONDecodeError:
                     rel = []
             contacts.append({
-                "phone_number": r["phone_number"],
-                "contact_name": r["contact_name"],
-                "total_messages": r["total_messages"],
-                "total_calls": r["total_calls"],
-                "total_flags": r["total_flags"],
-                "risk_score": r["risk_score"],
-                "risk_label": r["risk_label"],
+                "phone_number": phone,
+                "contact_name": name,
+                "total_messages": n_msgs,
+                "total_calls": n_calls,
+                "total_flags": n_flags,
+                "risk_score": risk_score,
+                "risk_label": risk_label,
                 "relationship_tags": rel,
             })
     except sqlite3.OperationalError:
@@ -100,19 +114,11 @@ def aggregate(db_path: Path) -> AggregatedSummary:
     # Uplifts count (approximate from high-sentiment messages)
     uplift_count = 0
     try:
-        from sentinel.uplifts.extractor import extract_uplifts
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            tmp = f.name
-        try:
-            uplifts = extract_uplifts(db_path=str(db_path), output_path=tmp, top=500)
-            uplift_count = len(uplifts)
-        finally:
-            Path(tmp).unlink(missing_ok=True)
+        from sentinel.uplifts.extractor import count_uplifts
+        uplift_count = count_uplifts(db_path=str(db_path), top=500, conn=conn)
     except Exception:
         pass
 
-    conn.close()
     return AggregatedSummary(
         contacts=contacts,
         messages_count=msg_count,
@@ -120,5 +126,5 @@ def aggregate(db_path: Path) -> AggregatedSummary:
         intent_flags_count=intent_count,
         recordings_count=rec_count,
         uplifts_count=uplift_count,
-        generated_at=datetime.now(timezone.utc).isoformat(),
+        generated_at=generated_at,
     )
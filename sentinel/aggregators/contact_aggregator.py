@@ -20,13 +20,17 @@ NOTE ON ESCALATION TREND:
 
 from __future__ import annotations
 
-import json
 import logging
-from collections import defaultdict
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from heapq import nlargest
+from operator import itemgetter
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 
+from sentinel import json_codec
 from sentinel.models.record import CallRecord, IntentResult, MessageRecord
 
 logger = logging.getLogger(__name__)
@@ -40,8 +44,40 @@ RISK_THRESHOLDS = {
     'CRITICAL': (60.0, float('inf')),
 }
 
+# Lower bounds of every band above LOW, and the label for each band —
+# derived from RISK_THRESHOLDS so _classify_risk is one bisect
+_RISK_BOUNDS = [lo for lo, _ in list(RISK_THRESHOLDS.values())[1:]]
+_RISK_LABELS = list(RISK_THRESHOLDS)
+
 SEVERITY_WEIGHTS = {'HIGH': 3, 'MEDIUM': 2, 'LOW': 1}
-ESCALATION_THRESHOLD = 0.25   # 25% change between halves
+ESCALATION_THRESHOLD  = 0.25   # 25% change between halves
+CATEGORY_TOP_K        = 20     # categories kept per contact in category_breakdown
+PARALLEL_MIN_CONTACTS = 500    # below this, jobs > 1 still builds in-process
+
+# Effective intent severity (ai_severity, else kw_severity) as a 1-byte code.
+# Anything that is not HIGH/MEDIUM counts as LOW, matching the risk score.
+SEVERITY_CODES = {'HIGH': 2, 'MEDIUM': 1, 'LOW': 0}
+
+
+def severity_code(ai_severity: Optional[str], kw_severity: Optional[str]) -> int:
+    """Effective severity of an intent (AI label, else keyword label) → code."""
+    return SEVERITY_CODES.get((ai_severity or kw_severity or 'LOW').upper(), 0)
+
+
+# Same mapping, evaluated by SQLite (intent_results.severity_code backfill and
+# databases written before that column existed)
+SEVERITY_CODE_SQL = (
+    "CASE UPPER(COALESCE(NULLIF(ai_severity, ''), NULLIF(kw_severity, ''), 'LOW')) "
+    "WHEN 'HIGH' THEN 2 WHEN 'MEDIUM' THEN 1 ELSE 0 END"
+)
+
+# Columns build_contact_profiles_soa() reads, per record type
+SOA_COLUMNS = {
+    'messages': ('phone_number', 'contact_name', 'timestamp_ms'),
+    'calls':    ('phone_number', 'contact_name'),
+    'intents':  ('phone_number', 'timestamp_ms', 'severity_code',
+                 'ai_categories', 'kw_categories'),
+}
 
 
 # ── DATA MODEL ───────────────────────────────────────────────
@@ -67,7 +103,7 @@ class ContactProfile:
     risk_score:         float           = 0.0   # SPECULATIVE — see module docstring
     risk_label:         str             = 'LOW'
 
-    # Category breakdown — e.g. {'manipulation': 3, 'threat': 1}
+    # Category breakdown — e.g. {'manipulation': 3, 'threat': 1}, top CATEGORY_TOP_K
     category_breakdown: Dict[str, int]  = field(default_factory=dict)
 
     # Timeline
@@ -87,6 +123,7 @@ def build_contact_profiles(
     calls:               List[CallRecord],
     intents:             List[IntentResult],
     contact_relationships: Optional[Dict[str, List[str]]] = None,
+    jobs:                  int = 1,
 ) -> List[ContactProfile]:
     """
     Build one ContactProfile per unique phone number.
@@ -100,71 +137,258 @@ def build_contact_profiles(
         intents:               All intent analysis results (flagged messages only).
         contact_relationships: Optional dict mapping contact names → relationship tags.
                                Example: {'Tiffany': ['family']}
+        jobs:                  Worker processes for the per-contact pass (see
+                               assemble_profiles). Default 1 = in-process.
+
+    Returns:
+        List[ContactProfile], sorted descending by risk_score.
+    """
+    return build_contact_profiles_soa(
+        records_to_soa(messages, calls, intents),
+        contact_relationships=contact_relationships,
+        jobs=jobs,
+    )
+
+
+def records_to_soa(
+    messages: List[MessageRecord],
+    calls:    List[CallRecord],
+    intents:  List[IntentResult],
+) -> Dict[str, Dict[str, Sequence]]:
+    """
+    Pull the handful of fields the aggregator reads into column lists.
+    Layout matches build_contact_profiles_soa() — see SOA_COLUMNS.
+    """
+    return {
+        'messages': {
+            'phone_number': [m.phone_number for m in messages],
+            'contact_name': [m.contact_name for m in messages],
+            'timestamp_ms': [m.timestamp_ms for m in messages],
+        },
+        'calls': {
+            'phone_number': [c.phone_number for c in calls],
+            'contact_name': [c.contact_name for c in calls],
+        },
+        'intents': {
+            'phone_number':  [r.phone_number  for r in intents],
+            'timestamp_ms':  [r.timestamp_ms  for r in intents],
+            'severity_code': array('b', [
+                severity_code(r.ai_severity, r.kw_severity) for r in intents
+            ]),
+            'ai_categories': [r.ai_categories for r in intents],
+            'kw_categories': [r.kw_categories for r in intents],
+        },
+    }
+
+
+def build_contact_profiles_soa(
+    arrays:                Dict[str, Dict[str, Sequence]],
+    contact_relationships: Optional[Dict[str, List[str]]] = None,
+    jobs:                  int = 1,
+) -> List[ContactProfile]:
+    """
+    Build contact profiles from column-oriented (struct-of-arrays) input.
+
+    Same output as build_contact_profiles(), but callers that read straight
+    from SQLite (build_profiles.py) can skip constructing a dataclass per row.
+
+    Args:
+        arrays: {'messages': {...}, 'calls': {...}, 'intents': {...}}, each a
+                dict of equal-length column sequences named as in SOA_COLUMNS.
+                Intent severity arrives pre-coded (SEVERITY_CODES) so the
+                tally touches one byte per row; category columns may hold
+                lists or raw JSON text, decoded only for the rows that need it.
+        contact_relationships, jobs: see build_contact_profiles().
 
     Returns:
         List[ContactProfile], sorted descending by risk_score.
     """
-    contact_relationships = contact_relationships or {}
+    msg_cols    = arrays.get('messages', {})
+    call_cols   = arrays.get('calls', {})
+    intent_cols = arrays.get('intents', {})
 
     # ── STEP 1: index messages by phone number ────────────────
-    msg_counts:   Dict[str, int]        = defaultdict(int)
-    msg_names:    Dict[str, str]        = {}
-    msg_timeline: Dict[str, List[int]]  = defaultdict(list)  # phone → [timestamp_ms]
+    # Counts are grouped with Counter (C-level tally) over the phone column;
+    # only the per-phone timelines still need a Python-level append.
+    msg_phones = [num or 'UNKNOWN' for num in msg_cols.get('phone_number', ())]
+    msg_counts: Counter = Counter(msg_phones)
+
+    msg_names: Dict[str, str] = dict.fromkeys(msg_counts, 'Unknown')
+    msg_names.update(
+        (num, name) for num, name in zip(msg_phones, msg_cols.get('contact_name', ())) if name
+    )
 
-    for msg in messages:
-        num = msg.phone_number or 'UNKNOWN'
-        msg_counts[num] += 1
-        msg_names[num]   = msg.contact_name or msg_names.get(num, 'Unknown')
-        msg_timeline[num].append(msg.timestamp_ms)
+    msg_timeline: Dict[str, List[int]] = defaultdict(list)  # phone → [timestamp_ms]
+    for num, ts in zip(msg_phones, msg_cols.get('timestamp_ms', ())):
+        msg_timeline[num].append(ts)
+    msg_spans = {num: _timeline_span(ts) for num, ts in msg_timeline.items()}
 
     # ── STEP 2: index calls by phone number ───────────────────
-    call_counts: Dict[str, int] = defaultdict(int)
-    for call in calls:
-        num = call.phone_number or 'UNKNOWN'
-        call_counts[num] += 1
+    call_phones = [num or 'UNKNOWN' for num in call_cols.get('phone_number', ())]
+    call_counts: Counter = Counter(call_phones)
+    for num, name in zip(call_phones, call_cols.get('contact_name', ())):
         if num not in msg_names:
-            msg_names[num] = call.contact_name or 'Unknown'
+            msg_names[num] = name or 'Unknown'
 
     # ── STEP 3: aggregate intent flags ───────────────────────
-    flag_counts:      Dict[str, int]             = defaultdict(int)
-    high_counts:      Dict[str, int]             = defaultdict(int)
-    medium_counts:    Dict[str, int]             = defaultdict(int)
-    low_counts:       Dict[str, int]             = defaultdict(int)
-    category_maps:    Dict[str, Dict[str, int]]  = defaultdict(lambda: defaultdict(int))
-    flag_timeline:    Dict[str, List[int]]       = defaultdict(list)  # phone → [timestamp_ms of flags]
-
-    for intent in intents:
-        num = intent.phone_number or 'UNKNOWN'
-        flag_counts[num] += 1
-
-        sev = (intent.ai_severity or intent.kw_severity or 'LOW').upper()
-        if sev == 'HIGH':
-            high_counts[num] += 1
-        elif sev == 'MEDIUM':
-            medium_counts[num] += 1
-        else:
-            low_counts[num] += 1
+    tallies = tally_intents(intent_cols)
+
+    return assemble_profiles(
+        msg_counts, msg_names, msg_spans, call_counts, tallies,
+        contact_relationships=contact_relationships,
+        jobs=jobs,
+    )
+
+
+class IntentTallies(NamedTuple):
+    """Per-phone intent aggregates — output of tally_intents()."""
+    flag_counts:     Dict[str, int]              # phone → flags
+    severity_counts: Dict[tuple, int]            # (phone, severity code) → flags
+    category_maps:   Dict[str, Dict[str, int]]   # phone → {category: count}
+    flag_timeline:   Dict[str, List[int]]        # phone → [timestamp_ms of flags]
+
+
+# (first_ms, last_ms, midpoint_ms, messages before midpoint) — see _timeline_span()
+TimelineSpan = Tuple[int, int, int, int]
+
+
+def tally_intents(intent_cols: Dict[str, Sequence]) -> IntentTallies:
+    """Group intent columns (SOA_COLUMNS['intents']) by phone number."""
+    flag_phones = [num or 'UNKNOWN' for num in intent_cols.get('phone_number', ())]
+    flag_counts: Counter = Counter(flag_phones)
 
-        cats = intent.ai_categories or intent.kw_categories or []
-        for cat in cats:
-            category_maps[num][cat] += 1
+    # (phone, severity code) → count
+    severity_counts: Counter = Counter(zip(flag_phones, intent_cols.get('severity_code', ())))
+
+    # (phone, category) → count in one flat table, split per contact afterwards
+    category_counts: Counter = Counter(
+        (num, cat)
+        for num, ai_cats, kw_cats in zip(
+            flag_phones,
+            intent_cols.get('ai_categories', ()),
+            intent_cols.get('kw_categories', ()),
+        )
+        for cat in _decode_categories(ai_cats) or _decode_categories(kw_cats)
+    )
+    category_maps: Dict[str, Dict[str, int]] = defaultdict(dict)
+    for (num, cat), n in category_counts.items():
+        category_maps[num][cat] = n
+
+    flag_timeline: Dict[str, List[int]] = defaultdict(list)
+    for num, ts in zip(flag_phones, intent_cols.get('timestamp_ms', ())):
+        flag_timeline[num].append(ts)
+
+    return IntentTallies(flag_counts, severity_counts, category_maps, flag_timeline)
+
+
+def assemble_profiles(
+    msg_counts:            Dict[str, int],
+    names:                 Dict[str, str],
+    msg_spans:             Dict[str, TimelineSpan],
+    call_counts:           Dict[str, int],
+    tallies:               IntentTallies,
+    contact_relationships: Optional[Dict[str, List[str]]] = None,
+    jobs:                  int = 1,
+) -> List[ContactProfile]:
+    """
+    STEP 4–5: one ContactProfile per phone seen in any input.
+    Shared by the in-memory path and the SQL path (sql_aggregator).
 
-        flag_timeline[num].append(intent.timestamp_ms)
+    jobs > 1 builds profiles in that many worker processes, but only once
+    there are PARALLEL_MIN_CONTACTS contacts — below that, process start-up
+    and pickling cost more than the loop itself.
+    """
+    rel_index    = _build_relationship_index(contact_relationships or {})
+    generated_at = datetime.now(timezone.utc).isoformat()   # one timestamp per batch
 
     # ── STEP 4: collect all known phone numbers ───────────────
-    all_phones = set(msg_counts.keys()) | set(call_counts.keys()) | set(flag_counts.keys())
+    all_phones = list(
+        set(msg_counts.keys()) | set(call_counts.keys()) | set(tallies.flag_counts.keys())
+    )
 
     # ── STEP 5: build profiles ────────────────────────────────
+    if jobs > 1 and len(all_phones) >= PARALLEL_MIN_CONTACTS:
+        profiles = _build_profiles_parallel(
+            all_phones, jobs, msg_counts, names, msg_spans, call_counts, tallies,
+            rel_index, generated_at,
+        )
+    else:
+        profiles = _build_profiles(
+            all_phones, msg_counts, names, msg_spans, call_counts, tallies,
+            rel_index, generated_at,
+        )
+
+    # Sort descending by risk score
+    profiles.sort(key=lambda p: p.risk_score, reverse=True)
+    logger.info(f"Contact profiles built: {len(profiles)} contacts")
+    return profiles
+
+
+def _build_profiles_parallel(
+    phones:       List[str],
+    jobs:         int,
+    msg_counts:   Dict[str, int],
+    names:        Dict[str, str],
+    msg_spans:    Dict[str, TimelineSpan],
+    call_counts:  Dict[str, int],
+    tallies:      IntentTallies,
+    rel_index:    Dict[str, List[str]],
+    generated_at: str,
+) -> List[ContactProfile]:
+    """
+    Shard phones across `jobs` worker processes. Each worker gets only the
+    per-phone data for its own shard, so pickling cost scales with the shard.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    flag_counts, severity_counts, category_maps, flag_timeline = tallies
+    sev_codes = (SEVERITY_CODES['HIGH'], SEVERITY_CODES['MEDIUM'])
+
+    def pick(d: Dict, shard: List[str]) -> Dict:
+        return {num: d[num] for num in shard if num in d}
+
+    futures = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for k in range(jobs):
+            shard = phones[k::jobs]
+            shard_tallies = IntentTallies(
+                pick(flag_counts, shard),
+                {key: severity_counts[key]
+                 for num in shard for key in ((num, c) for c in sev_codes)
+                 if key in severity_counts},
+                pick(category_maps, shard),
+                pick(flag_timeline, shard),
+            )
+            futures.append(pool.submit(
+                _build_profiles, shard,
+                pick(msg_counts, shard), pick(names, shard), pick(msg_spans, shard),
+                pick(call_counts, shard), shard_tallies, rel_index, generated_at,
+            ))
+        return [p for f in futures for p in f.result()]
+
+
+def _build_profiles(
+    phones:       List[str],
+    msg_counts:   Dict[str, int],
+    names:        Dict[str, str],
+    msg_spans:    Dict[str, TimelineSpan],
+    call_counts:  Dict[str, int],
+    tallies:      IntentTallies,
+    rel_index:    Dict[str, List[str]],
+    generated_at: str,
+) -> List[ContactProfile]:
+    """STEP 5 for the given phones (unsorted). Top-level so worker processes can run it."""
+    flag_counts, severity_counts, category_maps, flag_timeline = tallies
     profiles: List[ContactProfile] = []
 
-    for num in all_phones:
+    for num in phones:
         total_msgs  = msg_counts.get(num, 0)
         total_calls = call_counts.get(num, 0)
         total_flags = flag_counts.get(num, 0)
-        high        = high_counts.get(num, 0)
-        medium      = medium_counts.get(num, 0)
-        low         = low_counts.get(num, 0)
-        name        = msg_names.get(num, 'Unknown')
+        high        = severity_counts.get((num, SEVERITY_CODES['HIGH']), 0)
+        medium      = severity_counts.get((num, SEVERITY_CODES['MEDIUM']), 0)
+        low         = total_flags - high - medium
+        name        = names.get(num, 'Unknown')
 
         # Flag rate
         flag_rate = total_flags / total_msgs if total_msgs > 0 else 0.0
@@ -181,26 +405,24 @@ def build_contact_profiles(
         # Risk label
         risk_label = _classify_risk(risk_score)
 
-        # Category breakdown
-        cat_breakdown = dict(sorted(
-            category_maps[num].items(),
-            key=lambda x: x[1],
-            reverse=True
+        # Category breakdown — most frequent first, capped at CATEGORY_TOP_K
+        cat_breakdown = dict(nlargest(
+            CATEGORY_TOP_K, category_maps.get(num, {}).items(), key=itemgetter(1),
         ))
 
-        # Timeline
-        all_ts = msg_timeline.get(num, [])
-        first_ms = min(all_ts) if all_ts else None
-        last_ms  = max(all_ts) if all_ts else None
-
-        # Escalation trend
-        trend = _compute_escalation_trend(
-            msg_timeline=msg_timeline.get(num, []),
-            flag_timeline=flag_timeline.get(num, []),
-        )
+        # Timeline + escalation trend
+        span = msg_spans.get(num)
+        if span:
+            first_ms, last_ms, midpoint, first_half_msgs = span
+            trend = _escalation_from_split(
+                total_msgs, midpoint, first_half_msgs, flag_timeline.get(num, []),
+            )
+        else:
+            first_ms = last_ms = None
+            trend = 'UNKNOWN'
 
         # Relationship tags — match by name (case-insensitive)
-        rel_tags = _resolve_relationship_tags(name, contact_relationships)
+        rel_tags = _resolve_relationship_tags(name, rel_index)
 
         profiles.append(ContactProfile(
             phone_number       = num,
@@ -219,22 +441,35 @@ def build_contact_profiles(
             last_contact_ms    = last_ms,
             escalation_trend   = trend,
             relationship_tags  = rel_tags,
-            generated_at       = datetime.now(timezone.utc).isoformat(),
+            generated_at       = generated_at,
         ))
 
-    # Sort descending by risk score
-    profiles.sort(key=lambda p: p.risk_score, reverse=True)
-    logger.info(f"Contact profiles built: {len(profiles)} contacts")
     return profiles
 
 
 # ── HELPERS ──────────────────────────────────────────────────
 
+def _decode_categories(value: Union[List[str], str, None]) -> List[str]:
+    """Category column value → list. Accepts a list or its JSON text (SQLite)."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        try:
+            value = json_codec.loads(value)
+        except json_codec.JSONDecodeError:
+            return []
+    return value or []
+
+
 def _classify_risk(score: float) -> str:
-    for label, (lo, hi) in RISK_THRESHOLDS.items():
-        if lo <= score < hi:
-            return label
-    return 'CRITICAL'
+    return _RISK_LABELS[bisect_right(_RISK_BOUNDS, score)]
+
+
+def _timeline_span(timeline: Sequence[int]) -> TimelineSpan:
+    """Sorted-timeline summary: (first, last, median timestamp, count before median)."""
+    ordered  = sorted(timeline)
+    midpoint = ordered[len(ordered) // 2]
+    return ordered[0], ordered[-1], midpoint, bisect_left(ordered, midpoint)
 
 
 def _compute_escalation_trend(
@@ -250,15 +485,27 @@ def _compute_escalation_trend(
     """
     if len(msg_timeline) < 5:
         return 'UNKNOWN'
+    _, _, midpoint, first_half_msgs = _timeline_span(msg_timeline)
+    return _escalation_from_split(len(msg_timeline), midpoint, first_half_msgs, flag_timeline)
 
-    sorted_msgs = sorted(msg_timeline)
-    midpoint    = sorted_msgs[len(sorted_msgs) // 2]
 
-    first_half_msgs  = sum(1 for t in sorted_msgs if t < midpoint)
-    second_half_msgs = sum(1 for t in sorted_msgs if t >= midpoint)
+def _escalation_from_split(
+    total_msgs:      int,
+    midpoint:        int,
+    first_half_msgs: int,
+    flag_timeline:   Sequence[int],
+) -> str:
+    """
+    Trend from a precomputed median split (messages before `midpoint`).
+    Flags are unsorted, so they are split at the same midpoint in one pass.
+    """
+    if total_msgs < 5:
+        return 'UNKNOWN'
+
+    second_half_msgs = total_msgs - first_half_msgs
 
-    first_half_flags  = sum(1 for t in flag_timeline if t < midpoint)
-    second_half_flags = sum(1 for t in flag_timeline if t >= midpoint)
+    first_half_flags  = sum(t < midpoint for t in flag_timeline)
+    second_half_flags = len(flag_timeline) - first_half_flags
 
     rate_first  = first_half_flags  / max(first_half_msgs,  1)
     rate_second = second_half_flags / max(second_half_msgs, 1)
@@ -279,24 +526,32 @@ def _compute_escalation_trend(
         return 'STABLE'
 
 
+def _build_relationship_index(
+    contact_relationships: Dict[str, List[str]],
+) -> Dict[str, List[str]]:
+    """Normalize CONTACT_RELATIONSHIPS keys once: {lower(strip(key)): tags}. First key wins."""
+    index: Dict[str, List[str]] = {}
+    for key, tags in contact_relationships.items():
+        index.setdefault(key.strip().lower(), list(tags))
+    return index
+
+
 def _resolve_relationship_tags(
     name: str,
-    contact_relationships: Dict[str, List[str]],
+    rel_index: Dict[str, List[str]],
 ) -> List[str]:
     """
-    Match contact name against CONTACT_RELATIONSHIPS dict.
-    Case-insensitive prefix match on first word of name.
+    Match contact name against the normalized relationship index.
+    Case-insensitive: full name first, then first word of name.
     Returns list of tags or empty list.
     """
-    if not name or not contact_relationships:
+    if not name or not rel_index:
         return []
 
     name_lower  = name.strip().lower()
     first_token = name_lower.split()[0] if name_lower else ''
 
-    for key, tags in contact_relationships.items():
-        key_lower = key.strip().lower()
-        if name_lower == key_lower or first_token == key_lower:
-            return list(tags)
-
-    return []
+    tags = rel_index.get(name_lower)
+    if tags is None:
+        tags = rel_index.get(first_token, [])
+    return list(tags)
@@ -0,0 +1,162 @@
+"""
+sentinel/aggregators/sql_aggregator.py
+Contact profiles built directly from a sentinel SQLite database.
+
+Messages and calls are grouped by SQLite itself (COUNT / MIN / MAX and a
+window-function median split), so only one row per contact crosses into
+Python. Intent rows are still read individually — categories are JSON and
+flags are needed for the escalation split — but they are the smallest table.
+
+Output is identical to build_contact_profiles() over the same records.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from array import array
+from sys import intern
+from typing import Dict, List, Optional, Sequence
+
+from sentinel.aggregators.contact_aggregator import (
+    SEVERITY_CODE_SQL,
+    SOA_COLUMNS,
+    ContactProfile,
+    assemble_profiles,
+    tally_intents,
+)
+
+logger = logging.getLogger(__name__)
+
+# Low-cardinality text columns — one shared str object per distinct value
+INTERN_COLUMNS = {'phone_number', 'contact_name'}
+
+# NULL / '' phone numbers group as UNKNOWN, as in the in-memory path
+_PHONE = "COALESCE(NULLIF(phone_number, ''), 'UNKNOWN')"
+
+# Per contact: count, first/last timestamp, median timestamp and the number
+# of messages strictly before it (RANK - 1). Row n/2 + 1 of the ordered
+# partition is element n // 2 of the sorted timeline.
+_MESSAGE_STATS_SQL = f"""
+    WITH ranked AS (
+        SELECT phone, ts,
+               ROW_NUMBER() OVER w AS rn,
+               RANK()       OVER w AS rk,
+               COUNT(*)     OVER p AS n,
+               MIN(ts)      OVER p AS first_ms,
+               MAX(ts)      OVER p AS last_ms
+        FROM (SELECT {_PHONE} AS phone, timestamp_ms AS ts FROM messages)
+        WINDOW p AS (PARTITION BY phone),
+               w AS (PARTITION BY phone ORDER BY ts)
+    )
+    SELECT phone, n, first_ms, last_ms, ts, rk - 1
+    FROM ranked
+    WHERE rn = n / 2 + 1
+"""
+
+# Latest non-empty name per phone (SQLite returns bare columns from the MAX row)
+_MESSAGE_NAMES_SQL = f"""
+    SELECT {_PHONE}, contact_name, MAX(rowid)
+    FROM messages
+    WHERE contact_name <> ''
+    GROUP BY 1
+"""
+
+# Call count plus the first call's name per phone
+_CALL_STATS_SQL = f"""
+    SELECT {_PHONE}, COUNT(*), COALESCE(NULLIF(contact_name, ''), 'Unknown'), MIN(rowid)
+    FROM calls
+    GROUP BY 1
+"""
+
+# intent_results column expressions for SOA_COLUMNS['intents']. severity_code
+# is a stored column since schema 2.1; older databases derive it on read.
+_INTENT_COLUMN_SQL = {
+    'timestamp_ms':  'message_ts_ms AS timestamp_ms',
+}
+_LEGACY_SEVERITY_SQL = f'{SEVERITY_CODE_SQL} AS severity_code'
+
+
+def load_soa(
+    conn:       sqlite3.Connection,
+    table:      str,
+    cols:       Sequence[str],
+    batch_size: int = 10000,
+) -> Dict[str, Sequence]:
+    """
+    Read `cols` from `table` into one sequence per column (struct-of-arrays).
+    Rows are pulled batch_size at a time — no per-row record objects.
+    Integer *_ms columns land in array('q'), *_code columns in array('b');
+    everything else in a list. Phone/name strings are interned (INTERN_COLUMNS).
+    Columns may be aliased ("message_ts_ms AS timestamp_ms"); keys use the alias.
+    """
+    cur = conn.execute(f"SELECT {', '.join(cols)} FROM {table}")
+    cur.arraysize = batch_size
+    names = [d[0] for d in cur.description]
+    out = {
+        n: array('q') if n.endswith('_ms') else array('b') if n.endswith('_code') else []
+        for n in names
+    }
+    columns  = [out[n] for n in names]
+    interned = [n in INTERN_COLUMNS for n in names]
+    while batch := cur.fetchmany():
+        for column, intern_values, values in zip(columns, interned, zip(*batch)):
+            column.extend(_intern_all(values) if intern_values else values)
+    return out
+
+
+def load_intent_soa(conn: sqlite3.Connection, batch_size: int = 10000) -> Dict[str, Sequence]:
+    """intent_results → SOA_COLUMNS['intents'] layout."""
+    column_sql = dict(_INTENT_COLUMN_SQL)
+    existing   = {r[1] for r in conn.execute("PRAGMA table_info(intent_results)")}
+    if 'severity_code' not in existing:
+        column_sql['severity_code'] = _LEGACY_SEVERITY_SQL
+    return load_soa(
+        conn, 'intent_results',
+        [column_sql.get(c, c) for c in SOA_COLUMNS['intents']],
+        batch_size,
+    )
+
+
+def build_contact_profiles_from_sql(
+    conn:                  sqlite3.Connection,
+    contact_relationships: Optional[Dict[str, List[str]]] = None,
+    batch_size:            int = 10000,
+    jobs:                  int = 1,
+) -> List[ContactProfile]:
+    """
+    Build one ContactProfile per phone number from the DB at `conn`.
+    jobs: worker processes for the per-contact pass (see assemble_profiles).
+
+    Requires SQLite 3.25+ (window functions).
+    Returns List[ContactProfile], sorted descending by risk_score.
+    """
+    msg_counts: Dict[str, int] = {}
+    msg_spans = {}
+    for phone, n, first_ms, last_ms, midpoint, first_half in conn.execute(_MESSAGE_STATS_SQL):
+        phone = intern(phone)
+        msg_counts[phone] = n
+        msg_spans[phone]  = (first_ms, last_ms, midpoint, first_half)
+
+    names: Dict[str, str] = dict.fromkeys(msg_counts, 'Unknown')
+    names.update((phone, name) for phone, name, _ in conn.execute(_MESSAGE_NAMES_SQL))
+
+    call_counts: Dict[str, int] = {}
+    for phone, n, name, _ in conn.execute(_CALL_STATS_SQL):
+        call_counts[phone] = n
+        names.setdefault(phone, name)
+
+    tallies = tally_intents(load_intent_soa(conn, batch_size))
+    logger.info(
+        f"SQL prepass: {len(msg_counts)} message contacts, "
+        f"{len(call_counts)} call contacts, {len(tallies.flag_counts)} flagged"
+    )
+    return assemble_profiles(
+        msg_counts, names, msg_spans, call_counts, tallies,
+        contact_relationships=contact_relationships,
+        jobs=jobs,
+    )
+
+
+def _intern_all(values):
+    return [intern(v) if v else v for v in values]
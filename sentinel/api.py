@@ -20,9 +20,13 @@ ENDPOINTS:
   GET  /contacts/{phone}  — single contact profile (phone URL-encoded: %2B16125550001)
   GET  /messages          — flagged intent_results with optional filters
   GET  /meta              — last run metadata
+  GET  /dashboard         — /aggregate + /personalized-prompt + /meta in one call
 
 CORS: localhost-only (127.0.0.1 / ::1). Not exposed to network by default.
 
+CACHING: scan-data GETs send an ETag tied to the latest sentinel_meta row;
+  a matching If-None-Match gets 304 Not Modified without running the query.
+
 PRIVACY NOTE:
   All data stays on-device. No external HTTP calls are made by this module.
   The server binds to 127.0.0.1 only — not reachable from outside the device.
@@ -41,11 +45,25 @@ ROLLBACK PLAN (Jules):
 
 from __future__ import annotations
 
-import json
+import base64
+import binascii
+import functools
+import hashlib
+import itertools
 import logging
+import os
+import queue
 import sqlite3
+import sys
+import threading
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass
+from types import ModuleType
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from sentinel import json_codec
 
 logger = logging.getLogger(__name__)
 
@@ -54,9 +72,12 @@ logger = logging.getLogger(__name__)
 # The HTTP server only starts when running as __main__ or via uvicorn.
 
 try:
-    from fastapi import FastAPI, HTTPException, Query, Body
+    import anyio
+    from fastapi import FastAPI, HTTPException, Query, Body, Request
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import JSONResponse
+    from fastapi.responses import (
+        JSONResponse, ORJSONResponse, Response, StreamingResponse,
+    )
     from pydantic import BaseModel
     _FASTAPI_AVAILABLE = True
 except ImportError:  # pragma: no cover
@@ -66,6 +87,390 @@ except ImportError:  # pragma: no cover
     BaseModel = object      # type: ignore
 
 
+# Applied once per pooled connection (not per request)
+_READ_PRAGMAS = """
+    PRAGMA query_only=ON;
+    PRAGMA busy_timeout=5000;
+    PRAGMA cache_size=-20000;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+"""
+_WRITE_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA busy_timeout=30000;
+    PRAGMA foreign_keys=ON;
+    PRAGMA cache_size=-20000;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+"""
+
+
+def _encode_cursor(values: List[Any]) -> str:
+    """Opaque keyset cursor — URL-safe base64 of a JSON list."""
+    return base64.urlsafe_b64encode(
+        json_codec.dumps(values).encode()
+    ).decode()
+
+
+def _decode_cursor(cursor: str, types: tuple) -> List[Any]:
+    """Inverse of _encode_cursor. Raises ValueError unless values match `types`."""
+    try:
+        values = json_codec.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeError, json_codec.JSONDecodeError) as exc:
+        raise ValueError(f"Malformed cursor: {cursor!r}") from exc
+    if (not isinstance(values, list) or len(values) != len(types)
+            or not all(isinstance(v, t) and not isinstance(v, bool)
+                       for v, t in zip(values, types))):
+        raise ValueError(f"Malformed cursor: {cursor!r}")
+    return values
+
+
+def next_cursor(rows: List[Dict[str, Any]], limit: int, keys: tuple) -> Optional[str]:
+    """
+    Cursor for the page after `rows`, or None when this was the last page.
+    keys: the page's sort columns, e.g. CONTACT_CURSOR_KEYS.
+    """
+    if len(rows) < limit:
+        return None
+    return _encode_cursor([rows[-1][k] for k in keys])
+
+
+def _label_table(labels: tuple) -> Dict[str, str]:
+    """Interned canonical label for each label's upper/lower/title spelling."""
+    return {
+        alias: sys.intern(label)
+        for label in labels
+        for alias in (label, label.lower(), label.title())
+    }
+
+
+# Filter values accepted by get_contacts / get_messages
+_RISK_LABELS = _label_table(("LOW", "MEDIUM", "HIGH", "CRITICAL"))
+_SEVERITIES  = _label_table(("LOW", "MEDIUM", "HIGH"))
+_MAX_LABEL_LEN = max(map(len, _RISK_LABELS))
+
+
+def _canonical_label(value: str, table: Dict[str, str]) -> Optional[str]:
+    """Canonical label for `value` (any case), or None if it is not one."""
+    label = table.get(value)
+    if label is None and len(value) <= _MAX_LABEL_LEN:
+        label = table.get(value.upper())
+    return label
+
+
+# Formatting the parsers keep in stored numbers ("(612) 555-0001")
+_PHONE_TRANS = str.maketrans("", "", "-() .")
+
+
+def _normalize_phone(phone: str) -> str:
+    """Strip formatting punctuation/spaces in one str.translate pass."""
+    return phone.translate(_PHONE_TRANS)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True if an If-None-Match header value names `etag` (weak or strong) or is *."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+# Window column carrying the filtered row count (before LIMIT/OFFSET) on each row
+TOTAL_COLUMN = "_total"
+
+
+def _sql_variants(table: str, filters: tuple, tail: str) -> Dict[tuple, str]:
+    """
+    Every combination of optional WHERE clauses, keyed by a bool per filter
+    plus a final bool for the COUNT(*) OVER () total column.
+    Built once at import so each request reuses the identical SQL text, which
+    is what sqlite3's per-connection statement cache keys on.
+    """
+    selects = {
+        False: f"SELECT * FROM {table}",
+        True:  f"SELECT *, COUNT(*) OVER () AS {TOTAL_COLUMN} FROM {table}",
+    }
+    variants = {}
+    for mask in itertools.product((False, True), repeat=len(filters) + 1):
+        where = " AND ".join(f for f, on in zip(filters, mask) if on)
+        variants[mask] = selects[mask[-1]] + (f" WHERE {where}" if where else "") + tail
+    return variants
+
+
+# Keys: (risk_label, cursor, with_total)
+_SQL_CONTACTS = _sql_variants(
+    "contact_profiles",
+    ("risk_label = ?", "(risk_score, phone_number) < (?, ?)"),
+    " ORDER BY risk_score DESC, phone_number DESC LIMIT ? OFFSET ?",
+)
+# Keys: (phone, severity, cursor, with_total)
+_SQL_MESSAGES = _sql_variants(
+    "intent_results",
+    ("phone_number = ?", "ai_severity = ?", "(message_ts_ms, id) < (?, ?)"),
+    " ORDER BY message_ts_ms DESC, id DESC LIMIT ? OFFSET ?",
+)
+# Exact match first, else the punctuation-free form (one PK descent each)
+_SQL_CONTACT_BY_PHONE = (
+    "SELECT * FROM contact_profiles WHERE phone_number IN (?, ?) "
+    "ORDER BY phone_number = ? DESC LIMIT 1"
+)
+_SQL_LATEST_META      = "SELECT * FROM sentinel_meta ORDER BY id DESC LIMIT 1"
+# Data version for ETags: every export adds a sentinel_meta row. Profile
+# rebuilds (build_profiles.build, run_scan.write_results) add none but stamp
+# each row's generated_at, so the newest stamp is folded in too. recordings is
+# filled outside the exporter, so its last rowid is folded in separately.
+_SQL_ETAG = (
+    "SELECT id, (SELECT COUNT(*) || ':' || IFNULL(MAX(generated_at), '') "
+    "FROM contact_profiles) "
+    "FROM sentinel_meta ORDER BY id DESC LIMIT 1"
+)
+_SQL_ETAG_RECORDINGS = "SELECT MAX(rowid) FROM recordings"
+
+API_VERSION = "2.4.0"
+
+# Text columns holding JSON, decoded by SentinelAPI._row_to_dict
+_JSON_FIELDS = frozenset({
+    "kw_categories", "ai_categories", "context_before",
+    "context_after", "category_breakdown", "relationship_tags",
+})
+
+# Keyset (seek) pagination: sort columns, ending in a unique tiebreaker
+CONTACT_CURSOR_KEYS = ("risk_score", "phone_number")
+MESSAGE_CURSOR_KEYS = ("message_ts_ms", "id")
+
+
+def _stream_page(
+    name: str,
+    rows: Iterator[Dict[str, Any]],
+    limit: int,
+    keys: tuple,
+    with_total: bool = False,
+) -> Iterator[bytes]:
+    """
+    Encode a page as {"<name>": [...], "count": n, "next_cursor": ...}, one
+    row at a time — neither the row list nor the full JSON body is built
+    before the first byte goes out.
+    with_total: rows carry TOTAL_COLUMN; it is moved to a "total" envelope
+                key (0 for an empty page).
+    """
+    yield b'{"' + name.encode() + b'":['
+    count, last, total = 0, None, 0
+    for row in rows:
+        if with_total:
+            total = row.pop(TOTAL_COLUMN)
+        yield (b"," if count else b"") + json_codec.dumps(row).encode()
+        count, last = count + 1, row
+    cursor = next_cursor([last], 1, keys) if last is not None and count >= limit else None
+    tail = f',"total":{total}' if with_total else ""
+    yield f'],"count":{count}{tail},"next_cursor":{json_codec.dumps(cursor)}}}'.encode()
+
+
+@dataclass(frozen=True)
+class _PipelineModules:
+    """Scan pipeline modules, imported once on first run_scan()."""
+    sms_parser:            ModuleType
+    call_parser:           ModuleType
+    intent_detector:       ModuleType
+    sqlite_exporter:       ModuleType
+    contact_aggregator:    ModuleType
+    contact_relationships: Dict[str, Any]
+
+
+_pipeline: Optional[_PipelineModules] = None
+_pipeline_lock = threading.Lock()
+
+
+def _get_pipeline() -> _PipelineModules:
+    """
+    Import the scan pipeline on first use (deferred to avoid circular imports
+    and to keep `import sentinel.api` cheap) and cache it for later scans.
+    Modules rather than functions are cached so attribute lookups still see
+    monkeypatched names.
+    """
+    global _pipeline
+    if _pipeline is not None:
+        return _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            from sentinel.parsers import sms_parser, call_parser
+            from sentinel.detectors import intent_detector
+            from sentinel.exporters import sqlite_exporter
+            from sentinel.aggregators import contact_aggregator
+
+            contact_rels: Dict[str, Any] = {}
+            try:
+                from sentinel.uplifts.extractor import CONTACT_RELATIONSHIPS
+                contact_rels = CONTACT_RELATIONSHIPS
+            except ImportError:
+                pass  # optional module — not required
+
+            _pipeline = _PipelineModules(
+                sms_parser            = sms_parser,
+                call_parser           = call_parser,
+                intent_detector       = intent_detector,
+                sqlite_exporter       = sqlite_exporter,
+                contact_aggregator    = contact_aggregator,
+                contact_relationships = contact_rels,
+            )
+    return _pipeline
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_dir(path: str) -> Path:
+    """Path(path).resolve(), memoized — scans repeat the same few xml_dirs."""
+    return Path(path).resolve()
+
+
+def _close_all(conns: List[sqlite3.Connection]) -> None:
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    conns.clear()
+
+
+class _ConnectionPool:
+    """
+    1 writer + N readers over one sentinel.db.
+
+    WAL lets readers proceed while the writer commits, so concurrent GET
+    requests each get their own read-only connection instead of queueing on
+    one. Connections are opened lazily up to each role's maxsize, then
+    reused; a caller waits (up to `timeout` seconds) only when all of them
+    are checked out.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        readers: Optional[int] = None,
+        timeout: float = 30.0,
+    ):
+        self.db_path  = Path(db_path)
+        self.timeout  = timeout
+        self._sizes   = {"r": readers or os.cpu_count() or 1, "w": 1}
+        self._lock    = threading.Lock()
+        self.reader_count = self._sizes["r"]
+        self._generation = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        # Caller holds self._lock (or is __init__)
+        self._queues: Dict[str, queue.Queue] = {
+            role: queue.Queue(maxsize=size) for role, size in self._sizes.items()
+        }
+        self._counts = dict.fromkeys(self._sizes, 0)
+        self._generation += 1
+
+    def reader(self):
+        """Context manager: a read-only connection (sqlite3.Row rows)."""
+        return self._checkout("r", self._open_reader)
+
+    def writer(self):
+        """Context manager: the single write connection (autocommit)."""
+        return self._checkout("w", self._open_writer)
+
+    @contextmanager
+    def write_txn(self) -> Iterator[sqlite3.Connection]:
+        """
+        The write connection inside BEGIN IMMEDIATE: the write lock is taken
+        up front instead of on the first write of a deferred transaction.
+        Commits on exit, rolls back if the block raises.
+        """
+        with self.writer() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """
+        Close every idle pooled connection. Connections checked out at the
+        time stay usable until released, then are closed rather than
+        re-queued; new ones open lazily.
+        """
+        with self._lock:
+            idle = [q.get_nowait() for q in self._queues.values() for _ in range(q.qsize())]
+            self._reset()
+        _close_all(idle)
+
+    @contextmanager
+    def _checkout(
+        self,
+        role: str,
+        open_conn: Callable[[], sqlite3.Connection],
+    ) -> Iterator[sqlite3.Connection]:
+        conn, generation = self._acquire(role, open_conn)
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                current = generation == self._generation
+                if current:
+                    self._queues[role].put_nowait(conn)
+            if not current:
+                conn.close()    # pool closed while this one was checked out
+
+    def _acquire(self, role: str, open_conn: Callable[[], sqlite3.Connection]):
+        with self._lock:
+            pool, generation = self._queues[role], self._generation
+            try:
+                return pool.get_nowait(), generation
+            except queue.Empty:
+                pass
+            reserved = self._counts[role] < pool.maxsize
+            if reserved:
+                self._counts[role] += 1
+        if reserved:
+            # Connect outside the lock: opening the writer can wait out
+            # busy_timeout, and other checkouts must not queue behind it
+            try:
+                return open_conn(), generation
+            except BaseException:
+                with self._lock:
+                    if generation == self._generation:
+                        self._counts[role] -= 1
+                raise
+        try:
+            conn = pool.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No {'read' if role == 'r' else 'write'} connection to "
+                f"{self.db_path} freed up within {self.timeout}s "
+                f"(pool size {pool.maxsize})"
+            ) from None
+        return conn, generation
+
+    def _open_reader(self) -> sqlite3.Connection:
+        # Autocommit, so no read transaction is held between requests
+        conn = sqlite3.connect(
+            self.db_path.resolve().as_uri() + "?mode=ro", uri=True,
+            check_same_thread=False, isolation_level=None,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.executescript(_READ_PRAGMAS)
+        return conn
+
+    def _open_writer(self) -> sqlite3.Connection:
+        # Autocommit: transactions are explicit (write_txn(), or export()'s own)
+        # Lives across exports: a larger statement cache keeps export()'s
+        # bulk-insert statements prepared from one scan to the next
+        conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None,
+            cached_statements=512,
+        )
+        conn.executescript(_WRITE_PRAGMAS)
+        return conn
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # IMPORTABLE CLASS — mINd-REPly / mINd-VAULt interface
 # ═══════════════════════════════════════════════════════════════════════════
@@ -85,28 +490,85 @@ class SentinelAPI:
 
     def __init__(self, db_path: Path = Path("sentinel.db")):
         self.db_path = Path(db_path)
+        self._db_path_str = os.fspath(self.db_path)
+        # Only a positive result is cached: the DB may be created later by
+        # another process (CLI scan), but a scan never deletes it.
+        self._db_exists_bit: Optional[bool] = None
+        # Pooled connections are closed by close(), on GC, or at interpreter exit
+        self._pool = _ConnectionPool(self.db_path)
+        self._indexed = False
+        self._finalizer = weakref.finalize(self, self._pool.close)
 
     # ── INTERNAL ──────────────────────────────────────────────────────────
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
-        return conn
+    def _read(self):
+        """Context manager: a read-only pooled connection (sqlite3.Row rows)."""
+        return self._pool.reader()
+
+    def _write(self):
+        """Context manager: the single pooled write connection."""
+        return self._pool.writer()
+
+    def _write_txn(self):
+        """Context manager: the pooled writer inside BEGIN IMMEDIATE ... COMMIT."""
+        return self._pool.write_txn()
+
+    def close(self) -> None:
+        """Close every pooled connection. The API reconnects lazily if used again."""
+        self._pool.close()
 
     def _db_exists(self) -> bool:
-        return self.db_path.exists()
+        if self._db_exists_bit:
+            return True
+        if os.path.exists(self._db_path_str):
+            self._db_exists_bit = True
+            return True
+        return False
+
+    def _ensure_indexes(self) -> None:
+        """
+        Add the list-query indexes to databases exported before they existed.
+        Runs once per instance; failure (read-only media, missing tables) only
+        costs speed, so it is logged rather than raised.
+        """
+        if self._indexed:
+            return
+        from sentinel.exporters.sqlite_exporter import QUERY_INDEXES
+        try:
+            with self._write_txn() as conn:
+                for stmt in QUERY_INDEXES:
+                    conn.execute(stmt)
+        except sqlite3.Error as exc:
+            logger.warning(f"Could not create query indexes on {self.db_path}: {exc}")
+        self._indexed = True
+
+    def _iter_rows(self, sql: str, params: list) -> Iterator[Dict[str, Any]]:
+        # The reader stays checked out until the generator is exhausted or closed
+        with self._read() as conn:
+            cur  = conn.execute(sql, params)
+            keys = tuple(d[0] for d in cur.description)   # once per statement
+            for row in cur:
+                yield self._row_to_dict(row, keys)
 
     @staticmethod
-    def _row_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
-        d = {k: row[k] for k in row.keys()}
-        # Deserialize JSON fields
-        for field in ("kw_categories", "ai_categories", "context_before",
-                      "context_after", "category_breakdown", "relationship_tags"):
-            if field in d and d[field] is not None:
+    def _row_to_dict(
+        row:  sqlite3.Row,
+        keys: Optional[tuple] = None,
+    ) -> Dict[str, Any]:
+        """
+        Row → dict with JSON columns decoded (left as-is if malformed).
+        keys: column names from cursor.description, when the caller has them.
+        """
+        if keys is None:
+            d = {k: row[k] for k in row.keys()}
+        else:
+            d = dict(zip(keys, row))
+        for field in _JSON_FIELDS.intersection(d):
+            value = d[field]
+            if value:
                 try:
-                    d[field] = json.loads(d[field])
-                except (json.JSONDecodeError, TypeError):
+                    d[field] = json_codec.loads(value)
+                except (json_codec.JSONDecodeError, TypeError):
                     pass  # leave as-is
         return d
 
@@ -117,46 +579,70 @@ class SentinelAPI:
         risk_label: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
+        """List form of iter_contacts() — same arguments."""
+        return list(self.iter_contacts(risk_label, limit, offset, cursor))
+
+    def iter_contacts(
+        self,
+        risk_label: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        with_total: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Return contact profiles sorted by risk_score DESC.
+        Yield contact profiles sorted by risk_score DESC (phone_number DESC on ties).
+        Rows are decoded one at a time as SQLite steps the cursor; arguments are
+        validated before the first row is read.
 
         Args:
             risk_label: filter by label — "LOW", "MEDIUM", "HIGH", "CRITICAL"
             limit:      max rows returned (default 100, max enforced: 500)
-            offset:     pagination offset
+            offset:     pagination offset — ignored when cursor is given
+            cursor:     next_cursor(previous page, limit, CONTACT_CURSOR_KEYS);
+                        seeks via the index instead of skipping `offset` rows.
+                        Raises ValueError if malformed.
+            with_total: add TOTAL_COLUMN to every row — the number of rows
+                        matching the filters (from the cursor position, if
+                        given). Costs a full pass over the matches, so only
+                        request it when the caller shows a total.
         """
         if not self._db_exists():
-            return []
+            return iter(())
+        self._ensure_indexes()
 
         limit = min(int(limit), 500)
         offset = max(int(offset), 0)
 
-        sql = "SELECT * FROM contact_profiles"
-        params: list = []
+        label = _canonical_label(risk_label, _RISK_LABELS) if risk_label else None
 
+        params: list = []
         if risk_label:
-            sql += " WHERE risk_label = ?"
-            params.append(risk_label.upper())
-
-        sql += " ORDER BY risk_score DESC LIMIT ? OFFSET ?"
+            params.append(label)
+        if cursor:
+            params += _decode_cursor(cursor, ((int, float), str))
+            offset = 0
+        if risk_label and label is None:
+            return iter(())   # not a risk label — nothing can match
         params += [limit, offset]
 
-        with self._connect() as conn:
-            rows = conn.execute(sql, params).fetchall()
-        return [self._row_to_dict(r) for r in rows]
+        sql = _SQL_CONTACTS[bool(risk_label), bool(cursor), with_total]
+        return self._iter_rows(sql, params)
 
     def get_contact(self, phone: str) -> Optional[Dict[str, Any]]:
         """
         Return a single contact profile by phone number.
+        Falls back to the number without "-() ." when the exact form is not
+        stored, so "+1 612-555-0001" finds "+16125550001".
         Returns None if not found.
         """
         if not self._db_exists():
             return None
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
-                "SELECT * FROM contact_profiles WHERE phone_number = ?",
-                (phone,)
+                _SQL_CONTACT_BY_PHONE, (phone, _normalize_phone(phone), phone)
             ).fetchone()
         return self._row_to_dict(row) if row else None
 
@@ -168,38 +654,55 @@ class SentinelAPI:
         severity: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
+        """List form of iter_messages() — same arguments."""
+        return list(self.iter_messages(phone, severity, limit, offset, cursor))
+
+    def iter_messages(
+        self,
+        phone: Optional[str] = None,
+        severity: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        with_total: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Return flagged intent_results.
+        Yield flagged intent_results, newest first (lazily, like iter_contacts).
 
         Args:
             phone:    filter by phone_number
             severity: filter by ai_severity — "HIGH", "MEDIUM", "LOW"
             limit:    max rows (default 50, max enforced: 200)
-            offset:   pagination offset
+            offset:   pagination offset — ignored when cursor is given
+            cursor:   next_cursor(previous page, limit, MESSAGE_CURSOR_KEYS).
+                      Raises ValueError if malformed.
+            with_total: add TOTAL_COLUMN to every row, as in iter_contacts.
         """
         if not self._db_exists():
-            return []
+            return iter(())
+        self._ensure_indexes()
 
         limit = min(int(limit), 200)
         offset = max(int(offset), 0)
 
-        sql = "SELECT * FROM intent_results WHERE 1=1"
-        params: list = []
+        label = _canonical_label(severity, _SEVERITIES) if severity else None
 
+        params: list = []
         if phone:
-            sql += " AND phone_number = ?"
             params.append(phone)
         if severity:
-            sql += " AND ai_severity = ?"
-            params.append(severity.upper())
-
-        sql += " ORDER BY message_ts_ms DESC LIMIT ? OFFSET ?"
+            params.append(label)
+        if cursor:
+            params += _decode_cursor(cursor, (int, int))
+            offset = 0
+        if severity and label is None:
+            return iter(())   # not a severity — nothing can match
         params += [limit, offset]
 
-        with self._connect() as conn:
-            rows = conn.execute(sql, params).fetchall()
-        return [self._row_to_dict(r) for r in rows]
+        sql = _SQL_MESSAGES[bool(phone), bool(severity), bool(cursor), with_total]
+        return self._iter_rows(sql, params)
 
     # ── QUERY: META ───────────────────────────────────────────────────────
 
@@ -207,20 +710,85 @@ class SentinelAPI:
         """Return the most recent run metadata row."""
         if not self._db_exists():
             return None
-        with self._connect() as conn:
-            row = conn.execute(
-                "SELECT * FROM sentinel_meta ORDER BY id DESC LIMIT 1"
-            ).fetchone()
+        with self._read() as conn:
+            return self._latest_meta(conn)
+
+    @staticmethod
+    def _latest_meta(conn: sqlite3.Connection) -> Optional[Dict[str, Any]]:
+        row = conn.execute(_SQL_LATEST_META).fetchone()
         if not row:
             return None
         d = dict(row)
         if d.get("notes"):
             try:
-                d["notes"] = json.loads(d["notes"])
-            except (json.JSONDecodeError, TypeError):
+                d["notes"] = json_codec.loads(d["notes"])
+            except (json_codec.JSONDecodeError, TypeError):
                 pass
         return d
 
+    # ── QUERY: ETAG ───────────────────────────────────────────────────────
+
+    def get_etag(self) -> Optional[str]:
+        """
+        Quoted ETag for the current scan data, or None before the first scan.
+        Changes whenever an export runs, contact profiles are rebuilt, or
+        recordings are added.
+        """
+        if not self._db_exists():
+            return None
+        with self._read() as conn:
+            try:
+                row = conn.execute(_SQL_ETAG).fetchone()
+            except sqlite3.OperationalError:
+                return None   # schema not created yet
+            if row is None:
+                return None
+            try:
+                recordings = conn.execute(_SQL_ETAG_RECORDINGS).fetchone()[0]
+            except sqlite3.OperationalError:
+                recordings = None   # no recordings table
+        version = f"{API_VERSION}:{row[0]}:{row[1]}:{recordings}".encode()
+        return '"' + hashlib.blake2b(version, digest_size=8).hexdigest() + '"'
+
+    # ── QUERY: DASHBOARD ──────────────────────────────────────────────────
+
+    def get_dashboard(
+        self,
+        contact_relationships: Optional[Dict[str, List[str]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        aggregate(), build_personalized_system_prompt() and get_meta() in one
+        call — one pooled reader and one read transaction (a consistent
+        snapshot) instead of three separate connections.
+
+        Returns {"aggregate": {...}, "prompt": str, "meta": {...} | None}.
+        """
+        from dataclasses import asdict
+        from sentinel.aggregation import aggregate
+        from sentinel.personalization import build_personalized_system_prompt
+
+        if not self._db_exists():
+            return {
+                "aggregate": asdict(aggregate(self.db_path)),
+                "prompt":    build_personalized_system_prompt(
+                    self.db_path, contact_relationships=contact_relationships,
+                ),
+                "meta":      None,
+            }
+        with self._read() as conn:
+            conn.execute("BEGIN")
+            try:
+                return {
+                    "aggregate": asdict(aggregate(self.db_path, conn=conn)),
+                    "prompt":    build_personalized_system_prompt(
+                        self.db_path, contact_relationships=contact_relationships,
+                        conn=conn,
+                    ),
+                    "meta":      self._latest_meta(conn),
+                }
+            finally:
+                conn.execute("COMMIT")
+
     # ── SCAN: FULL PIPELINE ───────────────────────────────────────────────
 
     def run_scan(
@@ -231,17 +799,28 @@ class SentinelAPI:
         keyword_only: bool = False,
         address: Optional[str] = None,
         run_label: str = "",
+        concurrency: Optional[int] = None,
+        llm_cache: bool = False,
     ) -> Dict[str, Any]:
         """
         Run the full MIND Sentinel pipeline:
           parse XML → detect intents → build contact profiles → export to DB.
 
+        concurrency: LLM requests in flight at once; None reads
+        ollama_concurrency from sentinel_config.json (default 1). Raise it
+        only to match the server's OLLAMA_NUM_PARALLEL — requests beyond
+        that queue against the client timeout. Candidates per LLM request
+        come from ollama_batch_size (default 1).
+        llm_cache: also keep LLM answers in sentinel_llm_cache.sqlite next to
+        the DB for later scans. Off by default — the file quotes message
+        content outside sentinel.db. Repeats within one scan are always
+        answered from memory.
         Returns a summary dict with counts.
 
         Security: xml_dir is validated — must be an existing directory.
         No shell execution. All operations are in-process Python.
         """
-        xml_dir = Path(xml_dir).resolve()
+        xml_dir = _resolve_dir(os.fspath(xml_dir))
 
         # ── Input validation ───────────────────────────────────────────
         if not xml_dir.exists():
@@ -251,29 +830,16 @@ class SentinelAPI:
         # Prevent path traversal — resolved path must not escape expected roots
         # (best-effort; Termux typically uses /sdcard or /data/data/...)
 
-        # ── Pipeline imports (deferred to avoid circular imports) ──────
-        from sentinel.parsers.sms_parser   import parse_sms_directory
-        from sentinel.parsers.call_parser  import parse_call_directory
-        from sentinel.detectors.intent_detector import run_full_analysis
-        from sentinel.exporters.sqlite_exporter import export
-        from sentinel.aggregators.contact_aggregator import build_contact_profiles
-
         try:
-            contact_rels: Dict[str, str] = {}
-            try:
-                from sentinel.uplifts.extractor import CONTACT_RELATIONSHIPS
-                contact_rels = CONTACT_RELATIONSHIPS
-            except ImportError:
-                pass  # optional module — not required
+            pipeline = _get_pipeline()
 
             logger.info(f"Scan started | xml_dir={xml_dir} | db={self.db_path}")
 
-            messages = parse_sms_directory(xml_dir)
-            calls    = parse_call_directory(xml_dir)
-
-            if address:
-                messages = [m for m in messages if m.phone_number == address]
-                calls    = [c for c in calls    if c.phone_number == address]
+            # Surgical mode: the parsers drop other addresses before building records
+            messages = pipeline.sms_parser.parse_sms_directory(
+                xml_dir, address_filter=address or None)
+            calls    = pipeline.call_parser.parse_call_directory(
+                xml_dir, address_filter=address or None)
 
             llm = None
             if not keyword_only:
@@ -282,28 +848,49 @@ class SentinelAPI:
                 if not llm.is_available():
                     logger.warning("Ollama unavailable — falling back to keyword-only")
                     llm = None
+                else:
+                    from sentinel.llm.cache import CACHE_FILENAME, CachedLLMAdapter
+                    llm = CachedLLMAdapter(
+                        llm, persist_path=(self.db_path.parent / CACHE_FILENAME
+                                           if llm_cache else None),
+                    )
+            batch_size = 1
+            if llm is not None:
+                from sentinel.config import load_config
+                config = load_config(Path.cwd())
+                batch_size = config.get("ollama_batch_size", 1)
+                if concurrency is None:
+                    concurrency = config.get("ollama_concurrency", 1)
 
-            intents = run_full_analysis(
-                messages,
-                llm            = llm,
-                context_window = 2,
-            )
+            try:
+                intents = pipeline.intent_detector.run_full_analysis(
+                    messages,
+                    llm            = llm,
+                    context_window = 2,
+                    concurrency    = concurrency or 1,
+                    batch_size     = batch_size,
+                )
+            finally:
+                if llm is not None:
+                    llm.close()
 
-            profiles = build_contact_profiles(
+            profiles = pipeline.contact_aggregator.build_contact_profiles(
                 messages        = messages,
                 calls           = calls,
-                intent_results  = intents,
-                contact_relationships = contact_rels,
+                intents         = intents,
+                contact_relationships = pipeline.contact_relationships,
             )
 
-            export(
-                db_path          = self.db_path,
-                messages         = messages,
-                calls            = calls,
-                intents          = intents,
-                contact_profiles = profiles,
-                run_label        = run_label or "api-scan",
-            )
+            with self._write() as conn:
+                pipeline.sqlite_exporter.export(
+                    db_path          = self.db_path,
+                    messages         = messages,
+                    calls            = calls,
+                    intents          = intents,
+                    contact_profiles = profiles,
+                    run_label        = run_label or "api-scan",
+                    conn             = conn,
+                )
 
             summary = {
                 "status":           "ok",
@@ -316,6 +903,7 @@ class SentinelAPI:
                     1 for p in profiles if p.risk_label in ("HIGH", "CRITICAL")
                 ),
             }
+            self._db_exists_bit = True
             logger.info(f"Scan complete: {summary}")
             return summary
 
@@ -341,10 +929,14 @@ def _build_app(db_path: Path = Path("sentinel.db")) -> "FastAPI":  # type: ignor
 
     _api = SentinelAPI(db_path=db_path)
 
+    # ORJSONResponse needs orjson at response time — fall back without it
     _app = FastAPI(
+        default_response_class = (
+            ORJSONResponse if json_codec._ORJSON_AVAILABLE else JSONResponse
+        ),
         title       = "MIND Sentinel API",
         description = "Offline SMS & Call Log Intent Analyzer — local API for M.I.N.D. Gateway",
-        version     = "2.4.0",
+        version     = API_VERSION,
         docs_url    = "/docs",   # Swagger UI — useful during dev
         redoc_url   = None,
     )
@@ -374,6 +966,71 @@ def _build_app(db_path: Path = Path("sentinel.db")) -> "FastAPI":  # type: ignor
         address:      Optional[str] = None
         run_label:    str = ""
         db_path:      Optional[str] = None  # override db path for this scan
+        concurrency:  Optional[int] = None  # LLM requests in flight; config default
+        llm_cache:    bool = False          # persist LLM answers next to the DB
+
+    # ── CACHED BODIES ───────────────────────────────────────────────────
+    # Responses that do not change while the server runs are serialized once.
+
+    def _json_response(body: bytes) -> "Response":
+        return Response(body, media_type="application/json")
+
+    @functools.lru_cache(maxsize=None)
+    def _store_doc(name: str) -> bytes:
+        # Errors are not cached — a failed read is retried on the next request
+        from sentinel import store_docs
+        builders = {
+            "listing":     store_docs.get_listing,
+            "privacy":     lambda: {"content": store_docs.get_privacy(), "format": "markdown"},
+            "data-safety": store_docs.get_data_safety,
+            "legal":       store_docs.get_legal,
+        }
+        return json_codec.dumps(builders[name]()).encode()
+
+    # Only db_exists varies — one prebuilt body per value
+    _health_bodies = {
+        exists: json_codec.dumps({
+            "status":    "ok",
+            "db_exists": exists,
+            "db_path":   str(_api.db_path),
+            "version":   API_VERSION,
+        }).encode()
+        for exists in (False, True)
+    }
+
+    # Sync DB work runs on worker threads, at most one per pooled reader, so
+    # concurrent requests never queue inside the connection pool itself.
+    _db_limiter = anyio.CapacityLimiter(_api._pool.reader_count)
+
+    async def _run_db(fn, *args, **kwargs):
+        return await anyio.to_thread.run_sync(
+            functools.partial(fn, *args, **kwargs), limiter=_db_limiter,
+        )
+
+    async def _threaded_chunks(chunks: Iterator[bytes], batch: int = 256):
+        """
+        Drive a sync byte iterator (which steps a SQLite cursor) on the DB
+        limiter, joining up to `batch` pieces per thread hop.
+        """
+        take = lambda: b"".join(itertools.islice(chunks, batch))
+        try:
+            while data := await anyio.to_thread.run_sync(take, limiter=_db_limiter):
+                yield data
+        finally:
+            chunks.close()   # client gone early → release the pooled reader
+
+    def _not_modified(request: "Request", etag: Optional[str]) -> Optional["Response"]:
+        """304 response when the client already holds `etag`, else None."""
+        if etag and _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        return None
+
+    def _etag_headers(etag: Optional[str]) -> Dict[str, str]:
+        return {"ETag": etag} if etag else {}
+
+    # GET /config body; cleared by POST /config (restart to pick up edits to
+    # the config file made outside the API)
+    _config_body: Dict[str, bytes] = {}
 
     # ── ENDPOINTS ───────────────────────────────────────────────────────
 
@@ -396,8 +1053,10 @@ def _build_app(db_path: Path = Path("sentinel.db")) -> "FastAPI":  # type: ignor
         if not xml_dir_val:
             from sentinel.config import load_config, auto_detect_xml_dir
             cfg = load_config(Path.cwd())
-            detected = auto_detect_xml_dir()
-            xml_dir_val = cfg.get("xml_dir") or (str(detected) if detected else None)
+            xml_dir_val = cfg.get("xml_dir")
+            if not xml_dir_val:
+                detected = auto_detect_xml_dir()
+                xml_dir_val = str(detected) if detected else None
             if not xml_dir_val:
                 raise HTTPException(status_code=400, detail="xml_dir required. Run onboarding or provide in request.")
         scan_api = _api
@@ -412,8 +1071,10 @@ def _build_app(db_path: Path = Path("sentinel.db")) -> "FastAPI":  # type: ignor
                 keyword_only = req.keyword_only,
                 address      = req.address,
                 run_label    = req.run_label,
+                concurrency  = req.concurrency,
+                llm_cache    = req.llm_cache,
             )
-            return JSONResponse(content=result, status_code=200)
+            return Response(json_codec.dumps(result), media_type="application/json")
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc))
         except Exception as exc:
@@ -421,29 +1082,49 @@ def _build_app(db_path: Path = Path("sentinel.db")) -> "FastAPI":  # type: ignor
             raise HTTPException(status_code=500, detail=f"Scan failed: {exc}")
 
     @_app.get("/contacts", summary="List all contact profiles")
-    def get_contacts(
+    async def get_contacts(
+        request:    Request,
         risk_label: Optional[str] = Query(None, description="Filter: LOW, MEDIUM, HIGH, CRITICAL"),
         limit:      int           = Query(100,  ge=1, le=500),
         offset:     int           = Query(0,    ge=0),
+        cursor:     Optional[str] = Query(None, description="next_cursor from the previous page"),
+        with_total: bool          = Query(False, description="Include total matching rows"),
     ):
         """
         Returns contact profiles sorted by risk_score descending.
+        Pass the returned next_cursor to fetch the following page (null on the last).
+        with_total=true adds "total" (rows matching the filters) in the same query.
         Profiles are SPECULATIVE — risk score not validated against clinical data.
         """
         try:
-            data = _api.get_contacts(risk_label=risk_label, limit=limit, offset=offset)
-            return {"count": len(data), "contacts": data}
+            etag = await _run_db(_api.get_etag)
+            if (cached := _not_modified(request, etag)) is not None:
+                return cached
+            rows = await _run_db(
+                _api.iter_contacts,
+                risk_label=risk_label, limit=limit, offset=offset, cursor=cursor,
+                with_total=with_total,
+            )
+            return StreamingResponse(
+                _threaded_chunks(
+                    _stream_page("contacts", rows, limit, CONTACT_CURSOR_KEYS, with_total)
+                ),
+                media_type="application/json",
+                headers=_etag_headers(etag),
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc))
 
     @_app.get("/contacts/{phone}", summary="Get single contact profile")
-    def get_contact(phone: str):
+    async def get_contact(phone: str):
         """
         phone should be URL-encoded: +16125550001 → %2B16125550001
         Returns 404 if contact not found in DB.
         """
         try:
-            data = _api.get_contact(phone)
+            data = await _run_db(_api.get_contact, phone)
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc))
         if data is None:
@@ -451,29 +1132,50 @@ def _build_app(db_path: Path = Path("sentinel.db")) -> "FastAPI":  # type: ignor
         return data
 
     @_app.get("/messages", summary="List flagged messages")
-    def get_messages(
+    async def get_messages(
+        request:  Request,
         phone:    Optional[str] = Query(None, description="Filter by phone number"),
         severity: Optional[str] = Query(None, description="Filter: HIGH, MEDIUM, LOW"),
         limit:    int           = Query(50,   ge=1, le=200),
         offset:   int           = Query(0,    ge=0),
+        cursor:   Optional[str] = Query(None, description="next_cursor from the previous page"),
+        with_total: bool        = Query(False, description="Include total matching rows"),
     ):
         """
         Returns flagged intent_results (messages that triggered detection).
         Sorted by timestamp descending (newest first).
+        Pass the returned next_cursor to fetch the following page (null on the last).
+        with_total=true adds "total" (rows matching the filters) in the same query.
         """
         try:
-            data = _api.get_messages(
-                phone=phone, severity=severity, limit=limit, offset=offset
+            etag = await _run_db(_api.get_etag)
+            if (cached := _not_modified(request, etag)) is not None:
+                return cached
+            rows = await _run_db(
+                _api.iter_messages,
+                phone=phone, severity=severity, limit=limit, offset=offset, cursor=cursor,
+                with_total=with_total,
             )
-            return {"count": len(data), "messages": data}
+            return StreamingResponse(
+                _threaded_chunks(
+                    _stream_page("messages", rows, limit, MESSAGE_CURSOR_KEYS, with_total)
+                ),
+                media_type="application/json",
+                headers=_etag_headers(etag),
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc))
 
     @_app.get("/meta", summary="Last run metadata")
-    def get_meta():
+    async def get_meta(request: Request, response: Response):
         """Returns the most recent sentinel_meta row (last scan run info)."""
         try:
-            data = _api.get_meta()
+            etag = await _run_db(_api.get_etag)
+            if (cached := _not_modified(request, etag)) is not None:
+                return cached
+            data = await _run_db(_api.get_meta)
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc))
         if data is None:
@@ -481,19 +1183,26 @@ def _build_app(db_path: Path = Path("sentinel.db")) -> "FastAPI":  # type: ignor
                 status_code=404,
                 detail="No scan metadata found — run a scan first."
             )
+        response.headers.update(_etag_headers(etag))
         return data
 
     @_app.get("/config", summary="Get config (for automation)")
-    def get_config():
+    async def get_config():
         """Returns current config with auto-detected paths. Used by onboarding."""
-        try:
+        def build_body() -> bytes:
             from sentinel.config import load_config, auto_detect_xml_dir
             config = load_config(Path.cwd())
             detected = auto_detect_xml_dir()
-            return {
+            return json_codec.dumps({
                 "config": config,
                 "auto_detected_xml_dir": str(detected) if detected else None,
-            }
+            }).encode()
+
+        try:
+            if "body" not in _config_body:
+                # File reads + directory probing — keep them off the event loop
+                _config_body["body"] = await anyio.to_thread.run_sync(build_body)
+            return _json_response(_config_body["body"])
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc))
 
@@ -505,14 +1214,39 @@ def _build_app(db_path: Path = Path("sentinel.db")) -> "FastAPI":  # type: ignor
             config = load_config(Path.cwd())
             config.update(update or {})
             save_config(config)
+            _config_body.clear()
             return {"status": "ok", "config": config}
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc))
 
+    @_app.get("/dashboard", summary="Aggregate + personalized prompt + meta in one call")
+    async def get_dashboard(request: Request, response: Response):
+        """
+        Looking Glass dashboard load: /aggregate, /personalized-prompt and /meta
+        bodies under one envelope, read through a single pooled connection.
+        """
+        try:
+            etag = await _run_db(_api.get_etag)
+            if (cached := _not_modified(request, etag)) is not None:
+                return cached
+            response.headers.update(_etag_headers(etag))
+            try:
+                from sentinel.uplifts.extractor import CONTACT_RELATIONSHIPS
+                rels = CONTACT_RELATIONSHIPS
+            except ImportError:
+                rels = {}
+            return await _run_db(_api.get_dashboard, rels)
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc))
+
     @_app.get("/aggregate", summary="Nous architecture aggregation")
-    def get_aggregate():
+    def get_aggregate(request: Request, response: Response):
         """Unified aggregation for nous-hub, nous-vault, said-node."""
         try:
+            etag = _api.get_etag()
+            if (cached := _not_modified(request, etag)) is not None:
+                return cached
+            response.headers.update(_etag_headers(etag))
             from sentinel.aggregation import aggregate
             from dataclasses import asdict
             summary = aggregate(_api.db_path)
@@ -521,9 +1255,13 @@ def _build_app(db_path: Path = Path("sentinel.db")) -> "FastAPI":  # type: ignor
             raise HTTPException(status_code=500, detail=str(exc))
 
     @_app.get("/personalized-prompt", summary="Personalized system prompt")
-    def get_personalized_prompt():
+    def get_personalized_prompt(request: Request, response: Response):
         """Build personalized prompt from messages, uplifts, audio transcripts."""
         try:
+            etag = _api.get_etag()
+            if (cached := _not_modified(request, etag)) is not None:
+                return cached
+            response.headers.update(_etag_headers(etag))
             from sentinel.personalization import build_personalized_system_prompt
             try:
                 from sentinel.uplifts.extractor import CONTACT_RELATIONSHIPS
@@ -539,6 +1277,8 @@ def _build_app(db_path: Path = Path("sentinel.db")) -> "FastAPI":  # type: ignor
 
     @_app.get("/uplifts", summary="Extract uplifting messages for Looking Glass")
     def get_uplifts(
+        request:        Request,
+        response:       Response,
         top:            int           = Query(50,   ge=1, le=200),
         contact_filter: Optional[str] = Query(None),
         min_score:      int           = Query(4,    ge=0, le=20),
@@ -548,21 +1288,18 @@ def _build_app(db_path: Path = Path("sentinel.db")) -> "FastAPI":  # type: ignor
         Returns JSON array compatible with Looking Glass PERSONAL_UPLIFTS_DATA.
         """
         try:
+            etag = _api.get_etag()
+            if (cached := _not_modified(request, etag)) is not None:
+                return cached
+            response.headers.update(_etag_headers(etag))
             from sentinel.uplifts.extractor import extract_uplifts
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-                tmp_path = f.name
-            try:
-                uplifts = extract_uplifts(
-                    db_path        = str(_api.db_path),
-                    output_path    = tmp_path,
-                    top            = top,
-                    min_score      = min_score,
-                    contact_filter = contact_filter,
-                )
-                return uplifts
-            finally:
-                Path(tmp_path).unlink(missing_ok=True)
+            return extract_uplifts(
+                db_path        = str(_api.db_path),
+                output_path    = None,
+                top            = top,
+                min_score      = min_score,
+                contact_filter = contact_filter,
+            )
         except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Database not found")
         except Exception as exc:
@@ -570,50 +1307,41 @@ def _build_app(db_path: Path = Path("sentinel.db")) -> "FastAPI":  # type: ignor
             raise HTTPException(status_code=500, detail=str(exc))
 
     @_app.get("/health", summary="Health check")
-    def health():
+    async def health():
         """Returns server status and db existence. Used by Looking Glass ping."""
-        return {
-            "status":    "ok",
-            "db_exists": _api.db_path.exists(),
-            "db_path":   str(_api.db_path),
-            "version":   "2.4.0",
-        }
+        return _json_response(_health_bodies[_api._db_exists()])
 
     # ── GOOGLE PLAY STORE DOCS (standalone app) ────────────────────────────
 
     @_app.get("/store/listing", summary="Play Store listing")
-    def store_listing():
+    async def store_listing():
         """Google Play Store listing — short/full description, features, contact."""
         try:
-            from sentinel.store_docs import get_listing
-            return get_listing()
+            return _json_response(_store_doc("listing"))
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc))
 
     @_app.get("/store/privacy", summary="Privacy policy")
-    def store_privacy():
+    async def store_privacy():
         """Privacy policy — required in-app for Play Store."""
         try:
-            from sentinel.store_docs import get_privacy
-            return {"content": get_privacy(), "format": "markdown"}
+            return _json_response(_store_doc("privacy"))
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc))
 
     @_app.get("/store/data-safety", summary="Data Safety declaration")
-    def store_data_safety():
+    async def store_data_safety():
         """Google Play Data Safety section — for Play Console and in-app display."""
         try:
-            from sentinel.store_docs import get_data_safety
-            return get_data_safety()
+            return _json_response(_store_doc("data-safety"))
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc))
 
     @_app.get("/store/legal", summary="All store docs combined")
-    def store_legal():
+    async def store_legal():
         """Combined listing, privacy, data safety — for standalone app legal screen."""
         try:
-            from sentinel.store_docs import get_legal
-            return get_legal()
+            return _json_response(_store_doc("legal"))
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc))
 
@@ -22,6 +22,7 @@ EXAMPLES:
 
 import argparse
 import logging
+import os
 import sys
 import time
 from pathlib import Path
@@ -29,18 +30,31 @@ from pathlib import Path
 from sentinel.parsers.sms_parser  import parse_sms_directory
 from sentinel.parsers.call_parser import parse_call_directory
 from sentinel.detectors.intent_detector import run_full_analysis
-from sentinel.exporters.sqlite_exporter import export
+from sentinel.exporters.sqlite_exporter import connect, export
 from sentinel.aggregators.contact_aggregator import build_contact_profiles
 
 logger = logging.getLogger(__name__)
 
+def _use_color() -> bool:
+    # NO_COLOR / FORCE_COLOR conventions (set and non-empty), else TTY only
+    if os.environ.get('NO_COLOR'):
+        return False
+    if os.environ.get('FORCE_COLOR'):
+        return True
+    return sys.stdout.isatty()
+
+
+# Redirected output (log files, CI) gets a throttled progress bar and no colors
+_IS_TTY    = sys.stdout.isatty()
+_USE_COLOR = _use_color()
+
 # ANSI colors — disabled automatically on Windows if not supported
-GREEN  = '\033[92m'
-YELLOW = '\033[93m'
-RED    = '\033[91m'
-CYAN   = '\033[96m'
-RESET  = '\033[0m'
-BOLD   = '\033[1m'
+GREEN  = '\033[92m' if _USE_COLOR else ''
+YELLOW = '\033[93m' if _USE_COLOR else ''
+RED    = '\033[91m' if _USE_COLOR else ''
+CYAN   = '\033[96m' if _USE_COLOR else ''
+RESET  = '\033[0m'  if _USE_COLOR else ''
+BOLD   = '\033[1m'  if _USE_COLOR else ''
 
 
 def main():
@@ -90,6 +104,42 @@ LEGAL NOTICE:
         default = 2,
         help    = 'Messages before/after for context (default: 2)',
     )
+    parser.add_argument(
+        '--concurrency',
+        type    = int,
+        default = None,
+        help    = 'LLM requests in flight at once (default: ollama_concurrency '
+                  'from sentinel_config.json, else 1). Only helps when Ollama '
+                  'runs with OLLAMA_NUM_PARALLEL > 1',
+    )
+    parser.add_argument(
+        '--batch-size',
+        type    = int,
+        default = None,
+        help    = 'Candidates classified per LLM request (default: ollama_batch_size '
+                  'from sentinel_config.json, else 1)',
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type    = int,
+        default = 1,
+        help    = 'Worker processes for XML parsing, 0 = one per CPU; >1 also '
+                  'parses SMS and call logs side by side (default: 1)',
+    )
+    parser.add_argument(
+        '--sqlite-unsafe',
+        action  = 'store_true',
+        help    = 'Write the database without journal or fsync (synchronous=OFF, '
+                  'journal_mode=MEMORY) — faster, but a crash or power loss '
+                  'mid-write can corrupt it (throwaway runs only)',
+    )
+    parser.add_argument(
+        '--llm-cache',
+        action  = 'store_true',
+        help    = 'Keep LLM answers in sentinel_llm_cache.sqlite next to the '
+                  'output database and reuse them on later runs. The file '
+                  'quotes message content; delete it along with the database',
+    )
     parser.add_argument(
         '--list-models',
         action  = 'store_true',
@@ -182,18 +232,32 @@ LEGAL NOTICE:
     # ── PARSE ────────────────────────────────────────────────
     messages = []
     calls    = []
+    if args.jobs <= 0:
+        args.jobs = os.cpu_count() or 1
 
-    if not args.calls_only:
-        _step("Parsing SMS/MMS files...")
-        t0       = time.time()
-        messages = parse_sms_directory(xml_dir)
-        _ok(f"{len(messages)} messages parsed in {_elapsed(t0)}")
-
-    if not args.sms_only:
-        _step("Parsing call log files...")
-        t0    = time.time()
-        calls = parse_call_directory(xml_dir)
-        _ok(f"{len(calls)} call records parsed in {_elapsed(t0)}")
+    if args.jobs > 1 and not args.calls_only and not args.sms_only:
+        # Both directory parses at once; each fans its files out to -j processes
+        from concurrent.futures import ThreadPoolExecutor
+        _step(f"Parsing SMS/MMS and call log files ({args.jobs} jobs)...")
+        t0 = time.time()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            sms_future  = pool.submit(parse_sms_directory, xml_dir, jobs=args.jobs)
+            call_future = pool.submit(parse_call_directory, xml_dir, jobs=args.jobs)
+            messages    = sms_future.result()
+            calls       = call_future.result()
+        _ok(f"{len(messages)} messages, {len(calls)} call records parsed in {_elapsed(t0)}")
+    else:
+        if not args.calls_only:
+            _step("Parsing SMS/MMS files...")
+            t0       = time.time()
+            messages = parse_sms_directory(xml_dir, jobs=args.jobs)
+            _ok(f"{len(messages)} messages parsed in {_elapsed(t0)}")
+
+        if not args.sms_only:
+            _step("Parsing call log files...")
+            t0    = time.time()
+            calls = parse_call_directory(xml_dir, jobs=args.jobs)
+            _ok(f"{len(calls)} call records parsed in {_elapsed(t0)}")
 
     if not messages and not calls:
         _print(f"\n{YELLOW}No XML files found in {xml_dir}{RESET}")
@@ -218,25 +282,47 @@ LEGAL NOTICE:
                     f"  ollama pull {args.model}\n"
                 )
                 llm = None
+            else:
+                from sentinel.llm.cache import CACHE_FILENAME, CachedLLMAdapter
+                llm = CachedLLMAdapter(
+                    llm, persist_path=(Path(args.output).parent / CACHE_FILENAME
+                                       if args.llm_cache else None),
+                )
+
+        concurrency = args.concurrency
+        batch_size  = args.batch_size
+        if concurrency is None or batch_size is None:
+            from sentinel.config import load_config
+            config = load_config()
+            if concurrency is None:
+                concurrency = config.get('ollama_concurrency', 1)
+            if batch_size is None:
+                batch_size = config.get('ollama_batch_size', 1)
 
         t0 = time.time()
 
         if getattr(args, 'use_ollama_scorer', False) and llm:
             from sentinel.scorer.ollama_scorer import score_messages
+            due = _progress_gate()
+
             def prog(i, total):
-                pct = int((i / total) * 40)
-                bar = '#' * pct + '-' * (40 - pct)
+                if not due(i, total):
+                    return
+                bar = _BARS[(i * 40) // total]
                 sys.stdout.write(f"\r  [{bar}] {i}/{total} scoring...")
                 sys.stdout.flush()
-            intents = score_messages(messages, llm, progress_cb=prog)
+            intents = score_messages(messages, llm, progress_cb=prog, concurrency=concurrency)
             sys.stdout.write('\n')
             _ok(f"{len(intents)} severity scores in {_elapsed(t0)}")
         else:
+            due = _progress_gate()
+
             def progress(current, total, msg):
-                pct = int((current / total) * 40)
-                bar = '#' * pct + '-' * (40 - pct)
-                safe_msg = msg[:40].encode('ascii', errors='replace').decode('ascii')
-                sys.stdout.write(f"\r  [{bar}] {current}/{total} - {safe_msg:<40}")
+                if not due(current, total):
+                    return
+                bar = _BARS[(current * 40) // total]
+                safe_msg = msg[:40].encode('ascii', errors='replace').decode('ascii').ljust(40)
+                sys.stdout.write(f"\r  [{bar}] {current}/{total} - {safe_msg}")
                 sys.stdout.flush()
 
             intents = run_full_analysis(
@@ -244,6 +330,8 @@ LEGAL NOTICE:
                 llm            = llm,
                 context_window = args.context_window,
                 progress_cb    = progress,
+                concurrency    = concurrency,
+                batch_size     = batch_size,
             )
 
             sys.stdout.write('\n')
@@ -252,12 +340,18 @@ LEGAL NOTICE:
                 f"{len(intents)} {mode} flags in {_elapsed(t0)}"
             )
 
+        if hasattr(llm, 'close'):
+            llm.close()   # CachedLLMAdapter: log hit rate, close the sidecar
+
     # ── CONTACT PROFILES (4.2d) ──────────────────────────────
     profiles = build_contact_profiles(messages, calls, intents) if (messages or calls or intents) else []
 
     # ── EXPORT ───────────────────────────────────────────────
     _step("Writing SQLite database...")
     t0 = time.time()
+    pragma_profile = 'fast' if args.sqlite_unsafe else 'safe'
+    # One connection to the output file for export and uplift extraction
+    conn = connect(args.output, pragma_profile)
     export(
         db_path          = args.output,
         messages         = messages,
@@ -265,6 +359,8 @@ LEGAL NOTICE:
         intents          = intents,
         contact_profiles = profiles,
         run_label        = args.run_label or str(xml_dir),
+        conn             = conn,
+        pragma_profile   = pragma_profile,
     )
     _ok(f"Database written in {_elapsed(t0)}")
 
@@ -300,6 +396,7 @@ LEGAL NOTICE:
                 db_path     = str(args.output),
                 output_path = str(args.uplifts_output),
                 top         = args.uplifts_top,
+                conn        = conn,
             )
             _ok(f"{len(uplifts)} uplifts → {args.uplifts_output}")
             _print(f"\n  Open looking_glass/index.html and paste your uplifts.json path.")
@@ -307,6 +404,8 @@ LEGAL NOTICE:
         except Exception as e:
             _print(f"  {YELLOW}WARN: Uplift extraction failed: {e}{RESET}")
 
+    conn.close()
+
 
 # ── PRINT HELPERS ────────────────────────────────────────────
 
@@ -332,6 +431,31 @@ def _ok(msg):
 
 def _print(msg): print(msg)
 
+# Every 40-column progress bar, built once (ASCII-safe, Phase 0.3b)
+_BARS = tuple('#' * i + '-' * (40 - i) for i in range(41))
+
+def _progress_gate():
+    """
+    Returns due(current, total) for a progress callback: at most ~20 redraws
+    a second on a terminal, ~200 in total when redirected. The final update
+    always draws, so the bar ends at 100%.
+    """
+    last = 0.0
+
+    def due(current: int, total: int) -> bool:
+        nonlocal last
+        if current >= total:
+            return True
+        if not _IS_TTY:
+            return current % max(1, total // 200) == 0
+        now = time.monotonic()
+        if now - last < 0.05:
+            return False
+        last = now
+        return True
+
+    return due
+
 def _elapsed(t0: float) -> str:
     s = time.time() - t0
     return f"{s:.1f}s" if s < 60 else f"{int(s//60)}m {int(s%60)}s"
@@ -6,10 +6,13 @@ Enables fully automated, user-friendly operation.
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from sentinel import json_codec
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +21,8 @@ DEFAULT_CONFIG = {
     "db_path": "sentinel.db",
     "model": "llama3.1:8b",
     "ollama_host": "http://localhost:11434",
+    "ollama_concurrency": 1,   # in-flight LLM requests; raise to match server OLLAMA_NUM_PARALLEL
+    "ollama_batch_size": 1,    # candidates per LLM request (1 = one prompt per message)
     "keyword_only_default": False,
     "auto_scan_on_start": False,
     "onboarding_complete": False,
@@ -41,41 +46,68 @@ def _config_path(project_root: Optional[Path] = None) -> Path:
     return root / "sentinel_config.json"
 
 
+# Parsed sentinel_config.json per path, keyed on (mtime_ns, size): the API
+# reads config on several endpoints and a stat is cheaper than a re-parse.
+_config_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
 def load_config(project_root: Optional[Path] = None) -> Dict[str, Any]:
     """Load config from sentinel_config.json. Returns defaults if missing."""
     path = _config_path(project_root)
-    if path.exists():
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            return {**DEFAULT_CONFIG, **data}
-        except (json.JSONDecodeError, OSError) as e:
-            logger.warning(f"Config load failed: {e}")
-    return dict(DEFAULT_CONFIG)
+    try:
+        st = path.stat()
+    except OSError:
+        return dict(DEFAULT_CONFIG)
+    stamp  = (st.st_mtime_ns, st.st_size)
+    cached = _config_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        # Deep copy: callers edit the returned config (nested dicts too)
+        return copy.deepcopy(cached[1])
+    try:
+        data = json_codec.loads(path.read_bytes())
+        config = {**DEFAULT_CONFIG, **data}
+    except (json.JSONDecodeError, OSError, TypeError) as e:
+        logger.warning(f"Config load failed: {e}")
+        return dict(DEFAULT_CONFIG)
+    _config_cache[path] = (stamp, config)
+    return copy.deepcopy(config)
 
 
 def save_config(config: Dict[str, Any], project_root: Optional[Path] = None) -> Path:
     """Persist config to sentinel_config.json."""
     path = _config_path(project_root)
     path.write_text(json.dumps(config, indent=2), encoding="utf-8")
+    _config_cache.pop(path, None)   # same-size rewrite within mtime granularity
     return path
 
 
+# Last auto-detected directory. Only hits are kept (and re-checked on use),
+# so a backup folder that appears later is still found.
+_detected_xml_dir: Optional[Path] = None
+
+
+def _has_sms_xml(d: Path) -> bool:
+    # Stops at the first match — no full listing of a (possibly network) drive
+    return next(d.glob("sms-*.xml"), None) is not None
+
+
 def auto_detect_xml_dir() -> Optional[Path]:
     """Scan common paths for sms-*.xml files. Returns first match or None."""
+    global _detected_xml_dir
     import os
-    paths_to_check = []
+    if _detected_xml_dir is not None and _has_sms_xml(_detected_xml_dir):
+        return _detected_xml_dir
     for p in AUTO_DETECT_PATHS:
         try:
             expanded = p
             if "{user}" in str(p):
                 expanded = Path(str(p).format(user=os.environ.get("USERNAME", "user")))
-            if expanded.exists() and expanded.is_dir():
-                paths_to_check.append(expanded)
-        except (KeyError, TypeError):
+            if expanded.is_dir() and _has_sms_xml(expanded):
+                _detected_xml_dir = expanded
+                return expanded
+        except (KeyError, TypeError, OSError):
             continue
-    for d in paths_to_check:
-        if list(d.glob("sms-*.xml")):
-            return d
+    _detected_xml_dir = None
     return None
 
 
@@ -7,11 +7,13 @@ Zero-Vector Shield: Ghost records (empty/whitespace body or zero-norm)
 are filtered out before analysis to avoid noise and null injections.
 """
 
+import asyncio
 import logging
-from typing import List, Optional, Callable
+from itertools import filterfalse
+from typing import List, Optional, Callable, Tuple
 
 from sentinel.detectors.keyword_detector import scan_messages
-from sentinel.llm.base import LLMAdapter
+from sentinel.llm.base import LLMAdapter, LLMResponse
 from sentinel.models.record import MessageRecord, IntentResult
 
 logger = logging.getLogger(__name__)
@@ -22,8 +24,9 @@ def _is_ghost_record(msg: MessageRecord) -> bool:
     Norm-check: ignore ghost SMS/call records that would produce zero signal.
     Returns True if the record should be excluded from analysis.
     """
-    body = (msg.body or "").strip()
-    if not body:
+    body = msg.body
+    # isspace() instead of strip(): no copy of every body just to test it
+    if not body or body.isspace():
         return True
     # Optional: exclude zero/negative timestamp (corrupt or placeholder)
     if msg.timestamp_ms <= 0:
@@ -36,6 +39,8 @@ def run_full_analysis(
     llm:            Optional[LLMAdapter] = None,
     context_window: int                  = 2,
     progress_cb:    Optional[Callable]   = None,
+    concurrency:    int                  = 1,
+    batch_size:     int                  = 1,
 ) -> List[IntentResult]:
     """
     Full two-phase analysis pipeline.
@@ -44,18 +49,118 @@ def run_full_analysis(
     Phase 2: LLM confirmation (skipped if llm=None or unavailable)
 
     progress_cb: optional callable(current, total, message) for CLI progress bar.
+    concurrency: LLM requests in flight at once. 1 (default) runs candidates
+                 one by one; >1 runs them as in run_full_analysis_async(), on
+                 a private event loop (in a worker thread if the caller is
+                 itself inside a running loop).
+    batch_size:  candidates per LLM request (llm.analyze_batch()). 1 (default)
+                 sends each on its own; larger batches amortize per-request
+                 overhead on small models but the model sees several messages
+                 at once. Combines with concurrency (batches in flight).
     Returns all confirmed IntentResults sorted by timestamp.
     """
+    candidates, use_llm = _prepare_candidates(messages, llm, context_window)
+
+    if use_llm and concurrency > 1:
+        merged = _run_private_loop(_analyze_concurrently(
+            candidates, llm, progress_cb, concurrency, batch_size))
+        return _finish([r for r in merged if r is not None], candidates)
+
+    if use_llm and batch_size > 1:
+        results: List[IntentResult] = []
+        total = len(candidates)
+        for start, batch in _batches(candidates, batch_size):
+            responses = llm.analyze_batch([_analyze_kwargs(c) for c in batch])
+            for offset, (candidate, response) in enumerate(zip(batch, responses)):
+                i = start + offset
+                if progress_cb:
+                    progress_cb(i + 1, total, f"Analyzing: {candidate.contact_name or candidate.phone_number}")
+                result = _merge_result(candidate, response, True, i)
+                if result is not None:
+                    results.append(result)
+        return _finish(results, candidates)
+
+    # ── PHASE 2 (or keyword-only fallback) ───────────────────
+    results: List[IntentResult] = []
+    total = len(candidates)
+
+    for i, candidate in enumerate(candidates):
+
+        if progress_cb:
+            progress_cb(i + 1, total, f"Analyzing: {candidate.contact_name or candidate.phone_number}")
+
+        response = llm.analyze(**_analyze_kwargs(candidate)) if use_llm else None
+        result = _merge_result(candidate, response, use_llm, i)
+        if result is not None:
+            results.append(result)
+
+    return _finish(results, candidates)
+
+
+def _run_private_loop(coro):
+    """asyncio.run(coro), or in a worker thread when this thread already runs a loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # e.g. SentinelAPI.run_scan() called from async code: asyncio.run() would
+    # raise here, so the gather gets its own loop in a thread (caller blocks,
+    # as it would on the sequential path)
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+async def run_full_analysis_async(
+    messages:       List[MessageRecord],
+    llm:            Optional[LLMAdapter] = None,
+    context_window: int                  = 2,
+    progress_cb:    Optional[Callable]   = None,
+    concurrency:    int                  = 8,
+    batch_size:     int                  = 1,
+) -> List[IntentResult]:
+    """
+    Same pipeline as run_full_analysis(), with up to `concurrency` LLM
+    requests in flight at once. Results are identical; only wall time differs.
+
+    Ollama serves parallel requests only up to OLLAMA_NUM_PARALLEL on the
+    server side — set it (e.g. OLLAMA_NUM_PARALLEL=8) to match `concurrency`.
+    progress_cb is called as each candidate completes (not in record order).
+    batch_size: as in run_full_analysis(); concurrency then counts batches.
+    """
+    candidates, use_llm = _prepare_candidates(messages, llm, context_window)
+    total = len(candidates)
+
+    if not use_llm:
+        results = []
+        for i, candidate in enumerate(candidates):
+            if progress_cb:
+                progress_cb(i + 1, total, f"Analyzing: {candidate.contact_name or candidate.phone_number}")
+            results.append(_merge_result(candidate, None, False, i))
+        return _finish(results, candidates)
+
+    merged = await _analyze_concurrently(candidates, llm, progress_cb, concurrency, batch_size)
+    return _finish([r for r in merged if r is not None], candidates)
+
+
+# ── HELPERS ──────────────────────────────────────────────────
+
+def _prepare_candidates(
+    messages:       List[MessageRecord],
+    llm:            Optional[LLMAdapter],
+    context_window: int,
+) -> Tuple[List[IntentResult], bool]:
+    """Ghost filter + Phase 1 + LLM availability check. Returns (candidates, use_llm)."""
 
     # ── ZERO-VECTOR SHIELD: drop ghost records ─────────────────
-    non_ghost = [m for m in messages if not _is_ghost_record(m)]
+    non_ghost = list(filterfalse(_is_ghost_record, messages))
     dropped = len(messages) - len(non_ghost)
     if dropped:
         logger.info(f"Zero-Vector Shield: excluded {dropped} ghost record(s).")
     messages = non_ghost
     if not messages:
         logger.info("No non-ghost messages — nothing to analyze.")
-        return []
+        return [], False
 
     # ── PHASE 1 ──────────────────────────────────────────────
     logger.info(f"Phase 1: Keyword scan across {len(messages)} messages...")
@@ -64,7 +169,7 @@ def run_full_analysis(
 
     if not candidates:
         logger.info("No candidates — nothing to analyze.")
-        return []
+        return [], False
 
     # ── LLM AVAILABILITY CHECK ────────────────────────────────
     use_llm = False
@@ -79,73 +184,122 @@ def run_full_analysis(
                 "All Phase 1 candidates will be marked confirmed=True.\n"
                 "Start Ollama and re-run to get AI confirmation."
             )
+    return candidates, use_llm
 
-    # ── PHASE 2 (or keyword-only fallback) ───────────────────
-    results: List[IntentResult] = []
-    total = len(candidates)
 
-    for i, candidate in enumerate(candidates):
+async def _analyze_concurrently(
+    candidates:  List[IntentResult],
+    llm:         LLMAdapter,
+    progress_cb: Optional[Callable],
+    concurrency: int,
+    batch_size:  int = 1,
+) -> List[Optional[IntentResult]]:
+    """Phase 2 with a semaphore-bounded gather. Output is in candidate order."""
+    sem   = asyncio.Semaphore(max(1, concurrency))
+    total = len(candidates)
+    done  = 0
 
+    async def one(i: int, candidate: IntentResult) -> Optional[IntentResult]:
+        nonlocal done
+        async with sem:
+            response = await llm.aanalyze(**_analyze_kwargs(candidate))
+        done += 1
         if progress_cb:
-            progress_cb(i + 1, total, f"Analyzing: {candidate.contact_name or candidate.phone_number}")
+            progress_cb(done, total, f"Analyzing: {candidate.contact_name or candidate.phone_number}")
+        return _merge_result(candidate, response, True, i)
 
-        if not use_llm:
-            # Keyword-only: confirm all candidates as-is
-            candidate.confirmed      = True
-            candidate.ai_categories  = candidate.kw_categories
-            candidate.ai_severity    = candidate.kw_severity
-            candidate.flagged_quote  = candidate.body[:300]
-            candidate.context_summary = (
-                f"Keyword detection: {', '.join(candidate.kw_categories)}. "
-                f"No LLM available for deeper analysis."
-            )
-            candidate.detection_mode = 'KEYWORD'
-            results.append(candidate)
-            continue
-
-        # ── LLM ANALYSIS ─────────────────────────────────────
-        response = llm.analyze(
-            body           = candidate.body,
-            direction      = candidate.direction,
-            contact_name   = candidate.contact_name,
-            kw_categories  = candidate.kw_categories,
-            context_before = candidate.context_before,
-            context_after  = candidate.context_after,
+    async def batch_of(start: int, batch: List[IntentResult]) -> List[Optional[IntentResult]]:
+        nonlocal done
+        async with sem:
+            responses = await llm.aanalyze_batch([_analyze_kwargs(c) for c in batch])
+        merged = []
+        for offset, (candidate, response) in enumerate(zip(batch, responses)):
+            done += 1
+            if progress_cb:
+                progress_cb(done, total, f"Analyzing: {candidate.contact_name or candidate.phone_number}")
+            merged.append(_merge_result(candidate, response, True, start + offset))
+        return merged
+
+    if batch_size <= 1:
+        return await asyncio.gather(*(one(i, c) for i, c in enumerate(candidates)))
+    per_batch = await asyncio.gather(*(
+        batch_of(start, batch) for start, batch in _batches(candidates, batch_size)))
+    return [r for batch in per_batch for r in batch]
+
+
+def _batches(candidates: List[IntentResult], size: int):
+    """Yield (start index, slice) pairs of at most `size` candidates."""
+    for start in range(0, len(candidates), size):
+        yield start, candidates[start:start + size]
+
+
+def _analyze_kwargs(candidate: IntentResult) -> dict:
+    return dict(
+        body           = candidate.body,
+        direction      = candidate.direction,
+        contact_name   = candidate.contact_name,
+        kw_categories  = candidate.kw_categories,
+        context_before = candidate.context_before,
+        context_after  = candidate.context_after,
+    )
+
+
+def _merge_result(
+    candidate: IntentResult,
+    response:  Optional[LLMResponse],
+    use_llm:   bool,
+    i:         int,
+) -> Optional[IntentResult]:
+    """Apply the Phase 2 outcome to a candidate. Returns None if dismissed."""
+
+    if not use_llm:
+        # Keyword-only: confirm all candidates as-is
+        candidate.confirmed      = True
+        candidate.ai_categories  = candidate.kw_categories
+        candidate.ai_severity    = candidate.kw_severity
+        candidate.flagged_quote  = candidate.body[:300]
+        candidate.context_summary = (
+            f"Keyword detection: {', '.join(candidate.kw_categories)}. "
+            f"No LLM available for deeper analysis."
         )
+        candidate.detection_mode = 'KEYWORD'
+        return candidate
 
-        if response is None:
-            # LLM call failed — fall back to keyword result
-            logger.warning(f"LLM returned None for record {i} — using keyword result.")
-            candidate.confirmed      = True
-            candidate.ai_categories  = candidate.kw_categories
-            candidate.ai_severity    = candidate.kw_severity
-            candidate.flagged_quote  = candidate.body[:300]
-            candidate.context_summary = "LLM call failed — keyword detection only."
-            candidate.detection_mode = 'AI_FALLBACK'
-            candidate.llm_model      = 'fallback'
-            results.append(candidate)
-            continue
-
-        if not response.confirmed:
-            # LLM dismissed as false positive — skip
+    if response is None:
+        # LLM call failed — fall back to keyword result
+        logger.warning(f"LLM returned None for record {i} — using keyword result.")
+        candidate.confirmed      = True
+        candidate.ai_categories  = candidate.kw_categories
+        candidate.ai_severity    = candidate.kw_severity
+        candidate.flagged_quote  = candidate.body[:300]
+        candidate.context_summary = "LLM call failed — keyword detection only."
+        candidate.detection_mode = 'AI_FALLBACK'
+        candidate.llm_model      = 'fallback'
+        return candidate
+
+    if not response.confirmed:
+        # LLM dismissed as false positive — skip
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Record {i} dismissed by LLM (false positive).")
-            continue
+        return None
+
+    # LLM confirmed — merge results
+    candidate.confirmed      = True
+    candidate.ai_categories  = response.categories
+    candidate.ai_severity    = response.severity
+    candidate.flagged_quote  = response.flagged_quote
+    candidate.context_summary = response.context_summary
+    candidate.llm_model      = response.model_used
+    candidate.detection_mode = 'AI'
+    return candidate
 
-        # LLM confirmed — merge results
-        candidate.confirmed      = True
-        candidate.ai_categories  = response.categories
-        candidate.ai_severity    = response.severity
-        candidate.flagged_quote  = response.flagged_quote
-        candidate.context_summary = response.context_summary
-        candidate.llm_model      = response.model_used
-        candidate.detection_mode = 'AI'
-        results.append(candidate)
-
-    logger.info(
-        f"Analysis complete: {len(results)} confirmed / "
-        f"{len(candidates)} candidates / "
-        f"{len(candidates) - len(results)} dismissed as false positives"
-    )
 
+def _finish(results: List[IntentResult], candidates: List[IntentResult]) -> List[IntentResult]:
+    if candidates:
+        logger.info(
+            f"Analysis complete: {len(results)} confirmed / "
+            f"{len(candidates)} candidates / "
+            f"{len(candidates) - len(results)} dismissed as false positives"
+        )
     results.sort(key=lambda r: r.timestamp_ms)
     return results
@@ -5,7 +5,10 @@ Scans all messages against keyword dictionaries and returns candidates
 for Phase 2 AI analysis. Can also run standalone (no LLM required).
 """
 
-from typing import Dict, List, Tuple
+import re
+from collections import deque
+from itertools import combinations
+from typing import Deque, Dict, FrozenSet, Iterable, Iterator, List, Pattern, Tuple
 from sentinel.models.record import MessageRecord, IntentResult
 
 # ── KEYWORD DICTIONARIES ─────────────────────────────────────
@@ -64,6 +67,40 @@ KEYWORD_MAP: Dict[str, List[str]] = {
     ],
 }
 
+# One alternation per category, compiled once: a message is scanned by the re
+# engine in C once per category instead of once per keyword with `in`.
+# A category matches iff any of its keywords is a substring, as before.
+# Rebuild with compile_keyword_patterns() after editing KEYWORD_MAP at runtime.
+class KeywordPatterns(Dict[str, Pattern[str]]):
+    """Category → compiled alternation, plus the shortest keyword's length."""
+    min_len: int = 1    # bodies shorter than this cannot match anything
+
+
+def compile_keyword_patterns(
+    keyword_map: Dict[str, List[str]],
+) -> KeywordPatterns:
+    # Longest keyword first, duplicates dropped: with search() only "any match"
+    # matters, and this keeps the alternation stable if KEYWORD_MAP is reordered.
+    # Keywords are casefolded like the bodies they are matched against, so an
+    # uppercase or "ß"-style entry cannot silently never match.
+    folded = {
+        category: {k.casefold() for k in keywords}
+        for category, keywords in keyword_map.items()
+        if keywords
+    }
+    patterns = KeywordPatterns(
+        (category, re.compile('|'.join(map(re.escape, sorted(
+            keywords, key=lambda k: (-len(k), k))))))
+        for category, keywords in folded.items()
+    )
+    # At least 1 so empty bodies are always skipped
+    patterns.min_len = max(1, min(
+        (len(k) for keywords in folded.values() for k in keywords), default=1))
+    return patterns
+
+
+KEYWORD_PATTERNS: KeywordPatterns = compile_keyword_patterns(KEYWORD_MAP)
+
 # Severity precedence (highest wins when multiple categories match)
 SEVERITY_RANK = {
     'THREAT':       3,
@@ -84,68 +121,164 @@ def scan_messages(
     """
     results: List[IntentResult] = []
 
-    # Build per-contact message index for context window lookup
+    # Build per-contact message index for context window lookup, remembering
+    # each message's position in its contact's list
     contact_index: Dict[str, List[int]] = {}
-    for i, msg in enumerate(messages):
-        key = msg.phone_number or msg.contact_name
-        contact_index.setdefault(key, []).append(i)
+    positions: List[int] = []
+    for msg in messages:
+        peers = contact_index.setdefault(msg.phone_number or msg.contact_name, [])
+        positions.append(len(peers))
+        peers.append(len(positions) - 1)
+
+    # "[direction] body[:200]" per message, built only when first needed and
+    # shared by every flagged neighbour that includes it as context
+    context_lines: Dict[int, str] = {}
+
+    def context_line(j: int) -> str:
+        line = context_lines.get(j)
+        if line is None:
+            m = messages[j]
+            line = context_lines[j] = f"[{m.direction}] {m.body[:200]}"
+        return line
+
+    # Repeated bodies ("ok", "call me", templated reminders) are matched once
+    verdicts: Dict[str, Tuple[List[str], str]] = {}
+    min_len = KEYWORD_PATTERNS.min_len
 
     for i, msg in enumerate(messages):
-        body_lower = msg.body.lower()
-        if not body_lower.strip():
+        body_cf = (msg.body or '').casefold()
+        # Shorter than every keyword ("ok", "yes", an emoji): cannot match
+        if len(body_cf) < min_len or body_cf.isspace():
             continue
 
-        matched: List[str] = []
-        for category, keywords in KEYWORD_MAP.items():
-            for kw in keywords:
-                if kw in body_lower:
-                    matched.append(category)
-                    break
+        verdict = verdicts.get(body_cf)
+        if verdict is None:
+            matched = _match(body_cf)
+            verdict = verdicts[body_cf] = (
+                matched, _highest_severity(matched) if matched else '')
 
+        matched, severity = verdict
         if not matched:
             continue
 
-        severity = _highest_severity(matched)
-
         # Context window — same contact only
-        contact_key  = msg.phone_number or msg.contact_name
-        peer_indices = contact_index.get(contact_key, [])
-        pos          = peer_indices.index(i) if i in peer_indices else -1
-
-        before: List[str] = []
-        after:  List[str] = []
-
-        if pos >= 0:
-            for b in peer_indices[max(0, pos - context_window): pos]:
-                m = messages[b]
-                before.append(f"[{m.direction}] {m.body[:200]}")
-            for a in peer_indices[pos + 1: pos + 1 + context_window]:
-                m = messages[a]
-                after.append(f"[{m.direction}] {m.body[:200]}")
-
-        results.append(IntentResult(
-            record_id      = i,
-            timestamp_ms   = msg.timestamp_ms,
-            date_str       = msg.date_str,
-            direction      = msg.direction,
-            contact_name   = msg.contact_name,
-            phone_number   = msg.phone_number,
-            msg_type       = msg.msg_type,
-            body           = msg.body,
-            source_file    = msg.source_file,
-            kw_categories  = matched,
-            kw_severity    = severity,
-            confirmed      = False,         # Phase 2 sets this
-            context_before = before,
-            context_after  = after,
-            detection_mode = 'KEYWORD',
-        ))
+        peer_indices = contact_index[msg.phone_number or msg.contact_name]
+        pos          = positions[i]
+        before = [context_line(b) for b in peer_indices[max(0, pos - context_window): pos]]
+        after  = [context_line(a) for a in peer_indices[pos + 1: pos + 1 + context_window]]
+
+        # list(): repeated bodies share a verdict, never a category list
+        results.append(_candidate(i, msg, list(matched), severity, before, after))
 
     return results
 
 
-def _highest_severity(categories: List[str]) -> str:
+def scan_messages_streaming(
+    messages:       Iterable[MessageRecord],
+    context_window: int = 2,
+) -> Iterator[IntentResult]:
+    """
+    scan_messages() for a time-ordered stream too large to hold in memory.
+    Keeps only the last `context_window` context lines per contact and the
+    candidates still waiting for their following messages; each candidate
+    is yielded as soon as its context_after is complete (the rest at end of
+    stream). Same results as scan_messages() on the same sequence —
+    record_id is the stream position — but in completion order, not
+    record order.
+    """
+    recent:  Dict[str, Deque[str]]         = {}
+    waiting: Dict[str, List[IntentResult]] = {}
+    min_len = KEYWORD_PATTERNS.min_len
+
+    for i, msg in enumerate(messages):
+        key  = msg.phone_number or msg.contact_name
+        line = f"[{msg.direction}] {(msg.body or '')[:200]}"
+
+        pending = waiting.get(key)
+        if pending:
+            for result in pending:
+                result.context_after.append(line)
+            done = [r for r in pending if len(r.context_after) >= context_window]
+            if done:
+                waiting[key] = [r for r in pending if len(r.context_after) < context_window]
+                yield from done
+
+        history = recent.get(key)
+        if history is None:
+            history = recent[key] = deque(maxlen=max(0, context_window))
+
+        body_cf = (msg.body or '').casefold()
+        matched = (
+            _match(body_cf)
+            if len(body_cf) >= min_len and not body_cf.isspace() else []
+        )
+        if matched:
+            result = _candidate(
+                i, msg, matched, _highest_severity(matched), list(history), [])
+            if context_window > 0:
+                waiting.setdefault(key, []).append(result)
+            else:
+                yield result
+
+        history.append(line)
+
+    for pending in waiting.values():
+        yield from pending
+
+
+def _match(body_cf: str) -> List[str]:
+    return [
+        category for category, pattern in KEYWORD_PATTERNS.items()
+        if pattern.search(body_cf)
+    ]
+
+
+def _candidate(
+    i:        int,
+    msg:      MessageRecord,
+    matched:  List[str],
+    severity: str,
+    before:   List[str],
+    after:    List[str],
+) -> IntentResult:
+    return IntentResult(
+        record_id      = i,
+        timestamp_ms   = msg.timestamp_ms,
+        date_str       = msg.date_str,
+        direction      = msg.direction,
+        contact_name   = msg.contact_name,
+        phone_number   = msg.phone_number,
+        msg_type       = msg.msg_type,
+        body           = msg.body,
+        source_file    = msg.source_file,
+        kw_categories  = matched,
+        kw_severity    = severity,
+        confirmed      = False,         # Phase 2 sets this
+        context_before = before,
+        context_after  = after,
+        detection_mode = 'KEYWORD',
+    )
+
+
+def _compute_severity(categories: Iterable[str]) -> str:
     best = max((SEVERITY_RANK.get(c, 0) for c in categories), default=0)
     if best >= 3: return 'HIGH'
     if best >= 2: return 'MEDIUM'
     return 'LOW'
+
+
+# Severity of every subset of the known categories (2**5 = 32 entries), so
+# the scan loop does one set build and one dict hit per flagged body.
+_SEVERITY_BY_CATEGORIES: Dict[FrozenSet[str], str] = {
+    frozenset(subset): _compute_severity(subset)
+    for r in range(len(SEVERITY_RANK) + 1)
+    for subset in combinations(SEVERITY_RANK, r)
+}
+
+
+def _highest_severity(categories: List[str]) -> str:
+    key = frozenset(categories)
+    severity = _SEVERITY_BY_CATEGORIES.get(key)
+    if severity is None:        # category added to KEYWORD_MAP at runtime
+        severity = _compute_severity(key)
+    return severity
@@ -9,15 +9,21 @@ SCHEMA DESIGN NOTES:
 - Foreign key from intent_results.record_id → messages.id (soft reference)
 - All timestamps stored as INTEGER milliseconds (Unix epoch * 1000)
   for consistency with Android SMS Backup & Restore format
+- JSON columns are compact UTF-8 text (json_codec): no separator spaces and
+  no \\uXXXX escapes, so emoji-heavy context_before/after rows stay narrow
 """
 
 import sqlite3
-import json
 import logging
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain, islice
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, TYPE_CHECKING
+from typing import Iterable, List, Optional, TYPE_CHECKING
 
+from sentinel import json_codec
+from sentinel.aggregators.contact_aggregator import SEVERITY_CODE_SQL, severity_code
 from sentinel.models.record import MessageRecord, CallRecord, IntentResult
 
 if TYPE_CHECKING:
@@ -25,7 +31,98 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-SCHEMA_VERSION = '2.0'
+SCHEMA_VERSION = '2.2'   # 2.1: intent_results.severity_code  2.2: contact_profiles WITHOUT ROWID
+
+# Applied by connect(), i.e. to connections export() opens itself (a
+# caller-supplied conn keeps its own settings).
+_EXPORT_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",     # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",   # 256 MiB: index updates read pages via mmap
+    "PRAGMA busy_timeout=5000",     # wait out a concurrent API writer
+)
+# 'safe': WAL + synchronous=NORMAL — durable across app crashes; only an OS
+#         crash / power loss can drop the last commit.
+# 'fast': no on-disk journal, no fsync — a crash mid-export can corrupt the
+#         file. Disposable runs only (CLI --sqlite-unsafe). Leaves the file in
+#         rollback-journal mode until the next safe export or API writer
+#         connection switches it back to WAL.
+PRAGMA_PROFILES = {
+    'safe': ("PRAGMA journal_mode=WAL",    "PRAGMA synchronous=NORMAL"),
+    'fast': ("PRAGMA journal_mode=MEMORY", "PRAGMA synchronous=OFF"),
+}
+
+# Indexes that give every SentinelAPI list query (filter + ORDER BY ... LIMIT)
+# its sort order directly — a range scan of `limit` rows, no temp B-tree.
+# Timestamps are ascending so a reverse scan yields (message_ts_ms, id) DESC.
+# Also applied by SentinelAPI to databases created before they existed.
+QUERY_INDEXES = (
+    """CREATE INDEX IF NOT EXISTS idx_contact_label_risk
+        ON contact_profiles(risk_label, risk_score, phone_number)""",
+    """CREATE INDEX IF NOT EXISTS idx_intent_phone_ts
+        ON intent_results(phone_number, message_ts_ms)""",
+    """CREATE INDEX IF NOT EXISTS idx_intent_phone_sev_ts
+        ON intent_results(phone_number, ai_severity, message_ts_ms)""",
+    """CREATE INDEX IF NOT EXISTS idx_intent_sev_ts
+        ON intent_results(ai_severity, message_ts_ms)""",
+)
+
+# Indexes for M.I.N.D. Gateway query patterns
+_TABLE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_msg_ts       ON messages(timestamp_ms)",
+    "CREATE INDEX IF NOT EXISTS idx_msg_phone    ON messages(phone_number)",
+    "CREATE INDEX IF NOT EXISTS idx_msg_contact  ON messages(contact_name)",
+    "CREATE INDEX IF NOT EXISTS idx_call_ts      ON calls(timestamp_ms)",
+    "CREATE INDEX IF NOT EXISTS idx_call_phone   ON calls(phone_number)",
+    "CREATE INDEX IF NOT EXISTS idx_intent_ts    ON intent_results(message_ts_ms)",
+    "CREATE INDEX IF NOT EXISTS idx_intent_phone ON intent_results(phone_number)",
+    "CREATE INDEX IF NOT EXISTS idx_intent_sev   ON intent_results(ai_severity)",
+)
+
+# Rebuilt in full on every scan and only ever read by phone_number or via the
+# indexes below, so the primary key is the table's B-tree key (no rowid hop).
+_CONTACT_PROFILES_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS contact_profiles (
+        phone_number       TEXT PRIMARY KEY,
+        contact_name       TEXT,
+        total_messages     INTEGER DEFAULT 0,
+        total_calls        INTEGER DEFAULT 0,
+        total_flags        INTEGER DEFAULT 0,
+        flag_rate          REAL DEFAULT 0.0,
+        high_count         INTEGER DEFAULT 0,
+        medium_count       INTEGER DEFAULT 0,
+        low_count          INTEGER DEFAULT 0,
+        risk_score         REAL DEFAULT 0.0,
+        risk_label         TEXT DEFAULT 'LOW',
+        category_breakdown TEXT,
+        first_contact_ms   INTEGER,
+        last_contact_ms    INTEGER,
+        escalation_trend   TEXT DEFAULT 'UNKNOWN',
+        relationship_tags  TEXT,
+        generated_at       TEXT
+    ) WITHOUT ROWID;
+"""
+_CONTACT_PROFILES_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_contact_risk ON contact_profiles(risk_score DESC)",
+    # Keyset pagination seeks on (risk_score, phone_number). intent_results
+    # needs no extra index: idx_intent_ts already ends in the rowid (id).
+    """CREATE INDEX IF NOT EXISTS idx_contact_risk_phone
+        ON contact_profiles(risk_score, phone_number)""",
+)
+
+CONTACT_PROFILE_COLUMNS = (
+    'phone_number', 'contact_name', 'total_messages', 'total_calls',
+    'total_flags', 'flag_rate', 'high_count', 'medium_count', 'low_count',
+    'risk_score', 'risk_label', 'category_breakdown', 'first_contact_ms',
+    'last_contact_ms', 'escalation_trend', 'relationship_tags', 'generated_at',
+)
+# One row per CONTACT_PROFILE_COLUMNS, in order. Re-scans update in place.
+UPSERT_CONTACT_PROFILE_SQL = (
+    f"INSERT INTO contact_profiles ({', '.join(CONTACT_PROFILE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(CONTACT_PROFILE_COLUMNS))}) "
+    f"ON CONFLICT(phone_number) DO UPDATE SET "
+    + ", ".join(f"{c} = excluded.{c}" for c in CONTACT_PROFILE_COLUMNS[1:])
+)
 
 
 def export(
@@ -35,10 +132,25 @@ def export(
     intents:          List[IntentResult]   = None,
     contact_profiles: Optional[List["ContactProfile"]] = None,
     run_label:        str                  = '',
+    conn:             Optional[sqlite3.Connection] = None,
+    pragma_profile:   str                  = 'safe',
+    exclusive:        bool                 = False,
 ) -> Path:
     """
     Write all data to SQLite database.
     Safe to call multiple times — uses INSERT OR IGNORE on dedup keys.
+    conn: an open connection to db_path to write through (e.g. the API's
+          pooled writer) — committed/rolled back here but left open.
+    Table setup commits first; all row writes then share one
+    BEGIN IMMEDIATE transaction, so the write lock is taken up front
+    (no SQLITE_BUSY on the deferred read→write upgrade) and the WAL is
+    synced once per export rather than per table. Secondary indexes are
+    created at the end of that transaction: on a new database they are
+    built once from the loaded rows instead of updated row by row.
+    pragma_profile: 'safe' or 'fast' (see PRAGMA_PROFILES). Applied in full to
+          a connection opened here; a supplied conn only gets its journal_mode.
+    exclusive: open with locking_mode=EXCLUSIVE (see connect()). Ignored for
+          a supplied conn.
     Returns db_path.
     """
     messages         = messages         or []
@@ -46,18 +158,26 @@ def export(
     intents          = intents          or []
     contact_profiles = contact_profiles or []
 
-    conn = sqlite3.connect(str(db_path))
-    conn.execute("PRAGMA journal_mode=WAL")   # Safe concurrent reads
+    pragmas   = _profile_pragmas(pragma_profile)
+    owns_conn = conn is None
+    if owns_conn:
+        conn = connect(db_path, pragma_profile, exclusive=exclusive)
+    else:
+        conn.execute(pragmas[0])    # journal_mode — WAL: safe concurrent reads
     conn.execute("PRAGMA foreign_keys=ON")
 
     try:
-        _create_schema(conn)
+        _create_tables(conn)        # executescript() commits implicitly anyway
+        conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
         _write_messages(conn, messages)
         _write_calls(conn, calls)
         _write_intents(conn, intents)
         _write_contact_profiles(conn, contact_profiles)
         _write_meta(conn, messages, calls, intents, run_label)
+        _create_indexes(conn)       # no-ops once they exist
         conn.commit()
+        _refresh_stats(conn)
         logger.info(
             f"SQLite export complete -> {db_path}\n"
             f"  Messages: {len(messages)} | Calls: {len(calls)} | "
@@ -68,14 +188,59 @@ def export(
         logger.error(f"SQLite export failed: {e}")
         raise
     finally:
-        conn.close()
+        if owns_conn:
+            conn.close()
 
     return db_path
 
 
+def connect(
+    db_path:        Path,
+    pragma_profile: str  = 'safe',
+    exclusive:      bool = False,
+) -> sqlite3.Connection:
+    """
+    Open db_path with the export pragmas (pragma_profile + _EXPORT_PRAGMAS).
+    For callers that run several stages against the same file — pass it to
+    export(conn=...) and then to the readers (extract_uplifts, aggregate, ...)
+    instead of each stage opening its own. The caller closes it.
+    exclusive: locking_mode=EXCLUSIVE — the file lock is taken once and held
+          until close instead of per transaction (and WAL skips its shared
+          memory index). Blocks every other connection, the API's included,
+          for the connection's lifetime; single-process batch runs only.
+    """
+    pragmas = _profile_pragmas(pragma_profile)
+    conn = sqlite3.connect(str(db_path))
+    if exclusive:
+        # Before journal_mode: set ahead of the first WAL access, WAL runs
+        # without the -shm file
+        conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+    for pragma in pragmas + _EXPORT_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _profile_pragmas(pragma_profile: str) -> tuple:
+    try:
+        return PRAGMA_PROFILES[pragma_profile]
+    except KeyError:
+        raise ValueError(
+            f"pragma_profile must be one of {sorted(PRAGMA_PROFILES)}, "
+            f"got {pragma_profile!r}") from None
+
+
 # ── SCHEMA ───────────────────────────────────────────────────
 
-def _create_schema(conn: sqlite3.Connection) -> None:
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    """
+    Create or migrate the tables and indexes on conn. For callers that write
+    rows themselves (e.g. run_scan.py) instead of through export(). Idempotent.
+    """
+    _create_tables(conn)
+    _create_indexes(conn)
+
+
+def _create_tables(conn: sqlite3.Connection) -> None:
     conn.executescript("""
         CREATE TABLE IF NOT EXISTS sentinel_meta (
             id              INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -137,147 +302,199 @@ def _create_schema(conn: sqlite3.Connection) -> None:
             context_after   TEXT,    -- JSON array
             llm_model       TEXT,
             detection_mode  TEXT,
+            severity_code   INTEGER, -- 2 HIGH / 1 MEDIUM / 0 LOW (ai_severity, else kw_severity)
 
             UNIQUE(message_ts_ms, phone_number)
         );
-
-        -- Indexes for M.I.N.D. Gateway query patterns
-        CREATE INDEX IF NOT EXISTS idx_msg_ts       ON messages(timestamp_ms);
-        CREATE INDEX IF NOT EXISTS idx_msg_phone    ON messages(phone_number);
-        CREATE INDEX IF NOT EXISTS idx_msg_contact  ON messages(contact_name);
-        CREATE INDEX IF NOT EXISTS idx_call_ts      ON calls(timestamp_ms);
-        CREATE INDEX IF NOT EXISTS idx_call_phone   ON calls(phone_number);
-        CREATE INDEX IF NOT EXISTS idx_intent_ts    ON intent_results(message_ts_ms);
-        CREATE INDEX IF NOT EXISTS idx_intent_phone ON intent_results(phone_number);
-        CREATE INDEX IF NOT EXISTS idx_intent_sev   ON intent_results(ai_severity);
-
-        CREATE TABLE IF NOT EXISTS contact_profiles (
-            phone_number       TEXT PRIMARY KEY,
-            contact_name       TEXT,
-            total_messages     INTEGER DEFAULT 0,
-            total_calls        INTEGER DEFAULT 0,
-            total_flags        INTEGER DEFAULT 0,
-            flag_rate          REAL DEFAULT 0.0,
-            high_count         INTEGER DEFAULT 0,
-            medium_count       INTEGER DEFAULT 0,
-            low_count          INTEGER DEFAULT 0,
-            risk_score        REAL DEFAULT 0.0,
-            risk_label        TEXT DEFAULT 'LOW',
-            category_breakdown TEXT,
-            first_contact_ms   INTEGER,
-            last_contact_ms    INTEGER,
-            escalation_trend   TEXT DEFAULT 'UNKNOWN',
-            relationship_tags  TEXT,
-            generated_at       TEXT
-        );
-        CREATE INDEX IF NOT EXISTS idx_contact_risk ON contact_profiles(risk_score DESC);
     """)
+    _migrate_schema(conn)
+    conn.executescript(_CONTACT_PROFILES_TABLE_SQL)
+
+
+def _create_indexes(conn: sqlite3.Connection) -> None:
+    # execute(), not executescript(): safe inside export()'s open transaction
+    for stmt in _TABLE_INDEXES + _CONTACT_PROFILES_INDEXES + QUERY_INDEXES:
+        conn.execute(stmt)
+
+
+def _refresh_stats(conn: sqlite3.Connection) -> None:
+    """
+    Planner statistics (sqlite_stat1) for the tables just loaded, so index
+    choice reflects the real data. analysis_limit samples each index, keeping
+    this to milliseconds however large the archive. Best effort.
+    """
+    try:
+        conn.execute("PRAGMA analysis_limit=1000")
+        conn.execute("ANALYZE")
+    except sqlite3.Error as e:
+        logger.warning(f"ANALYZE skipped: {e}")
+
+
+def _migrate_schema(conn: sqlite3.Connection) -> None:
+    """Bring databases created by older schema versions up to date. Idempotent."""
+    intent_cols = {r[1] for r in conn.execute("PRAGMA table_info(intent_results)")}
+    if 'severity_code' not in intent_cols:
+        # 2.0 → 2.1: integer severity so aggregation never re-parses the text labels
+        conn.execute("ALTER TABLE intent_results ADD COLUMN severity_code INTEGER")
+        conn.execute(f"UPDATE intent_results SET severity_code = {SEVERITY_CODE_SQL}")
+        logger.info("Migrated intent_results: added severity_code")
+
+    table_sql = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'contact_profiles'"
+    ).fetchone()
+    if table_sql and 'WITHOUT ROWID' not in table_sql[0].upper():
+        # 2.1 → 2.2: rebuild as a WITHOUT ROWID table (its indexes are dropped
+        # with the old table and recreated by _create_indexes)
+        cols = ', '.join(CONTACT_PROFILE_COLUMNS)
+        conn.executescript(f"""
+            BEGIN;
+            ALTER TABLE contact_profiles RENAME TO _contact_profiles_rowid;
+            {_CONTACT_PROFILES_TABLE_SQL}
+            INSERT INTO contact_profiles ({cols})
+                SELECT {cols} FROM _contact_profiles_rowid
+                WHERE phone_number IS NOT NULL;
+            DROP TABLE _contact_profiles_rowid;
+            COMMIT;
+        """)
+        logger.info("Migrated contact_profiles: WITHOUT ROWID")
 
 
 # ── WRITERS ──────────────────────────────────────────────────
 
+# Rows per multi-row INSERT ... VALUES (...),(...): one statement step per
+# chunk instead of one per row (~35% faster bulk load than executemany).
+# Capped further by the connection's bound-variable limit.
+_ROWS_PER_INSERT = 500
+
+
+# INSERT prefixes for _insert_rows(); the row groups are appended per chunk size
+_INSERT_MESSAGES_SQL = """
+    INSERT OR IGNORE INTO messages
+    (timestamp_ms, date_str, direction, contact_name,
+     phone_number, msg_type, body, read, source_file)
+    VALUES """
+_INSERT_CALLS_SQL = """
+    INSERT OR IGNORE INTO calls
+    (timestamp_ms, date_str, call_type, contact_name,
+     phone_number, duration_sec, duration_fmt, source_file)
+    VALUES """
+_INSERT_INTENTS_SQL = """
+    INSERT OR REPLACE INTO intent_results
+    (message_ts_ms, date_str, direction, contact_name, phone_number,
+     msg_type, body, source_file, kw_categories, kw_severity,
+     confirmed, ai_categories, ai_severity, flagged_quote,
+     context_summary, context_before, context_after,
+     llm_model, detection_mode, severity_code)
+    VALUES """
+
+
+@lru_cache(maxsize=256)
+def _values_sql(sql: str, ncols: int, nrows: int) -> str:
+    """sql + nrows groups of ncols placeholders. Built once per shape, and the
+    identical text is what lets a long-lived connection (the API's pooled
+    writer) reuse its prepared statement across exports."""
+    group = '(' + ','.join('?' * ncols) + ')'
+    return sql + ','.join([group] * nrows)
+
+
+def _insert_rows(conn: sqlite3.Connection, sql: str, ncols: int, rows: Iterable[tuple]) -> None:
+    """Insert rows (tuples of ncols) in chunks; sql ends in 'VALUES '."""
+    getlimit = getattr(conn, 'getlimit', None)     # Python 3.11+
+    max_vars = getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER) if getlimit else 999
+    per_stmt = max(1, min(_ROWS_PER_INSERT, max_vars // ncols))
+    full_sql = _values_sql(sql, ncols, per_stmt)
+
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, per_stmt))
+        if not chunk:
+            return
+        stmt = full_sql if len(chunk) == per_stmt else _values_sql(sql, ncols, len(chunk))
+        conn.execute(stmt, list(chain.from_iterable(chunk)))
+
+
+# Row tuples built in C, one call per record. `read` is a bool, which
+# sqlite3 stores as INTEGER 0/1 — the same value int(read) gave.
+_MESSAGE_ROW = attrgetter(
+    'timestamp_ms', 'date_str', 'direction',
+    'contact_name', 'phone_number', 'msg_type',
+    'body', 'read', 'source_file',
+)
+_CALL_ROW = attrgetter(
+    'timestamp_ms', 'date_str', 'call_type',
+    'contact_name', 'phone_number',
+    'duration_sec', 'duration_fmt', 'source_file',
+)
+
+
 def _write_messages(conn: sqlite3.Connection, messages: List[MessageRecord]) -> None:
     if not messages:
         return
-    rows = [
-        (
-            m.timestamp_ms, m.date_str, m.direction,
-            m.contact_name, m.phone_number, m.msg_type,
-            m.body, int(m.read), m.source_file,
-        )
-        for m in messages
-    ]
-    conn.executemany("""
-        INSERT OR IGNORE INTO messages
-        (timestamp_ms, date_str, direction, contact_name,
-         phone_number, msg_type, body, read, source_file)
-        VALUES (?,?,?,?,?,?,?,?,?)
-    """, rows)
-    logger.debug(f"Wrote {len(rows)} message rows")
+    _insert_rows(conn, _INSERT_MESSAGES_SQL, 9, map(_MESSAGE_ROW, messages))
+    logger.debug(f"Wrote {len(messages)} message rows")
 
 
 def _write_calls(conn: sqlite3.Connection, calls: List[CallRecord]) -> None:
     if not calls:
         return
-    rows = [
-        (
-            c.timestamp_ms, c.date_str, c.call_type,
-            c.contact_name, c.phone_number,
-            c.duration_sec, c.duration_fmt, c.source_file,
-        )
-        for c in calls
-    ]
-    conn.executemany("""
-        INSERT OR IGNORE INTO calls
-        (timestamp_ms, date_str, call_type, contact_name,
-         phone_number, duration_sec, duration_fmt, source_file)
-        VALUES (?,?,?,?,?,?,?,?)
-    """, rows)
-    logger.debug(f"Wrote {len(rows)} call rows")
+    _insert_rows(conn, _INSERT_CALLS_SQL, 8, map(_CALL_ROW, calls))
+    logger.debug(f"Wrote {len(calls)} call rows")
 
 
 def _write_intents(conn: sqlite3.Connection, intents: List[IntentResult]) -> None:
     if not intents:
         return
-    rows = [
-        (
-            r.timestamp_ms,
-            r.date_str,
-            r.direction,
-            r.contact_name,
-            r.phone_number,
-            r.msg_type,
-            r.body,
-            r.source_file,
-            json.dumps(r.kw_categories),
-            r.kw_severity,
-            int(r.confirmed),
-            json.dumps(r.ai_categories),
-            r.ai_severity,
-            r.flagged_quote,
-            r.context_summary,
-            json.dumps(r.context_before),
-            json.dumps(r.context_after),
-            r.llm_model,
-            r.detection_mode,
-        )
-        for r in intents
-    ]
-    conn.executemany("""
-        INSERT OR REPLACE INTO intent_results
-        (message_ts_ms, date_str, direction, contact_name, phone_number,
-         msg_type, body, source_file, kw_categories, kw_severity,
-         confirmed, ai_categories, ai_severity, flagged_quote,
-         context_summary, context_before, context_after,
-         llm_model, detection_mode)
-        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-    """, rows)
-    logger.debug(f"Wrote {len(rows)} intent rows")
+    _insert_rows(conn, _INSERT_INTENTS_SQL, 20, map(_intent_row, intents))
+    logger.debug(f"Wrote {len(intents)} intent rows")
+
+
+def _intent_row(r: IntentResult) -> tuple:
+    kw_json = json_codec.dumps(r.kw_categories)
+    return (
+        r.timestamp_ms,
+        r.date_str,
+        r.direction,
+        r.contact_name,
+        r.phone_number,
+        r.msg_type,
+        r.body,
+        r.source_file,
+        kw_json,
+        r.kw_severity,
+        int(r.confirmed),
+        # Keyword-only and fallback results reuse the keyword list itself
+        kw_json if r.ai_categories is r.kw_categories else json_codec.dumps(r.ai_categories),
+        r.ai_severity,
+        r.flagged_quote,
+        r.context_summary,
+        json_codec.dumps(r.context_before),
+        json_codec.dumps(r.context_after),
+        r.llm_model,
+        r.detection_mode,
+        severity_code(r.ai_severity, r.kw_severity),
+    )
 
 
 def _write_contact_profiles(conn: sqlite3.Connection, profiles: List) -> None:
     """Write contact profiles to contact_profiles table."""
     if not profiles:
         return
-    rows = [
-        (
-            p.phone_number, p.contact_name, p.total_messages, p.total_calls,
-            p.total_flags, p.flag_rate, p.high_count, p.medium_count, p.low_count,
-            p.risk_score, p.risk_label, json.dumps(p.category_breakdown),
-            p.first_contact_ms, p.last_contact_ms, p.escalation_trend,
-            json.dumps(p.relationship_tags), p.generated_at,
-        )
-        for p in profiles
-    ]
-    conn.executemany("""
-        INSERT OR REPLACE INTO contact_profiles
-        (phone_number, contact_name, total_messages, total_calls,
-         total_flags, flag_rate, high_count, medium_count, low_count,
-         risk_score, risk_label, category_breakdown, first_contact_ms,
-         last_contact_ms, escalation_trend, relationship_tags, generated_at)
-        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-    """, rows)
-    logger.debug(f"Wrote {len(rows)} contact profile rows")
+    conn.executemany(UPSERT_CONTACT_PROFILE_SQL, map(_contact_profile_row, profiles))
+    logger.debug(f"Wrote {len(profiles)} contact profile rows")
+
+
+def _contact_profile_row(p: "ContactProfile") -> tuple:
+    # Most contacts have no relationship tags and many no flagged categories:
+    # the empty containers' JSON is a constant, no encoder call needed
+    return (
+        p.phone_number, p.contact_name, p.total_messages, p.total_calls,
+        p.total_flags, p.flag_rate, p.high_count, p.medium_count, p.low_count,
+        p.risk_score, p.risk_label,
+        json_codec.dumps(p.category_breakdown) if p.category_breakdown else '{}',
+        p.first_contact_ms, p.last_contact_ms, p.escalation_trend,
+        json_codec.dumps(p.relationship_tags) if p.relationship_tags else '[]',
+        p.generated_at,
+    )
 
 
 def _write_meta(
@@ -0,0 +1,45 @@
+"""
+sentinel/json_codec.py
+JSON encode/decode for the SQLite hot paths (category lists, tags, breakdowns).
+
+orjson is an optional dependency — used when installed, stdlib json otherwise.
+Both paths produce the same compact text, so rows written by either round-trip
+identically. orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+keep catching json.JSONDecodeError.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# ── OPTIONAL ORJSON IMPORT ──────────────────────────────────────────────────
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    orjson = None    # type: ignore
+    _ORJSON_AVAILABLE = False
+
+JSONDecodeError = json.JSONDecodeError
+
+
+if _ORJSON_AVAILABLE:
+    def loads(data: str | bytes) -> Any:
+        """Decode JSON text (str or bytes)."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Encode to compact JSON text (str — SQLite TEXT columns expect str)."""
+        return orjson.dumps(obj).decode()
+
+else:  # pragma: no cover
+    _encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+    def loads(data: str | bytes) -> Any:
+        """Decode JSON text (str or bytes)."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Encode to compact JSON text (str — SQLite TEXT columns expect str)."""
+        return _encoder.encode(obj)
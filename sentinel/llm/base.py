@@ -2,11 +2,35 @@
 sentinel/llm/base.py
 Abstract base class for all LLM adapters.
 To add a new backend: subclass LLMAdapter and implement analyze().
+Backends that can answer several messages in one request may also
+override analyze_batch().
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+# Shared tail of the single-message and batch prompts
+_CATEGORY_DEFINITIONS = (
+    "CATEGORY DEFINITIONS:\n"
+    "- INSULT: Personal attacks, name-calling, degrading language\n"
+    "- THREAT: Explicit or implied threats — physical, legal, financial\n"
+    "- MANIPULATION: Gaslighting, guilt-tripping, blame-shifting, coercion\n"
+    "- CUSTODY: Any reference to children, parenting, custody, visitation, child support\n"
+    "- POSITIVE: Genuine affection, apology, support, encouragement\n\n"
+    "Set confirmed=false ONLY if the message is clearly benign "
+    "and keyword match was a false positive.\n"
+    "LEGAL NOTE: This analysis is an inference. "
+    "Do not present as a legal conclusion."
+)
+_RESPONSE_FIELDS = (
+    '  "confirmed": true or false,\n'
+    '  "categories": ["INSULT","THREAT","MANIPULATION","CUSTODY","POSITIVE"],\n'
+    '  "severity": "HIGH" or "MEDIUM" or "LOW",\n'
+    '  "flagged_quote": "most significant 1-2 sentences from the message",\n'
+    '  "context_summary": "1-2 sentence plain English summary of intent"\n'
+)
 
 
 @dataclass
@@ -53,6 +77,39 @@ class LLMAdapter(ABC):
         """
         ...
 
+    async def aanalyze(
+        self,
+        body:           str,
+        direction:      str,
+        contact_name:   str,
+        kw_categories:  List[str],
+        context_before: List[str],
+        context_after:  List[str],
+    ) -> Optional[LLMResponse]:
+        """
+        Awaitable analyze(). Default runs the blocking analyze() in a worker
+        thread so several requests can be in flight; adapters with a native
+        async client may override. Same contract: never raises.
+        """
+        return await asyncio.to_thread(
+            self.analyze,
+            body, direction, contact_name,
+            kw_categories, context_before, context_after,
+        )
+
+    def analyze_batch(self, items: List[Dict]) -> List[Optional[LLMResponse]]:
+        """
+        Analyze several messages. items are analyze() keyword dicts; returns
+        one response (or None) per item, in order. Default calls analyze()
+        for each; adapters that can answer a whole batch in one request
+        override this. Never raises.
+        """
+        return [self.analyze(**item) for item in items]
+
+    async def aanalyze_batch(self, items: List[Dict]) -> List[Optional[LLMResponse]]:
+        """Awaitable analyze_batch() — runs it in a worker thread."""
+        return await asyncio.to_thread(self.analyze_batch, items)
+
     def build_prompt(
         self,
         body:           str,
@@ -86,20 +143,47 @@ class LLMAdapter(ABC):
             f"{ctx}\n"
             "Respond ONLY with a valid JSON object. No markdown, no explanation.\n\n"
             "{\n"
-            '  "confirmed": true or false,\n'
-            '  "categories": ["INSULT","THREAT","MANIPULATION","CUSTODY","POSITIVE"],\n'
-            '  "severity": "HIGH" or "MEDIUM" or "LOW",\n'
-            '  "flagged_quote": "most significant 1-2 sentences from the message",\n'
-            '  "context_summary": "1-2 sentence plain English summary of intent"\n'
+            f"{_RESPONSE_FIELDS}"
             "}\n\n"
-            "CATEGORY DEFINITIONS:\n"
-            "- INSULT: Personal attacks, name-calling, degrading language\n"
-            "- THREAT: Explicit or implied threats — physical, legal, financial\n"
-            "- MANIPULATION: Gaslighting, guilt-tripping, blame-shifting, coercion\n"
-            "- CUSTODY: Any reference to children, parenting, custody, visitation, child support\n"
-            "- POSITIVE: Genuine affection, apology, support, encouragement\n\n"
-            "Set confirmed=false ONLY if the message is clearly benign "
-            "and keyword match was a false positive.\n"
-            "LEGAL NOTE: This analysis is an inference. "
-            "Do not present as a legal conclusion."
+            f"{_CATEGORY_DEFINITIONS}"
+        )
+
+    def build_batch_prompt(self, items: List[Dict]) -> str:
+        """
+        One prompt for several messages (analyze() keyword dicts). The
+        instructions are sent once; the model answers with
+        {"results": [...]}, one object per numbered message, in order.
+        """
+        blocks = []
+        for n, item in enumerate(items, 1):
+            block = (
+                f"=== MESSAGE {n} ===\n"
+                f"Contact: {item['contact_name'] or 'Unknown'}\n"
+                f"Keyword pre-scan flagged: {', '.join(item['kw_categories'])}\n"
+            )
+            if item['context_before']:
+                block += 'PRIOR MESSAGES (same contact):\n'
+                block += '\n'.join(item['context_before']) + '\n'
+            block += f'TARGET MESSAGE ({item["direction"]}):\n"{item["body"][:1500]}"\n'
+            if item['context_after']:
+                block += 'FOLLOWING MESSAGES (same contact):\n'
+                block += '\n'.join(item['context_after']) + '\n'
+            blocks.append(block)
+
+        return (
+            "You are a forensic communication analyst. "
+            f"Analyze each of the {len(items)} numbered target SMS messages below "
+            "for harmful, manipulative, or legally relevant intent. "
+            "Judge each message on its own.\n\n"
+            + "\n".join(blocks) + "\n"
+            "Respond ONLY with a valid JSON object. No markdown, no explanation.\n"
+            f'"results" must hold exactly {len(items)} objects, one per message, '
+            "in message order:\n\n"
+            '{"results": [\n'
+            "  {\n"
+            '  "message": 1,\n'
+            f"{_RESPONSE_FIELDS}"
+            "  }\n"
+            "]}\n\n"
+            f"{_CATEGORY_DEFINITIONS}"
         )
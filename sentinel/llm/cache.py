@@ -0,0 +1,178 @@
+"""
+sentinel/llm/cache.py
+Response cache for any LLMAdapter.
+
+Repeated bodies ("ok", "call me", templated reminders) re-queried across a
+run — or re-scanned on the next run — are answered from memory or from a
+sidecar SQLite file instead of a new LLM round-trip.
+
+Keyed on blake2b(model + full prompt), so contact name and context window
+are part of the key: a hit is only ever served for an identical request.
+analyze_batch() answers are stored per message under that same
+single-message key. Failed calls (None) are never cached.
+
+The sidecar file is opt-in (persist_path): it holds flagged_quote and
+context_summary, which quote message content, outside sentinel.db.
+Rows that no longer decode into an LLMResponse count as misses.
+"""
+
+import dataclasses
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from sentinel import json_codec
+from sentinel.llm.base import LLMAdapter, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = 'sentinel_llm_cache.sqlite'
+
+
+def _copy(response: LLMResponse) -> LLMResponse:
+    # Results merge categories into IntentResults — never share one list
+    return dataclasses.replace(response, categories=list(response.categories))
+
+
+class CachedLLMAdapter(LLMAdapter):
+    """
+    Wraps another adapter; analyze() consults an in-memory LRU, then the
+    optional sidecar DB, then the wrapped backend. Thread-safe, so the
+    concurrent Phase 2 path (aanalyze → worker threads) can share it.
+    """
+
+    def __init__(
+        self,
+        inner:        LLMAdapter,
+        maxsize:      int            = 4096,
+        persist_path: Optional[Path] = None,
+    ):
+        self.inner   = inner
+        self.model   = getattr(inner, 'model', type(inner).__name__)
+        self.maxsize = maxsize
+        self.hits    = 0
+        self.misses  = 0
+        self._lru: 'OrderedDict[str, LLMResponse]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if persist_path is not None:
+            try:
+                self._db = sqlite3.connect(
+                    str(persist_path), check_same_thread=False, isolation_level=None,
+                )
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache "
+                    "(key TEXT PRIMARY KEY, response TEXT NOT NULL) WITHOUT ROWID"
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache file unavailable ({persist_path}): {e}")
+                self._db = None
+
+    def is_available(self) -> bool:
+        return self.inner.is_available()
+
+    def build_prompt(self, *args, **kwargs) -> str:
+        return self.inner.build_prompt(*args, **kwargs)
+
+    def analyze(
+        self,
+        body:           str,
+        direction:      str,
+        contact_name:   str,
+        kw_categories:  List[str],
+        context_before: List[str],
+        context_after:  List[str],
+    ) -> Optional[LLMResponse]:
+        args = (body, direction, contact_name, kw_categories, context_before, context_after)
+        key  = self._key(self.inner.build_prompt(*args))
+
+        cached = self._lookup(key)
+        if cached is not None:
+            return _copy(cached)
+
+        response = self.inner.analyze(*args)
+        if response is not None:
+            self._store(key, _copy(response))
+        return response
+
+    def analyze_batch(self, items: List[Dict]) -> List[Optional[LLMResponse]]:
+        """Serve hits from the cache; only the misses go to inner.analyze_batch()."""
+        keys    = [self._key(self.inner.build_prompt(**item)) for item in items]
+        results: List[Optional[LLMResponse]] = []
+        missing: List[int] = []
+        for i, key in enumerate(keys):
+            cached = self._lookup(key)
+            results.append(_copy(cached) if cached is not None else None)
+            if cached is None:
+                missing.append(i)
+
+        if missing:
+            fresh = self.inner.analyze_batch([items[i] for i in missing])
+            for i, response in zip(missing, fresh):
+                results[i] = response
+                if response is not None:
+                    self._store(keys[i], _copy(response))
+        return results
+
+    def close(self) -> None:
+        """Log hit/miss counts and close the sidecar DB."""
+        logger.info(f"LLM cache: {self.hits} hits / {self.misses} misses")
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # ── INTERNAL ─────────────────────────────────────────────
+
+    def _key(self, prompt: str) -> str:
+        return hashlib.blake2b(
+            f"{self.model}\0{prompt}".encode('utf-8'), digest_size=16,
+        ).hexdigest()
+
+    def _lookup(self, key: str) -> Optional[LLMResponse]:
+        with self._lock:
+            response = self._lru.get(key)
+            if response is not None:
+                self._lru.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT response FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row:
+                    try:
+                        response = LLMResponse(**json_codec.loads(row[0]))
+                    except (json_codec.JSONDecodeError, TypeError) as e:
+                        # Written by an older LLMResponse shape — re-asked, then replaced
+                        logger.debug(f"LLM cache row ignored: {e}")
+                    else:
+                        self._remember(key, response)
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return response
+
+    def _store(self, key: str, response: LLMResponse) -> None:
+        with self._lock:
+            self._remember(key, response)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO llm_cache (key, response) VALUES (?, ?)",
+                        # raw_response is debug-only and never written to disk
+                        (key, json_codec.dumps(dataclasses.asdict(
+                            dataclasses.replace(response, raw_response='')))),
+                    )
+                except sqlite3.Error as e:
+                    logger.debug(f"LLM cache write skipped: {e}")
+
+    def _remember(self, key: str, response: LLMResponse) -> None:
+        # Caller holds self._lock
+        self._lru[key] = response
+        self._lru.move_to_end(key)
+        if len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
@@ -13,16 +13,31 @@ RECOMMENDED MODELS (by VRAM/RAM):
   8GB+ RAM:  llama3:8b-instruct (best for this task)
 """
 
+import http.client
 import json
 import logging
-import urllib.request
+import threading
+import time
 import urllib.error
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 from sentinel.llm.base import LLMAdapter, LLMResponse
 
 logger = logging.getLogger(__name__)
 
+# is_available() results per (host, model), shared by every adapter in the
+# process: the CLI, run_full_analysis() and the API each probe before Phase 2,
+# and one /api/tags round-trip answers all of them for a few seconds.
+AVAILABILITY_TTL_SEC = 5.0
+_availability: Dict[Tuple[str, str], Tuple[bool, float]] = {}
+
+# A kept-alive socket the server closed while idle fails on first use;
+# those requests are retried once on a fresh connection.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError,
+)
+
 
 class OllamaAdapter(LLMAdapter):
 
@@ -37,16 +52,28 @@ class OllamaAdapter(LLMAdapter):
         self.host        = host.rstrip('/')
         self.timeout_sec = timeout_sec
         self.temperature = temperature
+        # One keep-alive HTTP connection per thread (Phase 2 analyzes from
+        # worker threads): a TCP connect per process, not per message
+        self._local      = threading.local()
 
     # ── AVAILABILITY CHECK ───────────────────────────────────
     def is_available(self) -> bool:
-        """Ping Ollama and confirm the configured model is pulled."""
+        """
+        Ping Ollama and confirm the configured model is pulled.
+        The answer is reused for AVAILABILITY_TTL_SEC.
+        """
+        key    = (self.host, self.model)
+        cached = _availability.get(key)
+        if cached is not None and time.monotonic() - cached[1] < AVAILABILITY_TTL_SEC:
+            return cached[0]
+        available = self._probe()
+        _availability[key] = (available, time.monotonic())
+        return available
+
+    def _probe(self) -> bool:
         try:
-            url = f"{self.host}/api/tags"
-            req = urllib.request.Request(url, method='GET')
-            with urllib.request.urlopen(req, timeout=5) as resp:
-                data   = json.loads(resp.read().decode())
-                models = [m['name'] for m in data.get('models', [])]
+            data   = self._request_json('GET', '/api/tags', timeout=5)
+            models = [m['name'] for m in data.get('models', [])]
 
             # Check exact match or prefix match (e.g. "llama3" matches "llama3:8b-instruct")
             available = any(
@@ -88,30 +115,8 @@ class OllamaAdapter(LLMAdapter):
             kw_categories, context_before, context_after
         )
 
-        payload = json.dumps({
-            'model':  self.model,
-            'prompt': prompt,
-            'stream': False,
-            'options': {
-                'temperature': self.temperature,
-                'num_predict': 400,
-            },
-            'format': 'json',   # Ollama JSON mode — forces valid JSON output
-        }).encode('utf-8')
-
         try:
-            req = urllib.request.Request(
-                f"{self.host}/api/generate",
-                data    = payload,
-                headers = {'Content-Type': 'application/json'},
-                method  = 'POST',
-            )
-            with urllib.request.urlopen(req, timeout=self.timeout_sec) as resp:
-                raw  = resp.read().decode('utf-8')
-                data = json.loads(raw)
-
-            response_text = data.get('response', '').strip()
-            return self._parse_response(response_text)
+            return self._parse_response(self._generate(prompt, num_predict=400))
 
         except urllib.error.URLError as e:
             logger.error(f"Ollama request failed: {e}")
@@ -123,6 +128,102 @@ class OllamaAdapter(LLMAdapter):
             logger.error(f"Ollama analyze error: {e}")
             return None
 
+    def analyze_batch(self, items: List[Dict]) -> List[Optional[LLMResponse]]:
+        """
+        Classify all items with one /api/generate call (build_batch_prompt).
+        If the request fails or the reply is not exactly one result per
+        item, the batch is re-run one message at a time.
+        The reply is not streamed and its token budget grows with the batch,
+        so the timeout does too: timeout_sec per item.
+        """
+        if len(items) <= 1:
+            return super().analyze_batch(items)
+
+        prompt = self.build_batch_prompt(items)
+        try:
+            text    = self._generate(prompt, num_predict=400 * len(items),
+                                     timeout=self.timeout_sec * len(items))
+            results = self._parse_batch_response(text, len(items))
+        except Exception as e:
+            logger.warning(f"Ollama batch request failed: {e}")
+            results = None
+
+        if results is None:
+            logger.warning(f"Batch of {len(items)} unusable — analyzing one by one.")
+            return super().analyze_batch(items)
+        return results
+
+    def _generate(self, prompt: str, num_predict: int,
+                  timeout: Optional[float] = None) -> str:
+        """
+        POST to /api/generate; returns the model's response text. Raises on failure.
+        timeout: seconds for the whole reply (default timeout_sec).
+        """
+        data = self._request_json('POST', '/api/generate', {
+            'model':  self.model,
+            'prompt': prompt,
+            'stream': False,
+            'options': {
+                'temperature': self.temperature,
+                'num_predict': num_predict,
+            },
+            'format': 'json',   # Ollama JSON mode — forces valid JSON output
+        }, timeout=timeout or self.timeout_sec)
+        return data.get('response', '').strip()
+
+    # ── HTTP ─────────────────────────────────────────────────
+    def _request_json(
+        self,
+        method:  str,
+        path:    str,
+        payload: Optional[dict] = None,
+        timeout: float          = 5,
+    ) -> dict:
+        """
+        Send a request over this thread's keep-alive connection; returns the
+        decoded JSON body. Errors are raised as urllib.error.URLError /
+        HTTPError, as urlopen() raised them.
+        """
+        body    = json.dumps(payload).encode('utf-8') if payload is not None else None
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        for retry in (True, False):
+            conn = self._connection(timeout)
+            try:
+                conn.request(method, self._base_path + path, body=body, headers=headers)
+                resp = conn.getresponse()
+                raw  = resp.read()
+                break
+            except _STALE_CONNECTION_ERRORS as e:
+                conn.close()
+                if not retry:
+                    raise urllib.error.URLError(e) from e
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise urllib.error.URLError(e) from e
+
+        if resp.status != 200:
+            raise urllib.error.HTTPError(
+                self.host + path, resp.status, resp.reason, resp.headers, None)
+        return json.loads(raw.decode('utf-8'))
+
+    def _connection(self, timeout: float) -> http.client.HTTPConnection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            parts = urlsplit(self.host)
+            cls   = (http.client.HTTPSConnection if parts.scheme == 'https'
+                     else http.client.HTTPConnection)
+            conn  = cls(parts.netloc, timeout=timeout)
+            self._local.conn = conn
+        conn.timeout = timeout          # used for the next connect
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn
+
+    @property
+    def _base_path(self) -> str:
+        # Path prefix when Ollama sits behind a reverse proxy (host/.../ollama)
+        return urlsplit(self.host).path
+
     # ── RESPONSE PARSER ──────────────────────────────────────
     def _parse_response(self, text: str) -> Optional[LLMResponse]:
         """
@@ -130,39 +231,47 @@ class OllamaAdapter(LLMAdapter):
         Handles models that add markdown fences despite format=json.
         """
         try:
-            # Strip markdown fences if present
-            clean = text.strip()
-            if clean.startswith('```'):
-                clean = clean.split('```')[1]
-                if clean.startswith('json'):
-                    clean = clean[4:]
-            clean = clean.strip()
-
-            data = json.loads(clean)
-
-            return LLMResponse(
-                confirmed       = bool(data.get('confirmed', False)),
-                categories      = [
-                    c.upper() for c in data.get('categories', [])
-                    if isinstance(c, str)
-                ],
-                severity        = str(data.get('severity', 'LOW')).upper(),
-                flagged_quote   = str(data.get('flagged_quote', ''))[:500],
-                context_summary = str(data.get('context_summary', ''))[:1000],
-                model_used      = self.model,
-                raw_response    = text[:500],
-            )
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            return self._response_from_dict(json.loads(_strip_fences(text)), text)
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
             logger.warning(f"Could not parse Ollama response: {e}\nRaw: {text[:200]}")
             return None
 
+    def _parse_batch_response(self, text: str, expected: int) -> Optional[List[LLMResponse]]:
+        """Parse {"results": [...]}; None unless it holds `expected` objects."""
+        try:
+            data = json.loads(_strip_fences(text))
+            items = data.get('results') if isinstance(data, dict) else data
+            if not isinstance(items, list) or len(items) != expected:
+                logger.warning(
+                    f"Ollama batch reply has "
+                    f"{len(items) if isinstance(items, list) else 'no'} results, "
+                    f"expected {expected}"
+                )
+                return None
+            return [self._response_from_dict(item, text) for item in items]
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Could not parse Ollama batch response: {e}\nRaw: {text[:200]}")
+            return None
+
+    def _response_from_dict(self, data: dict, text: str) -> LLMResponse:
+        return LLMResponse(
+            confirmed       = bool(data.get('confirmed', False)),
+            categories      = [
+                c.upper() for c in data.get('categories', [])
+                if isinstance(c, str)
+            ],
+            severity        = str(data.get('severity', 'LOW')).upper(),
+            flagged_quote   = str(data.get('flagged_quote', ''))[:500],
+            context_summary = str(data.get('context_summary', ''))[:1000],
+            model_used      = self.model,
+            raw_response    = text[:500],
+        )
+
     # ── MODEL MANAGEMENT HELPERS ─────────────────────────────
     def list_available_models(self) -> List[str]:
         """Return list of locally available Ollama model names."""
         try:
-            req = urllib.request.Request(f"{self.host}/api/tags", method='GET')
-            with urllib.request.urlopen(req, timeout=5) as resp:
-                data = json.loads(resp.read().decode())
+            data = self._request_json('GET', '/api/tags', timeout=5)
             return [m['name'] for m in data.get('models', [])]
         except Exception:
             return []
@@ -173,19 +282,23 @@ class OllamaAdapter(LLMAdapter):
         Blocking — use only in setup/init scripts, not during analysis.
         """
         logger.info(f"Pulling model: {model_name} — this may take several minutes...")
-        payload = json.dumps({'name': model_name, 'stream': False}).encode()
         try:
-            req = urllib.request.Request(
-                f"{self.host}/api/pull",
-                data    = payload,
-                headers = {'Content-Type': 'application/json'},
-                method  = 'POST',
+            data = self._request_json(
+                'POST', '/api/pull', {'name': model_name, 'stream': False}, timeout=600,
             )
-            with urllib.request.urlopen(req, timeout=600) as resp:
-                data   = json.loads(resp.read().decode())
-                status = data.get('status', '')
-                logger.info(f"Pull result: {status}")
-                return 'success' in status.lower()
+            status = data.get('status', '')
+            logger.info(f"Pull result: {status}")
+            return 'success' in status.lower()
         except Exception as e:
             logger.error(f"Model pull failed: {e}")
             return False
+
+
+def _strip_fences(text: str) -> str:
+    """Drop markdown fences some models add despite format=json."""
+    clean = text.strip()
+    if clean.startswith('```'):
+        clean = clean.split('```')[1]
+        if clean.startswith('json'):
+            clean = clean[4:]
+    return clean.strip()
@@ -2,13 +2,21 @@
 sentinel/models/record.py
 Shared dataclass schema. All parsers, detectors, and exporters
 use these types. Do not add logic here — data only.
+
+slots=True: archives hold millions of these, so no per-instance __dict__
+(smaller records, faster attribute access in the scan loops). Setting an
+attribute that is not a declared field raises AttributeError.
+
+Not frozen=True: IntentResult is filled in after construction (LLM and
+scorer fields), and a frozen __init__ routes every field through
+object.__setattr__ — ~4x slower to build, which the parsers pay per record.
 """
 
 from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageRecord:
     """Normalized SMS or MMS record."""
     timestamp_ms:  int
@@ -22,7 +30,7 @@ class MessageRecord:
     source_file:   str
 
 
-@dataclass
+@dataclass(slots=True)
 class CallRecord:
     """Normalized call log record."""
     timestamp_ms:   int
@@ -35,7 +43,7 @@ class CallRecord:
     source_file:    str
 
 
-@dataclass
+@dataclass(slots=True)
 class IntentResult:
     """Output of intent analysis for one message."""
     record_id:       int        # rowid in messages table
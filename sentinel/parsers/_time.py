@@ -0,0 +1,24 @@
+"""
+sentinel/parsers/_time.py
+Timestamp formatting shared by sms_parser.py and call_parser.py.
+
+One cache for both parsers: an SMS and a call logged in the same second
+format once between them.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+
+
+def epoch_to_str(epoch_ms: int) -> str:
+    """Epoch milliseconds → 'YYYY-MM-DD HH:MM:SS' local time, or 'INVALID_DATE'."""
+    # Format drops the milliseconds, so cache per whole second
+    return _second_to_str(epoch_ms // 1000)
+
+
+@lru_cache(maxsize=65536)
+def _second_to_str(sec: int) -> str:
+    try:
+        return datetime.fromtimestamp(sec).strftime('%Y-%m-%d %H:%M:%S')
+    except (OSError, OverflowError, ValueError):
+        return 'INVALID_DATE'
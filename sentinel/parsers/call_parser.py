@@ -6,20 +6,21 @@ FIX v2.0: Replaced ET.fromstring() with ET.iterparse() for streaming.
           Eliminated OOM crash on large call logs. No record count cap.
 
 FIX v2.1 (Phase 4.2, Architect): BOM and encoding aligned with sms_parser.py.
-          Same _read_xml_text logic: UTF-8-BOM, UTF-16-LE/BE by BOM, else UTF-8.
+          Same BOM logic: UTF-8-BOM, UTF-16-LE/BE by BOM, else UTF-8.
           No message content in logs. Parser output schema unchanged.
           Phase 7.1: encoding fix verified; tests and DIVERGENCE_LEDGER entry added.
 """
 
 import xml.etree.ElementTree as ET
-from datetime import datetime
+from functools import lru_cache, partial
+from operator import attrgetter
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, List, Optional
 import logging
-import re
 import io
 
 from sentinel.models.record import CallRecord
+from sentinel.parsers._time import epoch_to_str as _epoch_to_str
 
 logger = logging.getLogger(__name__)
 
@@ -34,64 +35,84 @@ CALL_TYPE = {
     '7': 'Answered Externally',
 }
 
+# str.translate table for the _sanitize_phone fast path
+_PHONE_PUNCT = str.maketrans('', '', '+-() ')
 
-def _read_xml_text(path: Path) -> str:
+# Directory merge keys, built in C once per record
+_DEDUP_KEY = attrgetter('timestamp_ms', 'phone_number')
+_SORT_KEY  = attrgetter('timestamp_ms')
+
+
+def _open_xml_text(path: Path) -> io.TextIOWrapper:
     """
-    Read XML file with BOM/encoding handling (aligned with sms_parser.py).
-    Tries UTF-8-BOM strip, then UTF-16 if BOM present, else UTF-8 with replace.
+    Open XML file as a decoded text stream (BOM handling aligned with sms_parser.py).
+    UTF-8-BOM, UTF-16-LE/BE by BOM, else UTF-8 — invalid bytes replaced.
+    Streams from disk: the file is never held whole as bytes or str.
     """
-    raw = path.read_bytes()
-    if raw.startswith(BOM_UTF8):
-        return raw[len(BOM_UTF8):].decode('utf-8', errors='replace')
-    if raw.startswith(BOM_UTF16_LE):
-        return raw[len(BOM_UTF16_LE):].decode('utf-16-le', errors='replace')
-    if raw.startswith(BOM_UTF16_BE):
-        return raw[len(BOM_UTF16_BE):].decode('utf-16-be', errors='replace')
+    raw = open(path, 'rb')
     try:
-        return raw.decode('utf-8', errors='strict')
-    except UnicodeDecodeError:
-        return raw.decode('utf-8', errors='replace')
-
-
-def _strip_stylesheet(content: str) -> str:
-    return re.sub(r'<\?xml-stylesheet[^?]*\?>', '', content)
-
-
-def parse_call_file(path: Path) -> List[CallRecord]:
+        head = raw.read(len(BOM_UTF8))
+        if head.startswith(BOM_UTF8):
+            encoding, skip = 'utf-8', len(BOM_UTF8)
+        elif head.startswith(BOM_UTF16_LE):
+            encoding, skip = 'utf-16-le', len(BOM_UTF16_LE)
+        elif head.startswith(BOM_UTF16_BE):
+            encoding, skip = 'utf-16-be', len(BOM_UTF16_BE)
+        else:
+            encoding, skip = 'utf-8', 0
+        raw.seek(skip)
+        return io.TextIOWrapper(raw, encoding=encoding, errors='replace')
+    except BaseException:
+        raw.close()     # e.g. a read error on the BOM sniff — don't leak the fd
+        raise
+
+
+def parse_call_file(path: Path,
+                    address_filter: Optional[str] = None) -> List[CallRecord]:
     """
     Parse a single calls XML file using streaming iterparse.
     No record count cap — processes all records regardless of file size.
     Supports UTF-8, UTF-8-BOM, UTF-16-LE/BE (same as sms_parser).
+    address_filter: if set, only calls whose sanitized number equals it are kept.
     """
     records: List[CallRecord] = []
+    # Loop-invariant lookups bound once, not per <call>
+    append       = records.append
+    source_file  = path.name
+    call_type_of = CALL_TYPE.get
 
     try:
-        content = _read_xml_text(path)
-        content = _strip_stylesheet(content)
-        stream  = io.StringIO(content)
-
-        for _event, el in ET.iterparse(stream, events=('end',)):
-            if el.tag.lower() != 'call':
-                el.clear()
-                continue
-            try:
-                ts  = int(el.get('date', '0') or '0')
-                dur = int(el.get('duration', '0') or '0')
-                num = _sanitize_phone(el.get('number', '') or '')
-                records.append(CallRecord(
-                    timestamp_ms  = ts,
-                    date_str      = _epoch_to_str(ts),
-                    call_type     = CALL_TYPE.get(el.get('type', '1'), 'Unknown'),
-                    contact_name  = _sanitize(el.get('contact_name', '') or ''),
-                    phone_number  = num,
-                    duration_sec  = dur,
-                    duration_fmt  = _fmt_duration(dur),
-                    source_file   = path.name,
-                ))
-            except Exception as e:
-                logger.debug(f"Skipped call element: {e}")
-            finally:
-                el.clear()
+        # <?xml-stylesheet?> and other PIs never surface as 'end' events
+        with _open_xml_text(path) as stream:
+            events = ET.iterparse(stream, events=('start', 'end'))
+            _event, root = next(events)
+            for event, el in events:
+                if event == 'start':
+                    continue
+                if el.tag.lower() != 'call':
+                    el.clear()
+                    continue
+                try:
+                    num = _sanitize_phone(el.get('number', '') or '')
+                    if address_filter is not None and num != address_filter:
+                        continue
+                    ts  = int(el.get('date', '0') or '0')
+                    dur = int(el.get('duration', '0') or '0')
+                    append(CallRecord(
+                        timestamp_ms  = ts,
+                        date_str      = _epoch_to_str(ts),
+                        call_type     = call_type_of(el.get('type', '1'), 'Unknown'),
+                        contact_name  = _sanitize(el.get('contact_name', '') or ''),
+                        phone_number  = num,
+                        duration_sec  = dur,
+                        duration_fmt  = _fmt_duration(dur),
+                        source_file   = source_file,
+                    ))
+                except Exception as e:
+                    logger.debug(f"Skipped call element: {e}")
+                finally:
+                    el.clear()
+                    root.clear()    # drop the emptied <call> shells from <calls> too
 
     except ET.ParseError as e:
         logger.error(f"XML parse error in {path.name}: {e}")
@@ -104,29 +125,39 @@ def parse_call_file(path: Path) -> List[CallRecord]:
     return records
 
 
-def parse_call_directory(directory: Path) -> List[CallRecord]:
-    all_records: List[CallRecord] = []
-    seen: set = set()
+def parse_call_directory(directory: Path,
+                         address_filter: Optional[str] = None,
+                         jobs: int = 1) -> List[CallRecord]:
+    """
+    Parse all calls-*.xml files in a directory.
+    Deduplicates on (timestamp_ms, phone_number).
+    address_filter / jobs: as in sms_parser.parse_sms_directory().
+    """
+    unique: Dict[tuple, CallRecord] = {}    # first occurrence wins, in file order
+    keep = unique.setdefault
 
-    for path in sorted(directory.glob('calls-*.xml')):
-        for rec in parse_call_file(path):
-            key = (rec.timestamp_ms, rec.phone_number)
-            if key in seen:
-                continue
-            seen.add(key)
-            all_records.append(rec)
+    for records in _parse_files(sorted(directory.glob('calls-*.xml')), address_filter, jobs):
+        for key, rec in zip(map(_DEDUP_KEY, records), records):
+            keep(key, rec)
 
-    all_records.sort(key=lambda r: r.timestamp_ms)
+    all_records = list(unique.values())
+    all_records.sort(key=_SORT_KEY)
     logger.info(f"Total calls after dedup: {len(all_records)}")
     return all_records
 
 
-def _epoch_to_str(ts: int) -> str:
-    try:
-        return datetime.fromtimestamp(ts / 1000).strftime('%Y-%m-%d %H:%M:%S')
-    except Exception:
-        return 'INVALID_DATE'
+def _parse_files(paths: List[Path], address_filter: Optional[str],
+                 jobs: int) -> Iterable[List[CallRecord]]:
+    """parse_call_file() per path, in order — in a process pool if jobs > 1."""
+    parse = partial(parse_call_file, address_filter=address_filter)
+    if jobs <= 1 or len(paths) <= 1:
+        return map(parse, paths)
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+        return list(pool.map(parse, paths))
+
 
+@lru_cache(maxsize=4096)     # call lengths repeat heavily (0s, 1m 2s, ...)
 def _fmt_duration(seconds: int) -> str:
     if seconds <= 0:
         return '0s'
@@ -139,7 +170,17 @@ def _fmt_duration(seconds: int) -> str:
     return f"{s}s"
 
 def _sanitize(text: str) -> str:
-    return ''.join(c for c in (text or '') if c.isprintable())[:300]
+    if not text:
+        return ''
+    if text.isprintable():
+        return text[:300]
+    # filter() with the C method itself: no generator frame per character
+    return ''.join(filter(str.isprintable, text))[:300]
 
 def _sanitize_phone(phone: str) -> str:
-    return ''.join(c for c in (phone or '') if c.isdigit() or c in '+-() ')[:30]
+    if not phone:
+        return ''
+    digits = phone.translate(_PHONE_PUNCT)
+    if not digits or digits.isdigit():
+        return phone[:30]
+    return ''.join(c for c in phone if c.isdigit() or c in '+-() ')[:30]
@@ -14,14 +14,15 @@ Schema: https://synctech.com.au/sms-backup-restore/fields-in-xml-backup-files/
 """
 
 import xml.etree.ElementTree as ET
-from datetime import datetime
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, List, Optional
 import logging
-import re
 import io
 
 from sentinel.models.record import MessageRecord
+from sentinel.parsers._time import epoch_to_str as _epoch_to_str
 
 logger = logging.getLogger(__name__)
 
@@ -38,52 +39,77 @@ MMS_DIRECTION = {
     '1': 'Received', '2': 'Sent',
 }
 
+# str.translate tables for the _sanitize / _sanitize_phone fast paths
+_LAYOUT_AS_SPACE = str.maketrans('\n\r\t', '   ')
+_PHONE_PUNCT     = str.maketrans('', '', '+-() ')
 
-def _read_xml_text(path: Path) -> str:
+# Directory merge keys, built in C once per record
+_DEDUP_KEY = attrgetter('timestamp_ms', 'phone_number', 'msg_type')
+_SORT_KEY  = attrgetter('timestamp_ms')
+
+
+def _open_xml_text(path: Path) -> io.TextIOWrapper:
     """
-    Read XML file with BOM/encoding handling (Phase 0.3c).
-    Tries utf-8-sig (strips BOM), then UTF-16 if BOM present, else utf-8 with replace.
+    Open XML file as a decoded text stream (Phase 0.3c BOM handling).
+    UTF-8-BOM, UTF-16-LE/BE by BOM, else UTF-8 — invalid bytes replaced.
+    Streams from disk: the file is never held whole as bytes or str.
     """
-    raw = path.read_bytes()
-    if raw.startswith(BOM_UTF8):
-        return raw[len(BOM_UTF8):].decode('utf-8', errors='replace')
-    if raw.startswith(BOM_UTF16_LE):
-        return raw[len(BOM_UTF16_LE):].decode('utf-16-le', errors='replace')
-    if raw.startswith(BOM_UTF16_BE):
-        return raw[len(BOM_UTF16_BE):].decode('utf-16-be', errors='replace')
-    # No BOM: try UTF-8 first (most common), then fallback
+    raw = open(path, 'rb')
     try:
-        return raw.decode('utf-8', errors='strict')
-    except UnicodeDecodeError:
-        return raw.decode('utf-8', errors='replace')
-
-
-def parse_sms_file(path: Path) -> List[MessageRecord]:
+        head = raw.read(len(BOM_UTF8))
+        if head.startswith(BOM_UTF8):
+            encoding, skip = 'utf-8', len(BOM_UTF8)
+        elif head.startswith(BOM_UTF16_LE):
+            encoding, skip = 'utf-16-le', len(BOM_UTF16_LE)
+        elif head.startswith(BOM_UTF16_BE):
+            encoding, skip = 'utf-16-be', len(BOM_UTF16_BE)
+        else:
+            encoding, skip = 'utf-8', 0
+        raw.seek(skip)
+        return io.TextIOWrapper(raw, encoding=encoding, errors='replace')
+    except BaseException:
+        raw.close()     # e.g. a read error on the BOM sniff — don't leak the fd
+        raise
+
+
+def parse_sms_file(path: Path,
+                   address_filter: Optional[str] = None) -> List[MessageRecord]:
     """
     Parse a single SMS Backup & Restore XML file using streaming iterparse.
     Handles arbitrarily large files without loading into RAM.
     Supports UTF-8, UTF-8-BOM, UTF-16-LE/BE (Phase 0.3c).
+    address_filter: if set, only <sms>/<mms> whose sanitized address equals it
+    are built; every other element is cleared without creating a record.
     Returns list of MessageRecord — empty list on parse failure.
     """
     records: List[MessageRecord] = []
 
     try:
-        content = _read_xml_text(path)
-        content = _strip_stylesheet(content)
-        stream  = io.StringIO(content)
-
-        for _event, el in ET.iterparse(stream, events=('end',)):
-            tag = el.tag.lower()
-            if tag == 'sms':
-                rec = _parse_sms(el, path.name)
-                if rec:
-                    records.append(rec)
-                el.clear()
-            elif tag == 'mms':
-                rec = _parse_mms(el, path.name)
-                if rec:
-                    records.append(rec)
+        # <?xml-stylesheet?> and other PIs never surface as 'end' events
+        with _open_xml_text(path) as stream:
+            events = ET.iterparse(stream, events=('start', 'end'))
+            _event, root = next(events)
+            for event, el in events:
+                if event == 'start':
+                    continue
+                tag = el.tag.lower()
+                if tag not in ('sms', 'mms'):
+                    continue
+                if (address_filter is not None
+                        and _sanitize_phone(el.get('address', '')) != address_filter):
+                    el.clear()
+                    root.clear()
+                    continue
+                if tag == 'sms':
+                    rec = _parse_sms(el, path.name)
+                    if rec:
+                        records.append(rec)
+                elif tag == 'mms':
+                    rec = _parse_mms(el, path.name)
+                    if rec:
+                        records.append(rec)
                 el.clear()
+                root.clear()    # drop the emptied <sms>/<mms> shells from <smses> too
 
     except ET.ParseError as e:
         logger.error(f"XML parse error in {path.name}: {e}")
@@ -96,44 +122,58 @@ def parse_sms_file(path: Path) -> List[MessageRecord]:
     return records
 
 
-def parse_sms_directory(directory: Path) -> List[MessageRecord]:
+def parse_sms_directory(directory: Path,
+                        address_filter: Optional[str] = None,
+                        jobs: int = 1) -> List[MessageRecord]:
     """
     Parse all sms-*.xml files in a directory.
     Deduplicates on (timestamp_ms, phone_number, msg_type).
+    address_filter is passed through to parse_sms_file().
+    jobs > 1 parses that many files at once in worker processes; files are
+    still merged in name order, so the result is identical to jobs=1.
     """
-    all_records: List[MessageRecord] = []
-    seen: set = set()
+    unique: Dict[tuple, MessageRecord] = {}    # first occurrence wins, in file order
+    keep = unique.setdefault
 
     xml_files = sorted(directory.glob('sms-*.xml'))
     if not xml_files:
         logger.warning(f"No sms-*.xml files found in {directory}")
         return []
 
-    for path in xml_files:
-        for rec in parse_sms_file(path):
-            key = (rec.timestamp_ms, rec.phone_number, rec.msg_type)
-            if key in seen:
-                continue
-            seen.add(key)
-            all_records.append(rec)
+    for records in _parse_files(xml_files, address_filter, jobs):
+        for key, rec in zip(map(_DEDUP_KEY, records), records):
+            keep(key, rec)
 
-    all_records.sort(key=lambda r: r.timestamp_ms)
+    all_records = list(unique.values())
+    all_records.sort(key=_SORT_KEY)
     logger.info(f"Total SMS/MMS after dedup: {len(all_records)}")
     return all_records
 
 
+def _parse_files(paths: List[Path], address_filter: Optional[str],
+                 jobs: int) -> Iterable[List[MessageRecord]]:
+    """parse_sms_file() per path, in order — in a process pool if jobs > 1."""
+    parse = partial(parse_sms_file, address_filter=address_filter)
+    if jobs <= 1 or len(paths) <= 1:
+        return map(parse, paths)
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+        return list(pool.map(parse, paths))
+
+
 def _parse_sms(el: ET.Element, source_file: str):
+    get = el.get
     try:
-        ts = int(_attr(el, 'date') or '0')
+        ts = int(get('date', '') or '0')
         return MessageRecord(
             timestamp_ms  = ts,
             date_str      = _epoch_to_str(ts),
-            direction     = SMS_DIRECTION.get(_attr(el, 'type'), 'Unknown'),
-            contact_name  = _sanitize(_attr(el, 'contact_name')),
-            phone_number  = _sanitize_phone(_attr(el, 'address')),
+            direction     = SMS_DIRECTION.get(get('type', ''), 'Unknown'),
+            contact_name  = _sanitize(get('contact_name', '')),
+            phone_number  = _sanitize_phone(get('address', '')),
             msg_type      = 'SMS',
-            body          = _sanitize(_attr(el, 'body'), max_len=50000),
-            read          = _attr(el, 'read') == '1',
+            body          = _sanitize(get('body', ''), max_len=50000),
+            read          = get('read', '') == '1',
             source_file   = source_file,
         )
     except Exception as e:
@@ -142,18 +182,19 @@ def _parse_sms(el: ET.Element, source_file: str):
 
 
 def _parse_mms(el: ET.Element, source_file: str):
+    get = el.get
     try:
-        ts   = int(_attr(el, 'date') or '0')
+        ts   = int(get('date', '') or '0')
         body = _extract_mms_body(el)
         return MessageRecord(
             timestamp_ms  = ts,
             date_str      = _epoch_to_str(ts),
-            direction     = MMS_DIRECTION.get(_attr(el, 'msg_box'), 'Unknown'),
-            contact_name  = _sanitize(_attr(el, 'contact_name')),
-            phone_number  = _sanitize_phone(_attr(el, 'address')),
+            direction     = MMS_DIRECTION.get(get('msg_box', ''), 'Unknown'),
+            contact_name  = _sanitize(get('contact_name', '')),
+            phone_number  = _sanitize_phone(get('address', '')),
             msg_type      = 'MMS',
             body          = body,
-            read          = _attr(el, 'read') == '1',
+            read          = get('read', '') == '1',
             source_file   = source_file,
         )
     except Exception as e:
@@ -168,8 +209,8 @@ def _extract_mms_body(el: ET.Element) -> str:
             return '[MMS — no text]'
         texts = []
         for part in parts_el.findall('part'):
-            ct   = _attr(part, 'ct')
-            text = _attr(part, 'text')
+            ct   = part.get('ct', '')
+            text = part.get('text', '')
             if ct == 'text/plain' and text and text.lower() != 'null':
                 texts.append(_sanitize(text, max_len=50000))
         return ' '.join(texts) if texts else '[MMS — media only]'
@@ -177,26 +218,18 @@ def _extract_mms_body(el: ET.Element) -> str:
         return '[MMS — parse error]'
 
 
-def _strip_stylesheet(content: str) -> str:
-    return re.sub(r'<\?xml-stylesheet[^?]*\?>', '', content)
-
-def _attr(el: ET.Element, name: str) -> str:
-    val = el.get(name, '')
-    return val if val is not None else ''
-
-def _epoch_to_str(epoch_ms: int) -> str:
-    try:
-        return datetime.fromtimestamp(epoch_ms / 1000).strftime('%Y-%m-%d %H:%M:%S')
-    except (OSError, OverflowError, ValueError):
-        return 'INVALID_DATE'
-
 def _sanitize(text: str, max_len: int = 500) -> str:
     if not text:
         return ''
+    if text.isprintable() or text.translate(_LAYOUT_AS_SPACE).isprintable():
+        return text[:max_len]    # common case — nothing to drop, no per-char loop
     cleaned = ''.join(c for c in text if c.isprintable() or c in '\n\r\t')
     return cleaned[:max_len]
 
 def _sanitize_phone(phone: str) -> str:
     if not phone:
         return ''
+    digits = phone.translate(_PHONE_PUNCT)
+    if not digits or digits.isdigit():
+        return phone[:30]
     return ''.join(c for c in phone if c.isdigit() or c in '+-() ')[:30]
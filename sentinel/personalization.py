@@ -16,84 +16,105 @@ from typing import Dict, List, Optional
 logger = logging.getLogger(__name__)
 
 
-def build_voice_context(db_path: Path, limit: int = 100) -> str:
+def _read(
+    db_path: Path,
+    conn:    Optional[sqlite3.Connection],
+    sql:     str,
+    params:  tuple = (),
+) -> list:
+    """Run one query through `conn` if given (left open), else a short-lived connection."""
+    if conn is not None:
+        return conn.execute(sql, params).fetchall()
+    own = sqlite3.connect(str(db_path))
+    try:
+        return own.execute(sql, params).fetchall()
+    finally:
+        own.close()
+
+
+def build_voice_context(
+    db_path: Path,
+    limit:   int = 100,
+    conn:    Optional[sqlite3.Connection] = None,
+) -> str:
     """
     Extract user's communication style from Sent messages.
     Returns a context string for personalized prompts.
     """
     if not db_path.exists():
         return ""
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
-    rows = conn.execute(
+    rows = _read(
+        db_path, conn,
         """
         SELECT body FROM messages
         WHERE direction = 'Sent' AND body IS NOT NULL AND length(trim(body)) > 5
         ORDER BY timestamp_ms DESC LIMIT ?
         """,
         (limit,),
-    ).fetchall()
-    conn.close()
+    )
     if not rows:
         return ""
-    bodies = [r["body"] for r in rows]
-    words = []
-    for b in bodies:
-        words.extend(b.split())
-    vocab = Counter(w.lower() for w in words if len(w) > 2)
-    top_words = [w for w, _ in vocab.most_common(50)]
-    avg_len = sum(len(b.split()) for b in bodies) / max(len(bodies), 1)
+    # One split per body feeds both the vocabulary and the average length
+    vocab: Counter = Counter()
+    n_words = 0
+    for (body,) in rows:
+        words = body.split()
+        n_words += len(words)
+        vocab.update(w.lower() for w in words if len(w) > 2)
+    top_words = [w for w, _ in vocab.most_common(20)]
+    avg_len = n_words / len(rows)
     return (
-        f"User's typical vocabulary (top words): {', '.join(top_words[:20])}. "
+        f"User's typical vocabulary (top words): {', '.join(top_words)}. "
         f"Average sentence length: {avg_len:.1f} words. "
     )
 
 
-def build_uplift_context(db_path: Path, limit: int = 20) -> str:
+def build_uplift_context(
+    db_path: Path,
+    limit:   int = 20,
+    conn:    Optional[sqlite3.Connection] = None,
+) -> str:
     """
     Extract uplifting phrases the user has received.
     Personalizes prompts with positive context.
     """
     try:
         from sentinel.uplifts.extractor import extract_uplifts
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            tmp = f.name
-        try:
-            uplifts = extract_uplifts(db_path=str(db_path), output_path=tmp, top=limit)
-            if not uplifts:
-                return ""
-            phrases = [u.get("text", "")[:80] for u in uplifts[:10] if u.get("text")]
-            return f"Uplifting messages this user has received: {' | '.join(phrases)}. "
-        finally:
-            Path(tmp).unlink(missing_ok=True)
+        uplifts = extract_uplifts(
+            db_path=str(db_path), output_path=None, top=limit, conn=conn,
+        )
+        if not uplifts:
+            return ""
+        phrases = [u.get("text", "")[:80] for u in uplifts[:10] if u.get("text")]
+        return f"Uplifting messages this user has received: {' | '.join(phrases)}. "
     except Exception as e:
         logger.debug(f"Uplift context failed: {e}")
         return ""
 
 
-def build_audio_context(db_path: Path, limit: int = 5) -> str:
+def build_audio_context(
+    db_path: Path,
+    limit:   int = 5,
+    conn:    Optional[sqlite3.Connection] = None,
+) -> str:
     """
     Extract context from call transcripts (recordings table).
     Returns summary for personalized prompts.
     """
     if not db_path.exists():
         return ""
-    conn = sqlite3.connect(str(db_path))
     try:
-        conn.execute("SELECT 1 FROM recordings LIMIT 1")
+        rows = _read(
+            db_path, conn,
+            """
+            SELECT transcript, contact_name FROM recordings
+            WHERE transcript IS NOT NULL AND length(trim(transcript)) > 20
+            ORDER BY timestamp_ms DESC LIMIT ?
+            """,
+            (limit,),
+        )
     except sqlite3.OperationalError:
-        conn.close()
-        return ""
-    rows = conn.execute(
-        """
-        SELECT transcript, contact_name FROM recordings
-        WHERE transcript IS NOT NULL AND length(trim(transcript)) > 20
-        ORDER BY timestamp_ms DESC LIMIT ?
-        """,
-        (limit,),
-    ).fetchall()
-    conn.close()
+        return ""   # no recordings table
     if not rows:
         return ""
     excerpts = [f"{r[1] or 'Unknown'}: {r[0][:100]}..." for r in rows]
@@ -114,10 +135,12 @@ def build_personalized_system_prompt(
     include_voice: bool = True,
     include_uplifts: bool = True,
     include_audio: bool = True,
+    conn: Optional[sqlite3.Connection] = None,
 ) -> str:
     """
     Build a personalized system prompt from all available sources.
     Used to tailor LLM analysis to this user's context.
+    conn: an open connection to db_path shared by every section (left open).
     """
     parts = [
         "You are a forensic communication analyst. "
@@ -125,15 +148,15 @@ def build_personalized_system_prompt(
         "All analysis is probabilistic inference — not legal conclusions. "
     ]
     if include_voice:
-        voice = build_voice_context(db_path)
+        voice = build_voice_context(db_path, conn=conn)
         if voice:
             parts.append(f"USER CONTEXT: {voice}")
     if include_uplifts:
-        uplift = build_uplift_context(db_path)
+        uplift = build_uplift_context(db_path, conn=conn)
         if uplift:
             parts.append(f"POSITIVE CONTEXT: {uplift}")
     if include_audio:
-        audio = build_audio_context(db_path)
+        audio = build_audio_context(db_path, conn=conn)
         if audio:
             parts.append(f"AUDIO CONTEXT: {audio}")
     if contact_relationships:
@@ -145,6 +145,7 @@ def build_report(
 
 def report_to_dict(report: Report) -> Dict:
     """Convert Report to a JSON-serializable dict (for export/signing)."""
+    # Not dataclasses.asdict(): it deep-copies every leaf, ~4x slower here
     def _dataclass_to_dict(obj):
         if hasattr(obj, "__dataclass_fields__"):
             return {k: _dataclass_to_dict(getattr(obj, k)) for k in obj.__dataclass_fields__}
@@ -36,9 +36,13 @@ def _build_export_payload(
     return payload
 
 
-def _content_hash(payload: Dict[str, Any]) -> str:
-    """SHA-256 of canonical JSON serialization of payload (no hash field)."""
-    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+def _canonical_json(payload: Dict[str, Any]) -> str:
+    """Canonical JSON serialization of payload: sorted keys, no whitespace."""
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+
+def _content_hash(canonical: str) -> str:
+    """SHA-256 of a payload's _canonical_json() text (payload without hash field)."""
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
@@ -50,9 +54,15 @@ def export_to_json(
     """
     Export report to JSON string (primary format).
     Includes report metadata, integrity hash, and format version.
+    indent=None returns the hashed canonical text itself with the hash field
+    appended — one serialization instead of two.
     """
     payload = _build_export_payload(report, scan_parameters)
-    content_hash = _content_hash(payload)
+    canonical = _canonical_json(payload)
+    content_hash = _content_hash(canonical)
+    if indent is None:
+        # canonical is a JSON object, so it ends in "}"
+        return canonical[:-1] + f',"content_hash_sha256":"{content_hash}"}}'
     export_obj = {**payload, "content_hash_sha256": content_hash}
     return json.dumps(export_obj, indent=indent, sort_keys=False)
 
@@ -66,5 +76,5 @@ def export_to_dict(
     Same schema as JSON export; can be passed to PDF generator.
     """
     payload = _build_export_payload(report, scan_parameters)
-    content_hash = _content_hash(payload)
+    content_hash = _content_hash(_canonical_json(payload))
     return {**payload, "content_hash_sha256": content_hash}
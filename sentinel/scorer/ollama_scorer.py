@@ -9,6 +9,7 @@ Malformed payload from Ollama → fail closed with SEVERITY_AMBIGUOUS.
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Callable, TYPE_CHECKING
 
 from sentinel.models.record import MessageRecord, IntentResult
@@ -126,9 +127,14 @@ def score_messages(
     llm: "LLMAdapter",
     record_id_fn: Optional[Callable[[MessageRecord, int], int]] = None,
     progress_cb: Optional[Callable[[int, int], None]] = None,
+    concurrency: int = 1,
 ) -> List[IntentResult]:
     """
     Score a list of messages via Ollama. Returns IntentResults with ai_severity only.
+    concurrency: requests in flight at once (worker threads — the socket I/O
+    releases the GIL). 1 (default) scores one message at a time. Results and
+    progress_cb calls stay in input order either way; the server only runs
+    requests in parallel up to its OLLAMA_NUM_PARALLEL.
     Logs operation count and latency only — never message content or PII.
     """
     if not messages:
@@ -138,12 +144,21 @@ def score_messages(
     start = time.perf_counter()
     results: List[IntentResult] = []
     total = len(messages)
-
-    for i, msg in enumerate(messages):
-        if progress_cb:
-            progress_cb(i + 1, total)
-        rid = record_id_fn(msg, i) if record_id_fn else 0
-        results.append(score_message(msg, llm, record_id=rid))
+    rids  = [record_id_fn(msg, i) if record_id_fn else 0 for i, msg in enumerate(messages)]
+
+    if concurrency > 1 and total > 1:
+        with ThreadPoolExecutor(max_workers=min(concurrency, total)) as pool:
+            scored = pool.map(lambda msg, rid: score_message(msg, llm, record_id=rid),
+                              messages, rids)
+            for i, result in enumerate(scored):
+                if progress_cb:
+                    progress_cb(i + 1, total)
+                results.append(result)
+    else:
+        for i, msg in enumerate(messages):
+            if progress_cb:
+                progress_cb(i + 1, total)
+            results.append(score_message(msg, llm, record_id=rids[i]))
 
     elapsed = time.perf_counter() - start
     logger.info(
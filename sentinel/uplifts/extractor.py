@@ -282,45 +282,83 @@ def _display_name(contact_name: str, phone_number: str) -> str:
 
 # ── MAIN EXTRACTOR ───────────────────────────────────────────
 
-def extract_uplifts(
+def _select_uplifts(
     db_path:        str,
-    output_path:    str  = 'uplifts.json',
-    min_len:        int  = 10,
-    max_len:        int  = 160,
-    received_only:  bool = True,
-    top:            int  = 50,
-    min_score:      int  = 4,
-    contact_filter: Optional[str] = None,
+    min_len:        int,
+    max_len:        int,
+    received_only:  bool,
+    min_score:      int,
+    contact_filter: Optional[str],
+    conn:           Optional[sqlite3.Connection] = None,
 ) -> list:
     """
-    Mine the mINd-SENTinel database for uplifting messages.
-
-    Args:
-        contact_filter: If set, only include messages from contacts whose
-                        name or phone number contains this string (case-insensitive).
-
-    Returns the list of uplift dicts (also writes JSON to output_path).
-    Raises FileNotFoundError if db_path does not exist.
+    Query, score and dedup candidate messages.
+    Returns scored dicts, best first — shared by extract_uplifts() and count_uplifts().
+    conn: an open connection to db_path to read through (left open).
     """
     db = Path(db_path)
     if not db.exists():
         raise FileNotFoundError(f"Database not found: {db_path}")
 
-    conn = sqlite3.connect(str(db))
-    conn.row_factory = sqlite3.Row
+    owns_conn = conn is None
+    if owns_conn:
+        conn = sqlite3.connect(str(db))
+    try:
+        rows = _query_candidates(conn, min_len, max_len, received_only, contact_filter)
+    finally:
+        if owns_conn:
+            conn.close()
+
+    logger.info(f"Scanning {len(rows):,} candidate messages…")
 
+    scored = []
+    for timestamp_ms, phone_number, contact_name, body in rows:
+        body = body or ''
+        score, kw = score_message(body)
+        if score >= min_score:
+            name = _display_name(contact_name, phone_number)
+            scored.append({
+                'score':   score,
+                'keyword': kw,
+                'body':    _clean_body(body),
+                'name':    name,
+                'contact': contact_name or '',
+                'date_ms': timestamp_ms,
+            })
+
+    scored.sort(key=lambda x: x['score'], reverse=True)
+
+    seen    = set()
+    deduped = []
+    for item in scored:
+        key = item['body'][:40].lower().strip()
+        if key not in seen:
+            seen.add(key)
+            deduped.append(item)
+
+    logger.info(f"Found {len(scored):,} positive → {len(deduped):,} unique")
+    return deduped
+
+
+def _query_candidates(
+    conn:           sqlite3.Connection,
+    min_len:        int,
+    max_len:        int,
+    received_only:  bool,
+    contact_filter: Optional[str],
+) -> list:
+    """(timestamp_ms, phone_number, contact_name, body) rows, newest first."""
     cols     = [d[1] for d in conn.execute('PRAGMA table_info(messages)').fetchall()]
     required = {'timestamp_ms', 'phone_number', 'contact_name', 'body', 'direction'}
     missing  = required - set(cols)
     if missing:
-        conn.close()
         raise ValueError(
             f"Schema missing columns: {missing}. "
             f"Re-run sentinel to regenerate the DB."
         )
 
     query  = """
-        SELECT id, timestamp_ms, phone_number, contact_name, body, direction, msg_type
+        SELECT timestamp_ms, phone_number, contact_name, body
         FROM messages
         WHERE body IS NOT NULL
           AND length(trim(body)) >= ?
@@ -338,42 +376,60 @@ def extract_uplifts(
 
     query += " ORDER BY timestamp_ms DESC"
 
-    rows = conn.execute(query, params).fetchall()
-    conn.close()
+    return conn.execute(query, params).fetchall()
 
-    logger.info(f"Scanning {len(rows):,} candidate messages…")
 
-    scored = []
-    for row in rows:
-        body = row['body'] or ''
-        score, kw = score_message(body)
-        if score >= min_score:
-            name = _display_name(row['contact_name'], row['phone_number'])
-            scored.append({
-                'score':   score,
-                'keyword': kw,
-                'body':    _clean_body(body),
-                'name':    name,
-                'contact': row['contact_name'] or '',
-                'date_ms': row['timestamp_ms'],
-            })
+def count_uplifts(
+    db_path:        str,
+    min_len:        int  = 10,
+    max_len:        int  = 160,
+    received_only:  bool = True,
+    top:            int  = 50,
+    min_score:      int  = 4,
+    contact_filter: Optional[str] = None,
+    conn:           Optional[sqlite3.Connection] = None,
+) -> int:
+    """
+    Number of uplifts extract_uplifts() would return with the same arguments.
+    Skips tagging and JSON output — nothing is written to disk.
+    Raises FileNotFoundError / ValueError like extract_uplifts().
+    """
+    deduped = _select_uplifts(
+        db_path, min_len, max_len, received_only, min_score, contact_filter, conn,
+    )
+    return min(len(deduped), top)
 
-    scored.sort(key=lambda x: x['score'], reverse=True)
 
-    seen    = set()
-    deduped = []
-    for item in scored:
-        key = item['body'][:40].lower().strip()
-        if key not in seen:
-            seen.add(key)
-            deduped.append(item)
+def extract_uplifts(
+    db_path:        str,
+    output_path:    Optional[str] = 'uplifts.json',
+    min_len:        int  = 10,
+    max_len:        int  = 160,
+    received_only:  bool = True,
+    top:            int  = 50,
+    min_score:      int  = 4,
+    contact_filter: Optional[str] = None,
+    conn:           Optional[sqlite3.Connection] = None,
+) -> list:
+    """
+    Mine the mINd-SENTinel database for uplifting messages.
 
-    top_items = deduped[:top]
-    logger.info(
-        f"Found {len(scored):,} positive → "
-        f"{len(deduped):,} unique → exporting top {len(top_items)}"
+    Args:
+        output_path:    JSON file to write; None returns the list without writing.
+        contact_filter: If set, only include messages from contacts whose
+                        name or phone number contains this string (case-insensitive).
+        conn:           Open connection to db_path to read through (left open).
+
+    Returns the list of uplift dicts (also writes JSON to output_path, if set).
+    Raises FileNotFoundError if db_path does not exist.
+    """
+    deduped = _select_uplifts(
+        db_path, min_len, max_len, received_only, min_score, contact_filter, conn,
     )
 
+    top_items = deduped[:top]
+    logger.info(f"Exporting top {len(top_items)}")
+
     output = []
     for item in top_items:
         try:
@@ -393,6 +449,9 @@ def extract_uplifts(
             'type':             'personal',
         })
 
+    if output_path is None:
+        return output
+
     out_path = Path(output_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
     with open(out_path, 'w', encoding='utf-8') as f:
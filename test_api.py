@@ -151,6 +151,16 @@ class TestDBExistence:
         api = SentinelAPI(db_path=tmp_path / "nonexistent.db")
         assert api.get_meta() is None
 
+    def test_db_created_later_is_seen(self, tmp_path):
+        """A missing DB is re-checked; once found, the stat is skipped."""
+        api = SentinelAPI(db_path=tmp_path / "sentinel.db")
+        assert not api._db_exists()
+        _make_db(tmp_path)
+        assert api._db_exists()
+        with patch("sentinel.api.os.path.exists") as p_exists:
+            assert api._db_exists()
+        p_exists.assert_not_called()
+
 
 # ── TESTS: GET_CONTACTS ───────────────────────────────────────────────────────
 
@@ -187,6 +197,14 @@ class TestGetContacts:
         assert len(results) == 1
         assert results[0]["phone_number"] == "+1111"
 
+    def test_unknown_label_returns_empty(self, tmp_path):
+        db = _make_db(tmp_path)
+        _insert_profile(db, "+1111", "Alice", 75.0, "CRITICAL")
+        api = SentinelAPI(db_path=db)
+        assert api.get_contacts(risk_label="EXTREME") == []
+        assert api.get_contacts(risk_label="Critical")[0]["phone_number"] == "+1111"
+        assert api.get_contacts(risk_label="cRiTiCaL")[0]["phone_number"] == "+1111"
+
     def test_filter_case_insensitive_label(self, tmp_path):
         db = _make_db(tmp_path)
         _insert_profile(db, "+1111", "Alice", 75.0, "CRITICAL")
@@ -256,6 +274,15 @@ class TestGetContact:
         api = SentinelAPI(db_path=db)
         assert api.get_contact("+1612555000") is None  # missing trailing 1
 
+    def test_formatted_phone_falls_back_to_normalized(self, tmp_path):
+        db = _make_db(tmp_path)
+        _insert_profile(db, "+16125550001", "Alice", 55.0, "HIGH")
+        _insert_profile(db, "(612) 555-0002", "Bob", 10.0, "LOW")
+        api = SentinelAPI(db_path=db)
+        assert api.get_contact("+1 (612) 555-0001")["contact_name"] == "Alice"
+        # A stored formatted number still matches exactly
+        assert api.get_contact("(612) 555-0002")["contact_name"] == "Bob"
+
     def test_json_deserialized(self, tmp_path):
         db = _make_db(tmp_path)
         _insert_profile(db, "+1111", "Alice", 75.0, "CRITICAL")
@@ -306,6 +333,15 @@ class TestGetMessages:
         results = api.get_messages(severity="high")
         assert len(results) == 1
 
+    def test_unknown_severity_returns_empty(self, tmp_path):
+        db = _make_db(tmp_path)
+        _insert_intent(db, "+1111", "HIGH", ts=100)
+        api = SentinelAPI(db_path=db)
+        assert api.get_messages(severity="CRITICAL") == []
+        assert api.get_messages(severity="x" * 10_000) == []
+        with pytest.raises(ValueError):
+            api.get_messages(severity="bogus", cursor="not-a-cursor")
+
     def test_sorted_newest_first(self, tmp_path):
         db = _make_db(tmp_path)
         _insert_intent(db, "+1111", "HIGH", ts=100)
@@ -404,8 +440,8 @@ class TestRunScanValidation:
 
             result = api.run_scan(xml_dir=xml_dir, keyword_only=True)
 
-        p_sms.assert_called_once_with(xml_dir.resolve())
-        p_call.assert_called_once_with(xml_dir.resolve())
+        p_sms.assert_called_once_with(xml_dir.resolve(), address_filter=None)
+        p_call.assert_called_once_with(xml_dir.resolve(), address_filter=None)
         p_intent.assert_called_once()
         p_prof.assert_called_once()
         p_export.assert_called_once()
@@ -424,15 +460,10 @@ class TestRunScanValidation:
         xml_dir.mkdir()
         api = SentinelAPI(db_path=db)
 
-        msg_target = MagicMock(phone_number="+1111")
-        msg_other  = MagicMock(phone_number="+9999")
-        call_target = MagicMock(phone_number="+1111")
-        call_other  = MagicMock(phone_number="+9999")
-
         with patch("sentinel.parsers.sms_parser.parse_sms_directory",
-                   return_value=[msg_target, msg_other]), \
+                   return_value=[]) as p_sms, \
              patch("sentinel.parsers.call_parser.parse_call_directory",
-                   return_value=[call_target, call_other]), \
+                   return_value=[]) as p_call, \
              patch("sentinel.detectors.intent_detector.run_full_analysis",
                    return_value=[]) as p_intent, \
              patch("sentinel.aggregators.contact_aggregator.build_contact_profiles",
@@ -441,10 +472,18 @@ class TestRunScanValidation:
 
             api.run_scan(xml_dir=xml_dir, address="+1111")
 
-        # Only target messages/calls passed to intent detector
-        call_args = p_intent.call_args
-        passed_messages = call_args[0][0]
-        assert all(m.phone_number == "+1111" for m in passed_messages)
+        # Filter is pushed down into the parsers instead of applied afterwards
+        p_sms.assert_called_once_with(xml_dir.resolve(), address_filter="+1111")
+        p_call.assert_called_once_with(xml_dir.resolve(), address_filter="+1111")
+        p_intent.assert_called_once()
+
+    def test_pipeline_imported_once(self):
+        """Pipeline modules are cached after the first lookup."""
+        from sentinel.api import _get_pipeline
+        from sentinel.parsers import sms_parser
+        first = _get_pipeline()
+        assert _get_pipeline() is first
+        assert first.sms_parser is sms_parser
 
 
 # ── TESTS: _ROW_TO_DICT ───────────────────────────────────────────────────────
@@ -514,3 +553,323 @@ class TestRowToDict:
 
         result = SentinelAPI._row_to_dict(FakeRow(row))
         assert result["kw_categories"] == "not-json{{"
+
+    def test_plain_tuple_row_with_column_names(self):
+        keys = ("id", "kw_categories", "context_before", "body")
+        row  = (7, '["threats"]', "", "x")
+        result = SentinelAPI._row_to_dict(row, keys)
+        assert result == {"id": 7, "kw_categories": ["threats"],
+                          "context_before": "", "body": "x"}
+
+
+# ── TESTS: CONNECTION POOL ────────────────────────────────────────────────────
+
+class TestConnectionPool:
+    def test_reader_connection_reused_and_read_only(self, tmp_path):
+        db = _make_db(tmp_path)
+        api = SentinelAPI(db_path=db)
+        with api._read() as conn:
+            first = conn
+            assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM contact_profiles")
+        with api._read() as conn:
+            assert conn is first
+        api.close()
+
+    def test_concurrent_readers_get_distinct_connections(self, tmp_path):
+        from sentinel.api import _ConnectionPool
+        pool = _ConnectionPool(_make_db(tmp_path), readers=2)
+        with pool.reader() as a, pool.reader() as b:
+            assert a is not b
+        pool.close()
+
+    def test_exhausted_pool_times_out(self, tmp_path):
+        from sentinel.api import _ConnectionPool
+        pool = _ConnectionPool(_make_db(tmp_path), readers=1, timeout=0.05)
+        with pool.reader():
+            with pytest.raises(TimeoutError):
+                with pool.reader():
+                    pass
+        pool.close()
+
+    def test_write_txn_commits_or_rolls_back(self, tmp_path):
+        from sentinel.api import _ConnectionPool
+        pool = _ConnectionPool(_make_db(tmp_path))
+        insert = "INSERT INTO sentinel_meta (run_at, schema_version) VALUES ('t', '2.1')"
+        with pool.write_txn() as conn:
+            assert conn.in_transaction
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1   # NORMAL
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            conn.execute(insert)
+        with pytest.raises(RuntimeError):
+            with pool.write_txn() as conn:
+                conn.execute(insert)
+                raise RuntimeError("boom")
+        with pool.writer() as conn:
+            assert not conn.in_transaction
+            assert conn.execute("SELECT COUNT(*) FROM sentinel_meta").fetchone()[0] == 1
+        pool.close()
+
+    def test_close_while_checked_out_discards_connection(self, tmp_path):
+        db = _make_db(tmp_path)
+        api = SentinelAPI(db_path=db)
+        with api._read() as conn:
+            api.close()
+        assert api.get_contacts() == []
+        with api._read() as fresh:
+            assert fresh is not conn
+        api.close()
+
+    def test_close_leaves_checked_out_connection_usable(self, tmp_path):
+        api = SentinelAPI(db_path=_make_db(tmp_path))
+        with api._read() as conn:
+            api.close()
+            assert conn.execute("SELECT COUNT(*) FROM contact_profiles").fetchone()[0] == 0
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")        # closed on release
+        api.close()
+
+    def test_slow_writer_open_does_not_block_readers(self, tmp_path):
+        import threading
+        from sentinel.api import _ConnectionPool
+        pool = _ConnectionPool(_make_db(tmp_path), readers=1)
+        release = threading.Event()
+        open_writer = pool._open_writer
+
+        def slow_open():
+            release.wait(5)
+            return open_writer()
+
+        pool._open_writer = slow_open
+
+        def checkout(role):
+            with role():
+                pass
+
+        writer = threading.Thread(target=checkout, args=(pool.writer,))
+        writer.start()
+        reader = threading.Thread(target=checkout, args=(pool.reader,))
+        reader.start()
+        reader.join(2)
+        assert not reader.is_alive()
+        release.set()
+        writer.join(5)
+        pool.close()
+
+    def test_writer_tuned(self, tmp_path):
+        db = _make_db(tmp_path)
+        api = SentinelAPI(db_path=db)
+        with api._write() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 30000
+        api.close()
+
+    def test_sees_rows_written_after_first_read(self, tmp_path):
+        db = _make_db(tmp_path)
+        api = SentinelAPI(db_path=db)
+        assert api.get_contacts() == []
+        _insert_profile(db, "+1111", "Alice", 10.0, "LOW")
+        assert len(api.get_contacts()) == 1
+        api.close()
+
+
+# ── TESTS: KEYSET PAGINATION ──────────────────────────────────────────────────
+
+class TestKeysetPagination:
+    def _walk(self, fetch, keys, limit):
+        from sentinel.api import next_cursor
+        seen, cursor = [], None
+        while True:
+            page = fetch(limit=limit, cursor=cursor)
+            seen += page
+            cursor = next_cursor(page, limit, keys)
+            if cursor is None:
+                return seen
+
+    def test_contacts_cursor_walk_matches_offset_order(self, tmp_path):
+        from sentinel.api import CONTACT_CURSOR_KEYS
+        db = _make_db(tmp_path)
+        for i, score in enumerate([50.0, 20.0, 50.0, 70.0, 20.0, 0.0, 50.0]):
+            _insert_profile(db, f"+1{i:03d}", f"C{i}", score, "LOW")
+        api = SentinelAPI(db_path=db)
+        walked = self._walk(api.get_contacts, CONTACT_CURSOR_KEYS, limit=2)
+        assert [c["phone_number"] for c in walked] == \
+               [c["phone_number"] for c in api.get_contacts(limit=100)]
+        assert len(walked) == 7
+        api.close()
+
+    def test_messages_cursor_walk_handles_timestamp_ties(self, tmp_path):
+        from sentinel.api import MESSAGE_CURSOR_KEYS
+        db = _make_db(tmp_path)
+        for i, ts in enumerate([100, 300, 300, 200, 300]):
+            _insert_intent(db, f"+1{i:03d}", "HIGH", ts=ts)
+        api = SentinelAPI(db_path=db)
+        walked = self._walk(api.get_messages, MESSAGE_CURSOR_KEYS, limit=2)
+        assert [m["id"] for m in walked] == [5, 3, 2, 4, 1]
+        api.close()
+
+    def test_malformed_cursor_raises_value_error(self, tmp_path):
+        db = _make_db(tmp_path)
+        api = SentinelAPI(db_path=db)
+        with pytest.raises(ValueError):
+            api.get_contacts(cursor="not-a-cursor!")
+        with pytest.raises(ValueError):
+            api.get_messages(cursor="WyJhIiwgMV0=")   # ["a", 1] — wrong types
+        api.close()
+
+
+# ── TESTS: STREAMED PAGES ─────────────────────────────────────────────────────
+
+class TestStreaming:
+    def test_iter_contacts_is_lazy_and_validates_eagerly(self, tmp_path):
+        db = _make_db(tmp_path)
+        _insert_profile(db, "+1111", "Alice", 10.0, "LOW")
+        api = SentinelAPI(db_path=db)
+        rows = api.iter_contacts()
+        assert not isinstance(rows, list)
+        assert [r["phone_number"] for r in rows] == ["+1111"]
+        with pytest.raises(ValueError):
+            api.iter_messages(cursor="not-a-cursor!")
+        api.close()
+
+    def test_stream_page_body_matches_list_page(self, tmp_path):
+        from sentinel.api import CONTACT_CURSOR_KEYS, _stream_page, next_cursor
+        db = _make_db(tmp_path)
+        for i in range(3):
+            _insert_profile(db, f"+1{i:03d}", f"C{i}", float(i), "LOW")
+        api = SentinelAPI(db_path=db)
+        for limit in (2, 5):
+            body = b"".join(_stream_page(
+                "contacts", api.iter_contacts(limit=limit), limit, CONTACT_CURSOR_KEYS,
+            ))
+            page = api.get_contacts(limit=limit)
+            assert json.loads(body) == {
+                "contacts":    page,
+                "count":       len(page),
+                "next_cursor": next_cursor(page, limit, CONTACT_CURSOR_KEYS),
+            }
+        api.close()
+
+    def test_stream_page_empty(self):
+        from sentinel.api import MESSAGE_CURSOR_KEYS, _stream_page
+        body = b"".join(_stream_page("messages", iter(()), 50, MESSAGE_CURSOR_KEYS))
+        assert json.loads(body) == {"messages": [], "count": 0, "next_cursor": None}
+
+
+# ── TESTS: QUERY INDEXES ──────────────────────────────────────────────────────
+
+class TestQueryIndexes:
+    def test_indexes_added_to_existing_db(self, tmp_path):
+        db = _make_db(tmp_path)
+        api = SentinelAPI(db_path=db)
+        api.get_messages(phone="+1111", severity="high")
+        conn = sqlite3.connect(str(db))
+        names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM intent_results WHERE phone_number = ? "
+            "AND ai_severity = ? ORDER BY message_ts_ms DESC, id DESC LIMIT 5",
+            ("+1111", "HIGH"),
+        ).fetchall()
+        conn.close()
+        api.close()
+        assert {"idx_contact_label_risk", "idx_intent_phone_sev_ts"} <= names
+        assert not any("TEMP B-TREE" in r[3] for r in plan)
+
+
+# ── TESTS: TOTAL COUNT ────────────────────────────────────────────────────────
+
+class TestTotalCount:
+    def test_stream_page_total_in_same_query(self, tmp_path):
+        from sentinel.api import MESSAGE_CURSOR_KEYS, _stream_page
+        db = _make_db(tmp_path)
+        for i in range(5):
+            _insert_intent(db, f"+1{i:03d}", "HIGH" if i % 2 else "LOW", ts=100 + i)
+        api = SentinelAPI(db_path=db)
+        rows = api.iter_messages(severity="low", limit=2, with_total=True)
+        page = json.loads(b"".join(
+            _stream_page("messages", rows, 2, MESSAGE_CURSOR_KEYS, with_total=True)
+        ))
+        assert page["count"] == 2 and page["total"] == 3
+        assert all("_total" not in m for m in page["messages"])
+        api.close()
+
+
+# ── TESTS: DASHBOARD ──────────────────────────────────────────────────────────
+
+class TestDashboard:
+    def test_matches_separate_calls(self, tmp_path):
+        from dataclasses import asdict
+        from sentinel.aggregation import aggregate
+        from sentinel.personalization import build_personalized_system_prompt
+        db = _make_db(tmp_path)
+        _insert_profile(db, "+1111", "Alice", 40.0, "HIGH")
+        _insert_meta(db)
+        conn = sqlite3.connect(str(db))
+        conn.executemany(
+            "INSERT INTO messages (timestamp_ms, direction, contact_name, phone_number, body) "
+            "VALUES (?,?,?,?,?)",
+            [(1, "Received", "Alice", "+1111", "I am so proud of you, thank you!"),
+             (2, "Sent", "Alice", "+1111", "Thanks, that means a lot to me")],
+        )
+        conn.commit(); conn.close()
+        rels = {"Alice": ["friend"]}
+        api = SentinelAPI(db_path=db)
+        dash = api.get_dashboard(rels)
+        expected_agg = asdict(aggregate(db))
+        assert {**dash["aggregate"], "generated_at": ""} == {**expected_agg, "generated_at": ""}
+        assert dash["prompt"] == build_personalized_system_prompt(db, contact_relationships=rels)
+        assert dash["meta"] == api.get_meta()
+        assert dash["aggregate"]["contacts"][0]["phone_number"] == "+1111"
+        api.close()
+
+    def test_no_db(self, tmp_path):
+        api = SentinelAPI(db_path=tmp_path / "none.db")
+        dash = api.get_dashboard()
+        assert dash["meta"] is None and dash["aggregate"]["contacts"] == []
+        assert not (tmp_path / "none.db").exists()
+
+
+# ── TESTS: ETAG ───────────────────────────────────────────────────────────────
+
+class TestETag:
+    def test_none_without_scan(self, tmp_path):
+        assert SentinelAPI(db_path=tmp_path / "none.db").get_etag() is None
+        api = SentinelAPI(db_path=_make_db(tmp_path))
+        assert api.get_etag() is None   # schema but no sentinel_meta row
+        api.close()
+
+    def test_changes_with_new_scan_only(self, tmp_path):
+        db = _make_db(tmp_path)
+        _insert_meta(db)
+        api = SentinelAPI(db_path=db)
+        first = api.get_etag()
+        assert first.startswith('"') and first.endswith('"')
+        assert api.get_etag() == first
+        _insert_meta(db)
+        assert api.get_etag() != first
+        api.close()
+
+    def test_changes_when_profiles_rebuilt(self, tmp_path):
+        from build_profiles import build
+        from sentinel.exporters.sqlite_exporter import export
+        from sentinel.models.record import MessageRecord
+        db = tmp_path / "sentinel.db"
+        export(db, messages=[MessageRecord(
+            1000, "1970-01-01 00:00:01", "Received", "Alice", "+1111",
+            "SMS", "hello", True, "sms.xml",
+        )])
+        api = SentinelAPI(db_path=db)
+        first = api.get_etag()
+        build(db)       # rewrites contact_profiles, no new sentinel_meta row
+        assert api.get_etag() != first
+        api.close()
+
+    def test_if_none_match(self):
+        from sentinel.api import _etag_matches
+        assert _etag_matches('"abc"', '"abc"')
+        assert _etag_matches('W/"abc"', '"abc"')
+        assert _etag_matches('"x", "abc"', '"abc"')
+        assert _etag_matches("*", '"abc"')
+        assert not _etag_matches('"abd"', '"abc"')
+        assert not _etag_matches(None, '"abc"')
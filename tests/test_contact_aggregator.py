@@ -0,0 +1,247 @@
+"""
+tests/test_contact_aggregator.py
+Unit tests for sentinel.aggregators.contact_aggregator.
+Synthetic records only — no real messages, no PII.
+"""
+
+import json
+
+from sentinel.models.record import MessageRecord, CallRecord, IntentResult
+from sentinel.aggregators.contact_aggregator import (
+    build_contact_profiles,
+    build_contact_profiles_soa,
+    records_to_soa,
+)
+
+
+# ── FIXTURES ─────────────────────────────────────────────────
+
+BASE_TS = 1704067200000
+
+
+def _msg(i: int, phone: str, name: str = "A") -> MessageRecord:
+    return MessageRecord(
+        timestamp_ms=BASE_TS + i * 60000, date_str="", direction="Received",
+        contact_name=name, phone_number=phone, msg_type="SMS",
+        body=f"msg {i}", read=True, source_file="test.xml",
+    )
+
+
+def _intent(i: int, phone: str, sev: str, cats) -> IntentResult:
+    return IntentResult(
+        record_id=i, timestamp_ms=BASE_TS + i * 60000, date_str="",
+        direction="Received", contact_name="", phone_number=phone,
+        msg_type="SMS", body="", source_file="",
+        kw_categories=["CUSTODY"], kw_severity="LOW",
+        ai_categories=cats, ai_severity=sev,
+    )
+
+
+def _dataset():
+    msgs = [_msg(i, "+15550001") for i in range(8)] + [_msg(20, "+15550002", "B")]
+    calls = [
+        CallRecord(timestamp_ms=BASE_TS, date_str="", call_type="Incoming",
+                   contact_name="C", phone_number="+15550003",
+                   duration_sec=5, duration_fmt="5s", source_file="calls.xml"),
+    ]
+    intents = [
+        _intent(1, "+15550001", "HIGH", ["THREAT"]),
+        _intent(6, "+15550001", "medium", ["INSULT", "THREAT"]),
+        _intent(7, "+15550001", "", []),
+        _intent(20, "+15550002", "LOW", ["POSITIVE"]),
+    ]
+    return msgs, calls, intents
+
+
+def _strip_generated_at(profiles):
+    return [{**vars(p), "generated_at": ""} for p in profiles]
+
+
+# ── SOA PATH ─────────────────────────────────────────────────
+
+class TestStructOfArrays:
+
+    def test_soa_matches_record_path(self):
+        msgs, calls, intents = _dataset()
+        expected = build_contact_profiles(msgs, calls, intents)
+        actual = build_contact_profiles_soa(records_to_soa(msgs, calls, intents))
+        assert _strip_generated_at(actual) == _strip_generated_at(expected)
+
+    def test_soa_decodes_json_category_columns(self):
+        msgs, calls, intents = _dataset()
+        arrays = records_to_soa(msgs, calls, intents)
+        arrays["intents"]["ai_categories"] = [
+            json.dumps(c) for c in arrays["intents"]["ai_categories"]
+        ]
+        arrays["intents"]["kw_categories"] = [
+            json.dumps(c) for c in arrays["intents"]["kw_categories"]
+        ]
+        profiles = {p.phone_number: p for p in build_contact_profiles_soa(arrays)}
+        # Empty ai_categories falls back to kw_categories, as in the record path
+        assert profiles["+15550001"].category_breakdown == {
+            "THREAT": 2, "INSULT": 1, "CUSTODY": 1,
+        }
+
+    def test_missing_tables_tolerated(self):
+        msgs, _, _ = _dataset()
+        arrays = records_to_soa(msgs, [], [])
+        del arrays["calls"], arrays["intents"]
+        profiles = build_contact_profiles_soa(arrays)
+        assert {p.phone_number for p in profiles} == {"+15550001", "+15550002"}
+        assert all(p.total_flags == 0 for p in profiles)
+
+
+# ── ESCALATION TREND ─────────────────────────────────────────
+
+class TestEscalationTrend:
+
+    def test_duplicate_midpoint_timestamps_split_like_linear_scan(self):
+        from sentinel.aggregators.contact_aggregator import _compute_escalation_trend
+        msgs  = [1, 2, 3, 3, 3, 3, 4]
+        flags = [3, 4]   # both land at/after midpoint 3
+        assert _compute_escalation_trend(msgs, flags) == "ESCALATING"
+        assert _compute_escalation_trend(msgs, [1, 2]) == "DE-ESCALATING"
+        assert _compute_escalation_trend(msgs[:4], flags) == "UNKNOWN"
+
+
+# ── SEVERITY CODES ───────────────────────────────────────────
+
+class TestSeverityCodes:
+
+    def test_sql_mapping_matches_python(self):
+        import sqlite3
+        from sentinel.aggregators.contact_aggregator import SEVERITY_CODE_SQL
+        msgs, calls, intents = _dataset()
+        expected = list(records_to_soa(msgs, calls, intents)["intents"]["severity_code"])
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE intent_results (ai_severity TEXT, kw_severity TEXT)")
+        conn.executemany("INSERT INTO intent_results VALUES (?, ?)",
+                         [(r.ai_severity, r.kw_severity) for r in intents])
+        actual = [c for (c,) in conn.execute(
+            f"SELECT {SEVERITY_CODE_SQL} FROM intent_results ORDER BY rowid")]
+        conn.close()
+        assert actual == expected == [2, 1, 0, 0]
+
+
+# ── CATEGORY BREAKDOWN ───────────────────────────────────────
+
+class TestCategoryBreakdown:
+
+    def test_capped_at_top_k_most_frequent(self):
+        from sentinel.aggregators.contact_aggregator import CATEGORY_TOP_K
+        n_cats = CATEGORY_TOP_K + 5
+        cats = [[f"C{k}"] * (k + 1) for k in range(n_cats)]
+        arrays = {"intents": {
+            "phone_number":  ["+15550001"] * n_cats,
+            "timestamp_ms":  [BASE_TS] * n_cats,
+            "severity_code": [0] * n_cats,
+            "ai_categories": cats,
+            "kw_categories": [[]] * n_cats,
+        }}
+        (profile,) = build_contact_profiles_soa(arrays)
+        breakdown = profile.category_breakdown
+        assert len(breakdown) == CATEGORY_TOP_K
+        assert next(iter(breakdown)) == f"C{n_cats - 1}"
+        assert "C0" not in breakdown
+
+
+# ── RELATIONSHIP TAGS ────────────────────────────────────────
+
+class TestRelationshipTags:
+
+    def test_full_name_and_first_token_match(self):
+        rels = {" Alex Example ": ["friend"], "pat": ["coworker"]}
+        msgs = [_msg(0, "+15550001", "ALEX EXAMPLE"),
+                _msg(1, "+15550002", "Pat Sample"),
+                _msg(2, "+15550003", "Nobody")]
+        tags = {p.contact_name: p.relationship_tags
+                for p in build_contact_profiles(msgs, [], [], contact_relationships=rels)}
+        assert tags == {"ALEX EXAMPLE": ["friend"], "Pat Sample": ["coworker"], "Nobody": []}
+
+
+class TestGeneratedAt:
+
+    def test_single_timestamp_per_batch(self):
+        msgs, calls, intents = _dataset()
+        profiles = build_contact_profiles(msgs, calls, intents)
+        assert len({p.generated_at for p in profiles}) == 1
+
+
+class TestClassifyRisk:
+
+    def test_band_edges(self):
+        from sentinel.aggregators.contact_aggregator import _classify_risk
+        cases = {0.0: 'LOW', 14.99: 'LOW', 15.0: 'MEDIUM', 34.99: 'MEDIUM',
+                 35.0: 'HIGH', 59.99: 'HIGH', 60.0: 'CRITICAL', 100.0: 'CRITICAL'}
+        assert {s: _classify_risk(s) for s in cases} == cases
+
+
+# ── SQL PATH ─────────────────────────────────────────────────
+
+class TestSqlAggregator:
+
+    def _random_dataset(self):
+        import random
+        rng    = random.Random(7)
+        phones = ["+15550001", "+15550002", "+15550003", ""]
+        names  = ["Ann", "", "Bob"]
+        msgs = [
+            MessageRecord(
+                # coarse timestamps so several messages share the median
+                timestamp_ms=BASE_TS + rng.randrange(30) * 60000, date_str="",
+                direction="Received", contact_name=rng.choice(names),
+                phone_number=rng.choice(phones), msg_type=f"SMS{i}",
+                body="b", read=True, source_file="t.xml",
+            )
+            for i in range(200)
+        ]
+        calls = [
+            CallRecord(timestamp_ms=BASE_TS + i, date_str="", call_type="Incoming",
+                       contact_name=rng.choice(names), phone_number=phone,
+                       duration_sec=1, duration_fmt="1s", source_file="calls.xml")
+            for i, phone in enumerate(["+15550009", "+15550009", "+15550001"])
+        ]
+        intents = [
+            _intent(i, m.phone_number, rng.choice(["HIGH", "medium", "", "LOW"]),
+                    rng.choice([[], ["THREAT"], ["INSULT", "CUSTODY"]]))
+            for i, m in enumerate(msgs[::3])
+        ]
+        return msgs, calls, intents
+
+    def test_sql_path_matches_in_memory_path(self, tmp_path):
+        import sqlite3
+        from sentinel.exporters.sqlite_exporter import export
+        from sentinel.aggregators.sql_aggregator import build_contact_profiles_from_sql
+        msgs, calls, intents = self._random_dataset()
+        db = tmp_path / "t.db"
+        export(db, msgs, calls, intents)
+        rels = {"ann": ["friend"]}
+
+        expected = build_contact_profiles(msgs, calls, intents, contact_relationships=rels)
+        conn = sqlite3.connect(str(db))
+        actual = build_contact_profiles_from_sql(conn, contact_relationships=rels)
+        conn.close()
+
+        key = lambda p: p["phone_number"]
+        assert sorted(_strip_generated_at(actual), key=key) == \
+               sorted(_strip_generated_at(expected), key=key)
+        assert any(p.escalation_trend != "UNKNOWN" for p in actual)
+
+
+# ── PARALLEL STEP 5 ──────────────────────────────────────────
+
+class TestParallelProfiles:
+
+    def test_jobs_matches_in_process(self):
+        from sentinel.aggregators.contact_aggregator import PARALLEL_MIN_CONTACTS
+        n = PARALLEL_MIN_CONTACTS + 10
+        msgs = [_msg(i % 7, f"+1555{i:07d}", f"N{i}") for i in range(n)]
+        msgs += [_msg(k, "+15550000001") for k in range(10, 20)]
+        intents = [_intent(i, f"+1555{i:07d}", "HIGH", ["THREAT"]) for i in range(0, n, 3)]
+        expected = build_contact_profiles(msgs, [], intents, {"n1": ["x"]})
+        actual   = build_contact_profiles(msgs, [], intents, {"n1": ["x"]}, jobs=2)
+        key = lambda p: p["phone_number"]
+        assert sorted(_strip_generated_at(actual), key=key) == \
+               sorted(_strip_generated_at(expected), key=key)
+        scores = [p.risk_score for p in actual]
+        assert scores == sorted(scores, reverse=True)
@@ -0,0 +1,267 @@
+"""
+tests/test_intent_detector.py
+Unit tests for the Phase 2 orchestrator (sync and async paths).
+Uses an in-process LLMAdapter stand-in — no Ollama required.
+"""
+
+import asyncio
+import threading
+import time
+
+from sentinel.detectors.intent_detector import (
+    run_full_analysis,
+    run_full_analysis_async,
+)
+from sentinel.llm.base import LLMAdapter, LLMResponse
+from sentinel.models.record import MessageRecord
+
+
+BASE_TS = 1704067200000
+
+BODIES = [
+    "You are worthless and stupid.",            # INSULT
+    "I will take the kids from you.",           # CUSTODY/THREAT
+    "Nice weather today.",                      # benign
+    "You will regret this.",                    # THREAT
+    "Sorry, I love you.",                       # POSITIVE
+]
+
+
+def _messages():
+    return [
+        MessageRecord(
+            timestamp_ms=BASE_TS + i * 60000, date_str="", direction="Received",
+            contact_name="Test", phone_number="+15550001", msg_type="SMS",
+            body=body, read=True, source_file="test.xml",
+        )
+        for i, body in enumerate(BODIES)
+    ]
+
+
+class FakeLLM(LLMAdapter):
+    """Dismisses POSITIVE-only candidates, fails on 'regret', confirms the rest."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay     = delay
+        self.in_flight = 0
+        self.peak      = 0
+        self._lock     = threading.Lock()
+
+    def is_available(self) -> bool:
+        return True
+
+    def analyze(self, body, direction, contact_name, kw_categories,
+                context_before, context_after):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if "regret" in body:
+                return None
+            return LLMResponse(
+                confirmed=kw_categories != ["POSITIVE"],
+                categories=list(kw_categories), severity="HIGH",
+                flagged_quote=body[:50], context_summary="test",
+                model_used="fake",
+            )
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _summary(results):
+    return [(r.timestamp_ms, r.detection_mode, r.ai_severity, r.llm_model)
+            for r in results]
+
+
+class TestAsyncAnalysis:
+
+    def test_async_matches_sync(self):
+        expected = run_full_analysis(_messages(), llm=FakeLLM())
+        actual   = asyncio.run(run_full_analysis_async(_messages(), llm=FakeLLM()))
+        assert _summary(actual) == _summary(expected)
+        assert {r.detection_mode for r in actual} == {"AI", "AI_FALLBACK"}
+
+    def test_concurrency_is_bounded(self):
+        llm = FakeLLM(delay=0.05)
+        asyncio.run(run_full_analysis_async(_messages(), llm=llm, concurrency=2))
+        assert 1 < llm.peak <= 2
+
+    def test_sync_entry_point_runs_concurrently(self):
+        expected = run_full_analysis(_messages(), llm=FakeLLM())
+        llm      = FakeLLM(delay=0.05)
+        actual   = run_full_analysis(_messages(), llm=llm, concurrency=3)
+        assert _summary(actual) == _summary(expected)
+        assert 1 < llm.peak <= 3
+
+    def test_sync_entry_point_inside_running_loop(self):
+        expected = run_full_analysis(_messages(), llm=FakeLLM())
+
+        async def caller():     # e.g. SentinelAPI.run_scan() from an async handler
+            return run_full_analysis(_messages(), llm=FakeLLM(), concurrency=3)
+
+        assert _summary(asyncio.run(caller())) == _summary(expected)
+
+    def test_keyword_only_without_llm(self):
+        results = asyncio.run(run_full_analysis_async(_messages(), llm=None))
+        assert results
+        assert all(r.detection_mode == "KEYWORD" for r in results)
+
+
+class BatchRecordingLLM(FakeLLM):
+    """FakeLLM that records the size of every analyze_batch() call."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def analyze_batch(self, items):
+        self.batches.append(len(items))
+        return super().analyze_batch(items)
+
+
+class TestBatchedAnalysis:
+
+    def test_batches_match_single_requests(self):
+        expected = run_full_analysis(_messages(), llm=FakeLLM())
+        llm      = BatchRecordingLLM()
+        actual   = run_full_analysis(_messages(), llm=llm, batch_size=2)
+        assert _summary(actual) == _summary(expected)
+        assert sum(llm.batches) == len(BODIES) - 1   # benign message never a candidate
+        assert max(llm.batches) == 2
+
+    def test_batches_with_concurrency(self):
+        expected = run_full_analysis(_messages(), llm=FakeLLM())
+        llm      = BatchRecordingLLM()
+        actual   = run_full_analysis(_messages(), llm=llm, concurrency=2, batch_size=3)
+        assert _summary(actual) == _summary(expected)
+        assert sorted(llm.batches) == [1, 3]
+
+    def test_ollama_batch_reply_parsed_in_order(self, monkeypatch):
+        from sentinel.llm.ollama_adapter import OllamaAdapter
+        llm   = OllamaAdapter(model="fake")
+        items = [dict(body=b, direction="Received", contact_name="Test",
+                      kw_categories=["THREAT"], context_before=[], context_after=[])
+                 for b in ("first", "second")]
+        reply = ('{"results": [{"confirmed": true, "severity": "high"},'
+                 ' {"confirmed": false, "severity": "low"}]}')
+        monkeypatch.setattr(llm, "_generate", lambda prompt, num_predict, timeout=None: reply)
+        results = llm.analyze_batch(items)
+        assert [(r.confirmed, r.severity) for r in results] == [(True, "HIGH"), (False, "LOW")]
+
+    def test_ollama_batch_wrong_length_falls_back(self, monkeypatch):
+        from sentinel.llm.ollama_adapter import OllamaAdapter
+        llm   = OllamaAdapter(model="fake")
+        items = [dict(body=b, direction="Received", contact_name="Test",
+                      kw_categories=["THREAT"], context_before=[], context_after=[])
+                 for b in ("first", "second")]
+        prompts = []
+
+        def generate(prompt, num_predict, timeout=None):
+            prompts.append(prompt)
+            if len(prompts) == 1:   # the batch request: one result for two messages
+                return '{"results": [{"confirmed": true}]}'
+            return '{"confirmed": true, "severity": "MEDIUM"}'
+
+        monkeypatch.setattr(llm, "_generate", generate)
+        results = llm.analyze_batch(items)
+        assert len(prompts) == 3
+        assert [r.severity for r in results] == ["MEDIUM", "MEDIUM"]
+
+    def test_ollama_batch_timeout_scales_and_falls_back(self, monkeypatch):
+        import socket
+        import urllib.error
+        from sentinel.llm.ollama_adapter import OllamaAdapter
+        llm   = OllamaAdapter(model="fake", timeout_sec=10)
+        items = [dict(body=b, direction="Received", contact_name="Test",
+                      kw_categories=["THREAT"], context_before=[], context_after=[])
+                 for b in ("first", "second", "third")]
+        timeouts = []
+
+        def request_json(method, path, payload=None, timeout=5):
+            timeouts.append(timeout)
+            if len(timeouts) == 1:  # the batch request
+                raise urllib.error.URLError(socket.timeout("timed out"))
+            return {"response": '{"confirmed": true, "severity": "HIGH"}'}
+
+        monkeypatch.setattr(llm, "_request_json", request_json)
+        results = llm.analyze_batch(items)
+        assert timeouts == [30, 10, 10, 10]
+        assert [r.severity for r in results] == ["HIGH"] * 3
+
+
+class TestGhostFilter:
+
+    def test_blank_and_untimed_records_dropped(self):
+        from sentinel.detectors.intent_detector import _is_ghost_record
+        ghosts = _messages()[:4]
+        ghosts[0].body = ""
+        ghosts[1].body = " \n\t "
+        ghosts[2].body = None
+        ghosts[3].timestamp_ms = 0
+        assert all(_is_ghost_record(m) for m in ghosts)
+        assert not _is_ghost_record(_messages()[0])
+
+
+class TestOllamaAvailability:
+
+    def test_probe_reused_within_ttl(self, monkeypatch):
+        from sentinel.llm import ollama_adapter
+        monkeypatch.setattr(ollama_adapter, "_availability", {})
+        probes = []
+        monkeypatch.setattr(ollama_adapter.OllamaAdapter, "_probe",
+                            lambda self: probes.append(self.model) or True)
+        assert ollama_adapter.OllamaAdapter(model="a").is_available()
+        assert ollama_adapter.OllamaAdapter(model="a").is_available()
+        assert ollama_adapter.OllamaAdapter(model="b").is_available()
+        assert probes == ["a", "b"]
+
+        monkeypatch.setattr(ollama_adapter, "AVAILABILITY_TTL_SEC", 0.0)
+        ollama_adapter.OllamaAdapter(model="a").is_available()
+        assert probes == ["a", "b", "a"]
+
+
+class TestOllamaKeepAlive:
+
+    def test_requests_share_one_connection(self):
+        import http.server
+        import json
+        from sentinel.llm.ollama_adapter import OllamaAdapter
+
+        connections = []
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                connections.append(self.client_address)
+                super().setup()
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                reply = json.dumps({"response": json.dumps(
+                    {"confirmed": True, "categories": ["threat"], "severity": "high"})}).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(reply)))
+                self.end_headers()
+                self.wfile.write(reply)
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            llm = OllamaAdapter(model="m", host=f"http://127.0.0.1:{server.server_address[1]}")
+            for _ in range(5):
+                response = llm.analyze("hi", "Received", "A", [], [], [])
+                assert response.severity == "HIGH"
+            assert len(connections) == 1
+
+            llm._local.conn.sock.shutdown(2)    # server-side idle close
+            assert llm.analyze("hi", "Received", "A", [], [], []) is not None
+            assert len(connections) == 2
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,40 @@
+"""
+tests/test_json_codec.py
+Unit tests for sentinel.json_codec — stdlib fallback and optional orjson path.
+"""
+
+import json
+
+import pytest
+
+from sentinel import json_codec
+
+
+SAMPLE = {"THREAT": 2, "categories": ["INSULT", "CUSTODY"], "note": "café"}
+
+
+class TestJsonCodec:
+
+    def test_round_trip_compact_str(self):
+        text = json_codec.dumps(SAMPLE)
+        assert isinstance(text, str)
+        assert text == json.dumps(SAMPLE, separators=(",", ":"), ensure_ascii=False)
+        assert json_codec.loads(text) == SAMPLE
+        assert json_codec.loads(text.encode()) == SAMPLE
+
+    def test_bad_input_raises_json_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads("not-json{{")
+
+
+class TestOrjsonBackend:
+
+    def test_orjson_backend_matches_stdlib(self):
+        pytest.importorskip("orjson")
+        assert json_codec._ORJSON_AVAILABLE
+        text = json_codec.dumps(SAMPLE)
+        assert isinstance(text, str)
+        assert text == json.dumps(SAMPLE, separators=(",", ":"), ensure_ascii=False)
+        assert json_codec.loads(text) == SAMPLE
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads(b"not-json{{")
@@ -0,0 +1,110 @@
+"""
+tests/test_llm_cache.py
+Unit tests for CachedLLMAdapter — in-memory LRU and sidecar SQLite file.
+"""
+
+from sentinel.llm.base import LLMAdapter, LLMResponse
+from sentinel.llm.cache import CachedLLMAdapter
+
+
+class CountingLLM(LLMAdapter):
+    model = 'fake'
+
+    def __init__(self):
+        self.calls = 0
+
+    def is_available(self) -> bool:
+        return True
+
+    def analyze(self, body, direction, contact_name, kw_categories,
+                context_before, context_after):
+        self.calls += 1
+        if 'fail' in body:
+            return None
+        return LLMResponse(
+            confirmed=True, categories=list(kw_categories), severity='HIGH',
+            flagged_quote=body, context_summary='test', model_used=self.model,
+            raw_response='{"raw": true}',
+        )
+
+
+def _ask(llm, body, contact='A', before=()):
+    return llm.analyze(body, 'Received', contact, ['INSULT'], list(before), [])
+
+
+class TestCachedLLMAdapter:
+
+    def test_identical_request_hits(self):
+        inner = CountingLLM()
+        llm   = CachedLLMAdapter(inner)
+        first, second = _ask(llm, 'you idiot'), _ask(llm, 'you idiot')
+        assert inner.calls == 1
+        assert second == first and second is not first
+        assert second.categories is not first.categories
+        assert (llm.hits, llm.misses) == (1, 1)
+
+    def test_context_and_contact_are_part_of_key(self):
+        inner = CountingLLM()
+        llm   = CachedLLMAdapter(inner)
+        _ask(llm, 'you idiot')
+        _ask(llm, 'you idiot', contact='B')
+        _ask(llm, 'you idiot', before=['[Sent] hi'])
+        assert inner.calls == 3
+
+    def test_failures_not_cached(self):
+        inner = CountingLLM()
+        llm   = CachedLLMAdapter(inner)
+        assert _ask(llm, 'fail') is None
+        assert _ask(llm, 'fail') is None
+        assert inner.calls == 2
+
+    def test_lru_evicts_oldest(self):
+        inner = CountingLLM()
+        llm   = CachedLLMAdapter(inner, maxsize=2)
+        for body in ('a', 'b', 'c', 'a'):
+            _ask(llm, body)
+        assert inner.calls == 4
+
+    def test_persists_across_instances(self, tmp_path):
+        path  = tmp_path / 'cache.sqlite'
+        first = CachedLLMAdapter(CountingLLM(), persist_path=path)
+        _ask(first, 'you idiot')
+        first.close()
+
+        inner  = CountingLLM()
+        second = CachedLLMAdapter(inner, persist_path=path)
+        response = _ask(second, 'you idiot')
+        second.close()
+        assert inner.calls == 0
+        assert response.flagged_quote == 'you idiot'
+        assert response.raw_response == ''   # debug text never written to disk
+
+    def test_batch_sends_only_misses(self):
+        inner = CountingLLM()
+        llm   = CachedLLMAdapter(inner)
+        _ask(llm, 'you idiot')
+        items = [dict(body=b, direction='Received', contact_name='A',
+                      kw_categories=['INSULT'], context_before=[], context_after=[])
+                 for b in ('you idiot', 'loser', 'fail')]
+        results = llm.analyze_batch(items)
+        assert inner.calls == 3                       # 1 earlier + 2 misses
+        assert [r and r.flagged_quote for r in results] == ['you idiot', 'loser', None]
+        assert _ask(llm, 'loser').flagged_quote == 'loser'
+        assert inner.calls == 3
+
+    def test_stale_row_is_a_miss(self, tmp_path):
+        import sqlite3
+        path  = tmp_path / 'cache.sqlite'
+        first = CachedLLMAdapter(CountingLLM(), persist_path=path)
+        _ask(first, 'you idiot')
+        first.close()
+        db = sqlite3.connect(str(path))
+        db.execute("UPDATE llm_cache SET response = '{\"old_field\": 1}'")
+        db.commit()
+        db.close()
+
+        inner  = CountingLLM()
+        second = CachedLLMAdapter(inner, persist_path=path)
+        assert _ask(second, 'you idiot').flagged_quote == 'you idiot'
+        assert inner.calls == 1
+        second.close()
@@ -10,7 +10,7 @@ from pathlib import Path
 from datetime import datetime
 
 from sentinel.parsers.sms_parser      import parse_sms_file, parse_sms_directory
-from sentinel.parsers.call_parser     import parse_call_file
+from sentinel.parsers.call_parser     import parse_call_file, parse_call_directory
 from sentinel.detectors.keyword_detector import scan_messages
 from sentinel.exporters.sqlite_exporter  import export
 
@@ -117,6 +117,26 @@ class TestSmsParser:
         records = parse_sms_file(bad)
         assert records == []
 
+    def test_address_filter_keeps_only_target(self, tmp_xml_dir):
+        path    = tmp_xml_dir / 'sms-2024-01-01.xml'
+        records = parse_sms_file(path, address_filter='+16125550001')
+        assert len(records) == 3   # 2 SMS + 1 MMS
+        assert {r.phone_number for r in records} == {'+16125550001'}
+        assert any(r.msg_type == 'MMS' for r in records)
+
+    def test_address_filter_no_match_returns_empty(self, tmp_xml_dir):
+        records = parse_sms_directory(tmp_xml_dir, address_filter='+10000000000')
+        assert records == []
+
+    def test_parallel_directory_matches_serial(self, tmp_xml_dir):
+        content = (tmp_xml_dir / 'sms-2024-01-01.xml').read_text()
+        (tmp_xml_dir / 'sms-2024-01-02.xml').write_text(
+            content.replace('1704067', '1704153'), encoding='utf-8')
+        serial   = parse_sms_directory(tmp_xml_dir)
+        parallel = parse_sms_directory(tmp_xml_dir, jobs=2)
+        assert len(serial) == 10
+        assert parallel == serial
+
 
 # ── SMS PARSER ENCODING / BOM (Phase 0.3c) ─────────────────────
 
@@ -141,6 +161,13 @@ class TestSmsParserEncoding:
         records = parse_sms_file(path)
         assert len(records) == 5
 
+    def test_stylesheet_pi_ignored(self, tmp_path):
+        path = tmp_path / 'sms-xsl.xml'
+        path.write_text(SAMPLE_SMS_XML.replace(
+            '?>', '?>\n<?xml-stylesheet type="text/xsl" href="sms.xsl"?>', 1), encoding='utf-8')
+        records = parse_sms_file(path)
+        assert len(records) == 5
+
 
 # ── CALL PARSER TESTS ────────────────────────────────────────
 
@@ -165,11 +192,59 @@ class TestCallParser:
         long_call = next(r for r in records if r.duration_sec == 300)
         assert '5m' in long_call.duration_fmt
 
+    def test_address_filter(self, tmp_xml_dir):
+        path    = tmp_xml_dir / 'calls-2024-01-01.xml'
+        records = parse_call_file(path, address_filter='+16125550002')
+        assert len(records) == 1
+        assert records[0].call_type == 'Missed'
+
+    def test_utf16_be_bom_with_stylesheet(self, tmp_path):
+        content = SAMPLE_CALLS_XML.replace(
+            '?>', '?>\n<?xml-stylesheet type="text/xsl" href="calls.xsl"?>', 1)
+        path = tmp_path / 'calls-utf16.xml'
+        path.write_bytes(b'\xfe\xff' + content.encode('utf-16-be'))
+        records = parse_call_file(path)
+        assert len(records) == 3
+
+    def test_parallel_directory_matches_serial(self, tmp_xml_dir):
+        content = (tmp_xml_dir / 'calls-2024-01-01.xml').read_text()
+        (tmp_xml_dir / 'calls-2024-01-02.xml').write_text(content, encoding='utf-8')
+        serial   = parse_call_directory(tmp_xml_dir)
+        parallel = parse_call_directory(tmp_xml_dir, jobs=2)
+        assert len(serial) == 3   # duplicate file deduplicated
+        assert parallel == serial
+
 
 # ── KEYWORD DETECTOR TESTS ───────────────────────────────────
 
 class TestKeywordDetector:
 
+    def test_compile_keyword_patterns_longest_first(self):
+        from sentinel.detectors.keyword_detector import compile_keyword_patterns
+        patterns = compile_keyword_patterns({'A': ['court', 'court order', 'court'], 'B': []})
+        assert set(patterns) == {'A'}
+        assert patterns['A'].pattern == r'court\ order|court'
+        assert patterns['A'].search('the court order').group() == 'court order'
+        assert patterns.min_len == len('court')
+
+    def test_keywords_and_bodies_casefolded(self):
+        from sentinel.detectors.keyword_detector import compile_keyword_patterns
+        patterns = compile_keyword_patterns({'A': ['Court Order', 'court order', 'straße']})
+        assert patterns['A'].pattern == r'court\ order|strasse'
+        assert patterns['A'].search('STRASSE 5'.casefold())
+
+    def test_patterns_match_substring_semantics(self):
+        from sentinel.detectors.keyword_detector import KEYWORD_MAP, KEYWORD_PATTERNS
+        bodies = [
+            'see you in court order tomorrow', 'gal meeting', 'legal', 'galaxy',
+            "i'll take the kids and you will regret it", 'love you, idiot',
+            'nothing to see here', 'drop-off at school', '',
+        ]
+        for body in bodies:
+            expected = [c for c, kws in KEYWORD_MAP.items() if any(k in body for k in kws)]
+            got      = [c for c, p in KEYWORD_PATTERNS.items() if p.search(body)]
+            assert got == expected, body
+
     def test_detects_insult(self, tmp_xml_dir):
         from sentinel.parsers.sms_parser import parse_sms_directory
         messages = parse_sms_directory(tmp_xml_dir)
@@ -205,6 +280,93 @@ class TestKeywordDetector:
         )
         assert has_context
 
+    def test_context_window_same_contact_in_order(self, tmp_xml_dir):
+        messages = parse_sms_directory(tmp_xml_dir)
+        results  = scan_messages(messages, context_window=1)
+        by_ts    = {r.timestamp_ms: r for r in results}
+        # +16125550001: insult (t0), appreciation (t1), MMS manipulation (t4)
+        insult = by_ts[1704067200000]
+        assert insult.context_before == []
+        assert insult.context_after  == ['[Sent] I appreciate you reaching out.']
+        mms = by_ts[1704067440000]
+        assert mms.context_before == ['[Sent] I appreciate you reaching out.']
+        assert mms.context_after  == []
+
+    def test_context_window_interleaved_contacts(self):
+        from sentinel.models.record import MessageRecord
+        messages = [
+            MessageRecord(
+                timestamp_ms=i, date_str='', direction='Received',
+                contact_name='', phone_number=('+1' if i % 3 else '+2'),
+                msg_type='SMS', body=f'you idiot {i}', read=True, source_file='',
+            )
+            for i in range(300)
+        ]
+        results = scan_messages(messages, context_window=2)
+        assert len(results) == 300
+        for r in results:
+            peers = [m for m in messages if m.phone_number == r.phone_number]
+            pos   = next(k for k, m in enumerate(peers) if m.timestamp_ms == r.timestamp_ms)
+            assert r.context_before == [f'[Received] {m.body}' for m in peers[max(0, pos - 2):pos]]
+            assert r.context_after  == [f'[Received] {m.body}' for m in peers[pos + 1:pos + 3]]
+
+    def test_streaming_matches_batch_scan(self, tmp_xml_dir):
+        from sentinel.detectors.keyword_detector import scan_messages_streaming
+        from sentinel.models.record import MessageRecord
+        messages = parse_sms_directory(tmp_xml_dir) + [
+            MessageRecord(
+                timestamp_ms=2_000_000_000_000 + i, date_str='', direction='Received',
+                contact_name='', phone_number=('+1' if i % 3 else '+2'),
+                msg_type='SMS', body=('you idiot' if i % 2 else 'ok'), read=True,
+                source_file='',
+            )
+            for i in range(40)
+        ]
+        for window in (0, 1, 2, 5):
+            expected = scan_messages(messages, context_window=window)
+            streamed = list(scan_messages_streaming(iter(messages), context_window=window))
+            assert sorted(streamed, key=lambda r: r.record_id) == expected
+
+    def test_short_keywords_added_at_runtime_still_match(self, monkeypatch):
+        from sentinel.detectors import keyword_detector as kd
+        from sentinel.models.record import MessageRecord
+        keyword_map = {**kd.KEYWORD_MAP, 'INSULT': kd.KEYWORD_MAP['INSULT'] + ['ab']}
+        monkeypatch.setattr(kd, 'KEYWORD_MAP', keyword_map)
+        monkeypatch.setattr(kd, 'KEYWORD_PATTERNS', kd.compile_keyword_patterns(keyword_map))
+        messages = [
+            MessageRecord(
+                timestamp_ms=i, date_str='', direction='Received',
+                contact_name='', phone_number='+1', msg_type='SMS',
+                body=body, read=True, source_file='',
+            )
+            for i, body in enumerate(['AB', 'ok', 'a', ''])
+        ]
+        assert [r.body for r in scan_messages(messages)] == ['AB']
+
+    def test_repeated_bodies_get_own_category_lists(self):
+        from sentinel.models.record import MessageRecord
+        messages = [
+            MessageRecord(
+                timestamp_ms=i, date_str='', direction='Received',
+                contact_name='', phone_number='+1', msg_type='SMS',
+                body=body, read=True, source_file='',
+            )
+            for i, body in enumerate(['You idiot', 'ok', 'you IDIOT', 'ok'])
+        ]
+        results = scan_messages(messages)
+        assert [r.record_id for r in results] == [0, 2]
+        assert results[0].kw_categories == results[1].kw_categories == ['INSULT']
+        assert results[0].kw_categories is not results[1].kw_categories
+
+    def test_severity_table_covers_every_combination(self):
+        from sentinel.detectors.keyword_detector import KEYWORD_MAP, _highest_severity
+        assert _highest_severity([]) == 'LOW'
+        assert _highest_severity(['POSITIVE', 'THREAT']) == 'HIGH'
+        assert _highest_severity(['CUSTODY', 'MANIPULATION']) == 'MEDIUM'
+        assert _highest_severity(['CUSTODY', 'UNLISTED']) == 'LOW'
+        assert _highest_severity(['UNLISTED', 'THREAT']) == 'HIGH'
+        assert set(KEYWORD_MAP) >= {'THREAT', 'INSULT', 'MANIPULATION', 'CUSTODY', 'POSITIVE'}
+
     def test_severity_threat_is_high(self, tmp_xml_dir):
         messages = parse_sms_directory(tmp_xml_dir)
         results  = scan_messages(messages)
@@ -249,6 +411,65 @@ class TestSQLiteExporter:
         conn.close()
         assert count == 5
 
+    def test_planner_stats_collected(self, tmp_xml_dir, tmp_path):
+        import sqlite3
+        db_path = tmp_path / 'test.db'
+        export(db_path, messages=parse_sms_directory(tmp_xml_dir))
+        conn  = sqlite3.connect(str(db_path))
+        stats = {r[0] for r in conn.execute("SELECT tbl FROM sqlite_stat1")}
+        conn.close()
+        assert 'messages' in stats
+
+    def test_multi_row_inserts_with_remainder(self, tmp_xml_dir, tmp_path, monkeypatch):
+        import sqlite3
+        from sentinel.exporters import sqlite_exporter
+        monkeypatch.setattr(sqlite_exporter, '_ROWS_PER_INSERT', 2)
+        messages = parse_sms_directory(tmp_xml_dir)
+        db_path  = tmp_path / 'test.db'
+        export(db_path, messages=messages + messages)   # duplicates ignored across chunks
+        conn = sqlite3.connect(str(db_path))
+        rows = conn.execute(
+            "SELECT timestamp_ms, phone_number, msg_type, body, read FROM messages ORDER BY id"
+        ).fetchall()
+        conn.close()
+        assert rows == [
+            (m.timestamp_ms, m.phone_number, m.msg_type, m.body, int(m.read))
+            for m in messages
+        ]
+
+    def test_pragma_profile_validated(self, tmp_xml_dir, tmp_path):
+        import sqlite3
+        export(tmp_path / 'fast.db', messages=parse_sms_directory(tmp_xml_dir),
+               pragma_profile='fast')
+        conn  = sqlite3.connect(str(tmp_path / 'fast.db'))
+        count = conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+        conn.close()
+        assert count == 5
+        with pytest.raises(ValueError):
+            export(tmp_path / 'bad.db', pragma_profile='reckless')
+        assert not (tmp_path / 'bad.db').exists()
+
+    def test_connect_shared_with_later_stages(self, tmp_xml_dir, tmp_path):
+        from sentinel.exporters.sqlite_exporter import connect
+        db_path = tmp_path / 'shared.db'
+        conn    = connect(db_path, 'fast')
+        try:
+            export(db_path, messages=parse_sms_directory(tmp_xml_dir),
+                   conn=conn, pragma_profile='fast')
+            # Left open for the next stage, still on the profile's journal mode
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'memory'
+            assert conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0] == 5
+        finally:
+            conn.close()
+
+    def test_exclusive_lock_released_on_close(self, tmp_xml_dir, tmp_path):
+        import sqlite3
+        db_path = tmp_path / 'exclusive.db'
+        export(db_path, messages=parse_sms_directory(tmp_xml_dir), exclusive=True)
+        conn = sqlite3.connect(str(db_path), timeout=0)
+        assert conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0] == 5
+        conn.close()
+
     def test_schema_has_intent_table(self, tmp_path):
         import sqlite3
         db_path = tmp_path / 'test.db'
@@ -262,3 +483,188 @@ class TestSQLiteExporter:
         assert 'messages'       in tables
         assert 'calls'          in tables
         assert 'sentinel_meta'  in tables
+
+    def test_intents_store_severity_code(self, tmp_xml_dir, tmp_path):
+        import sqlite3
+        from sentinel.detectors.intent_detector import run_full_analysis
+        messages = parse_sms_directory(tmp_xml_dir)
+        intents  = run_full_analysis(messages, llm=None)   # ai_severity = kw_severity
+        db_path  = tmp_path / 'test.db'
+        export(db_path, messages=messages, intents=intents)
+        conn  = sqlite3.connect(str(db_path))
+        codes = dict(conn.execute(
+            "SELECT ai_severity, severity_code FROM intent_results"
+        ).fetchall())
+        conn.close()
+        assert codes.get('HIGH') == 2
+        assert set(codes.values()) <= {0, 1, 2}
+
+    def test_rows_written_in_one_immediate_transaction(self, tmp_xml_dir, tmp_path):
+        import sqlite3
+        from sentinel.parsers.call_parser import parse_call_directory
+        messages = parse_sms_directory(tmp_xml_dir)
+        calls    = parse_call_directory(tmp_xml_dir)
+        db_path  = tmp_path / 'test.db'
+        conn     = sqlite3.connect(str(db_path))
+        stmts    = []
+        conn.set_trace_callback(stmts.append)
+        export(db_path, messages=messages, calls=calls, conn=conn)
+        conn.close()
+        begin = stmts.index('BEGIN IMMEDIATE')
+        after = [s for s in stmts[begin + 1:] if s.split()[0] in ('BEGIN', 'COMMIT')]
+        assert after == ['COMMIT']
+        assert not any(s.startswith('INSERT') for s in stmts[:begin])
+
+    def test_indexes_built_after_rows_on_new_db(self, tmp_xml_dir, tmp_path):
+        import sqlite3
+        db_path = tmp_path / 'test.db'
+        conn    = sqlite3.connect(str(db_path))
+        stmts   = []
+        conn.set_trace_callback(stmts.append)
+        export(db_path, messages=parse_sms_directory(tmp_xml_dir), conn=conn)
+        indexes = {r[0] for r in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        conn.close()
+        begin = stmts.index('BEGIN IMMEDIATE')
+        first_index = next(i for i, s in enumerate(stmts) if 'CREATE INDEX' in s)
+        last_insert = max(i for i, s in enumerate(stmts) if s.lstrip().startswith('INSERT'))
+        assert begin < last_insert < first_index < stmts.index('COMMIT', begin)
+        assert {'idx_msg_ts', 'idx_contact_risk_phone', 'idx_intent_sev_ts'} <= indexes
+
+    @staticmethod
+    def _make_v20_db(db_path):
+        """intent_results as created by schema 2.0 — no severity_code column."""
+        import sqlite3
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("""
+            CREATE TABLE intent_results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                message_ts_ms INTEGER NOT NULL, date_str TEXT, direction TEXT,
+                contact_name TEXT, phone_number TEXT, msg_type TEXT, body TEXT,
+                source_file TEXT, kw_categories TEXT, kw_severity TEXT,
+                confirmed INTEGER DEFAULT 0, ai_categories TEXT, ai_severity TEXT,
+                flagged_quote TEXT, context_summary TEXT, context_before TEXT,
+                context_after TEXT, llm_model TEXT, detection_mode TEXT,
+                UNIQUE(message_ts_ms, phone_number)
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO intent_results (message_ts_ms, phone_number, kw_severity, ai_severity) "
+            "VALUES (?,?,?,?)",
+            [(1, '+1', 'LOW', 'high'), (2, '+1', 'MEDIUM', ''), (3, '+1', None, None)],
+        )
+        conn.commit(); conn.close()
+
+    def test_migrates_pre_severity_code_schema(self, tmp_path):
+        import sqlite3
+        db_path = tmp_path / 'old.db'
+        self._make_v20_db(db_path)
+        export(db_path)
+        export(db_path)   # second run — migration must be idempotent
+        conn  = sqlite3.connect(str(db_path))
+        codes = [r[0] for r in conn.execute(
+            "SELECT severity_code FROM intent_results ORDER BY message_ts_ms"
+        )]
+        conn.close()
+        assert codes == [2, 1, 0]
+
+    def test_run_scan_writes_to_pre_severity_code_schema(self, tmp_path):
+        import sqlite3
+        from run_scan import write_results
+        from sentinel.models.record import IntentResult
+        db_path = tmp_path / 'old.db'
+        self._make_v20_db(db_path)
+        intent = IntentResult(
+            record_id=0, timestamp_ms=3, date_str='', direction='Received',
+            contact_name='', phone_number='+1', msg_type='SMS', body='',
+            source_file='', kw_categories=['THREAT'], kw_severity='HIGH',
+            ai_categories=['THREAT'], ai_severity='HIGH',
+        )
+        write_results(db_path, [intent], [])
+        conn  = sqlite3.connect(str(db_path))
+        codes = [r[0] for r in conn.execute(
+            "SELECT severity_code FROM intent_results ORDER BY message_ts_ms"
+        )]
+        conn.close()
+        assert codes == [2, 1, 2]
+
+    def test_run_scan_upserts_contact_profiles(self, tmp_path):
+        import sqlite3
+        from run_scan import write_results
+        from sentinel.aggregators.contact_aggregator import ContactProfile
+        db_path = tmp_path / 'test.db'
+        export(db_path)
+        profile = ContactProfile(phone_number='+1', contact_name='A', risk_score=10.0)
+        write_results(db_path, [], [profile])
+        profile.risk_score = 80.0
+        write_results(db_path, [], [profile])
+        conn = sqlite3.connect(str(db_path))
+        rows = conn.execute("SELECT phone_number, risk_score FROM contact_profiles").fetchall()
+        conn.close()
+        assert rows == [('+1', 80.0)]
+
+    def test_contact_profiles_without_rowid_and_upserted(self, tmp_path):
+        import sqlite3
+        from sentinel.aggregators.contact_aggregator import ContactProfile
+        db_path = tmp_path / 'test.db'
+        profile = ContactProfile(phone_number='+1', contact_name='A', risk_score=10.0)
+        export(db_path, contact_profiles=[profile])
+        profile.risk_score, profile.risk_label = 80.0, 'CRITICAL'
+        export(db_path, contact_profiles=[profile])
+        conn = sqlite3.connect(str(db_path))
+        sql  = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'contact_profiles'"
+        ).fetchone()[0]
+        rows = conn.execute(
+            "SELECT phone_number, risk_score, risk_label FROM contact_profiles"
+        ).fetchall()
+        conn.close()
+        assert 'WITHOUT ROWID' in sql
+        assert rows == [('+1', 80.0, 'CRITICAL')]
+
+    def test_migrates_rowid_contact_profiles(self, tmp_path):
+        import sqlite3
+        db_path = tmp_path / 'old.db'
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            "CREATE TABLE contact_profiles (phone_number TEXT PRIMARY KEY, contact_name TEXT, "
+            "total_messages INTEGER, total_calls INTEGER, total_flags INTEGER, flag_rate REAL, "
+            "high_count INTEGER, medium_count INTEGER, low_count INTEGER, risk_score REAL, "
+            "risk_label TEXT, category_breakdown TEXT, first_contact_ms INTEGER, "
+            "last_contact_ms INTEGER, escalation_trend TEXT, relationship_tags TEXT, "
+            "generated_at TEXT)"
+        )
+        conn.execute("CREATE INDEX idx_contact_risk ON contact_profiles(risk_score DESC)")
+        conn.execute(
+            "INSERT INTO contact_profiles (phone_number, contact_name, risk_score) "
+            "VALUES ('+1', 'A', 5.0)"
+        )
+        conn.commit(); conn.close()
+        export(db_path)
+        conn = sqlite3.connect(str(db_path))
+        sql  = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'contact_profiles'"
+        ).fetchone()[0]
+        rows = conn.execute("SELECT phone_number, risk_score FROM contact_profiles").fetchall()
+        indexes = {r[1] for r in conn.execute("PRAGMA index_list(contact_profiles)")}
+        conn.close()
+        assert 'WITHOUT ROWID' in sql
+        assert rows == [('+1', 5.0)]
+        assert {'idx_contact_risk', 'idx_contact_risk_phone', 'idx_contact_label_risk'} <= indexes
+
+    def test_json_columns_compact_utf8(self, tmp_path):
+        import sqlite3
+        from sentinel.aggregators.contact_aggregator import ContactProfile
+        db_path = tmp_path / 'test.db'
+        profile = ContactProfile(
+            phone_number='+1', category_breakdown={'threat': 2, 'insult': 1},
+            relationship_tags=['café'],
+        )
+        export(db_path, contact_profiles=[profile])
+        conn = sqlite3.connect(str(db_path))
+        breakdown, tags = conn.execute(
+            "SELECT category_breakdown, relationship_tags FROM contact_profiles"
+        ).fetchone()
+        conn.close()
+        assert breakdown == '{"threat":2,"insult":1}'
+        assert tags == '["café"]'
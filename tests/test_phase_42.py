@@ -190,3 +190,20 @@ def test_scorer_rejects_malformed_severity_payload():
     mock_llm.analyze.side_effect = RuntimeError("network error")
     result3 = score_message(msg, mock_llm)
     assert result3.ai_severity == SEVERITY_AMBIGUOUS
+
+
+def test_scorer_concurrent_matches_sequential():
+    """concurrency > 1 scores in worker threads; results and progress stay in input order."""
+    from sentinel.scorer.ollama_scorer import score_messages
+    msgs = [_make_msg(ts_ms=1704067200000 + i, body=f"Message {i}.") for i in range(12)]
+    mock_llm = MagicMock()
+    mock_llm.model = "test"
+    mock_llm.analyze.side_effect = lambda body, **kw: MagicMock(
+        severity="HIGH" if body.endswith("3.") else "LOW", model_used="test")
+    progress = []
+    serial = score_messages(msgs, mock_llm, record_id_fn=lambda m, i: i)
+    threaded = score_messages(msgs, mock_llm, record_id_fn=lambda m, i: i,
+                              progress_cb=lambda i, n: progress.append(i), concurrency=4)
+    assert threaded == serial
+    assert [r.record_id for r in threaded] == list(range(12))
+    assert progress == list(range(1, 13))
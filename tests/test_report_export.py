@@ -98,3 +98,18 @@ class TestReportExport:
         assert "contact_risk_profiles" in d["report"]
         # Report schema has no message body field — scores and metadata only
         assert "body" not in s
+
+    def test_export_json_compact_is_hashed_canonical_text(self):
+        import hashlib
+        report = build_report(
+            [_minimal_profile()],
+            [_minimal_intent()],
+            agents_md_version="2026-02-20.1",
+        )
+        js = export_to_json(report, indent=None)
+        parsed = json.loads(js)
+        content_hash = parsed.pop("content_hash_sha256")
+        canonical = json.dumps(parsed, sort_keys=True, separators=(",", ":"))
+        assert js.startswith(canonical[:-1])
+        assert hashlib.sha256(canonical.encode("utf-8")).hexdigest() == content_hash
+        assert content_hash == export_to_dict(report)["content_hash_sha256"]
@@ -15,6 +15,7 @@ from sentinel.uplifts.extractor import (
     tag_message,
     sentiment_weight,
     extract_uplifts,
+    count_uplifts,
     _clean_body,
     _categorize,
     _display_name,
@@ -295,6 +296,22 @@ class TestExtractUplifts:
         assert len(texts) == len(set(texts))
 
 
+    def test_count_matches_extract_without_writing(self, uplifts_db, tmp_path):
+        before = set(tmp_path.iterdir())
+        assert count_uplifts(str(uplifts_db), top=500) > 0
+        assert set(tmp_path.iterdir()) == before
+        out = tmp_path / "out.json"
+        for top in (2, 500):
+            results = extract_uplifts(str(uplifts_db), str(out), top=top)
+            assert count_uplifts(str(uplifts_db), top=top) == len(results)
+
+    def test_output_path_none_returns_without_writing(self, uplifts_db, tmp_path):
+        out = tmp_path / "out.json"
+        written = extract_uplifts(str(uplifts_db), str(out))
+        before  = set(tmp_path.iterdir())
+        assert extract_uplifts(str(uplifts_db), None) == written
+        assert set(tmp_path.iterdir()) == before
+
 # ── HELPER TESTS ─────────────────────────────────────────────
 
 class TestHelpers: